@@ -0,0 +1,83 @@
+"""Tab-navigation latency across forms of increasing size.
+
+Builds a form of N `TextInput` fields, then presses Tab through it and
+reports the time per focus change (focus-out, focus-in, repaint of both
+inputs). With focus state painted rather than re-polished, latency should
+stay flat as N grows.
+
+Run:
+    python benchmarks/tab_navigation.py                # 50, 200, 800 fields
+    python benchmarks/tab_navigation.py --sizes 200 --rounds 3
+    QT_QPA_PLATFORM=offscreen python benchmarks/tab_navigation.py
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication, QScrollArea, QVBoxLayout, QWidget  # noqa: E402
+
+from bfs_component.ui.components import TextInput  # noqa: E402
+
+
+def build_form(fields: int):
+    form = QWidget()
+    layout = QVBoxLayout(form)
+    inputs = []
+    for i in range(fields):
+        field = TextInput(f"Field {i}", placeholder="value")
+        layout.addWidget(field)
+        inputs.append(field._input)
+    scroll = QScrollArea()
+    scroll.setWidget(form)
+    scroll.setWidgetResizable(True)
+    scroll.resize(480, 720)
+    return scroll, inputs
+
+
+def measure(app, fields: int, presses: int) -> list:
+    """Return per-Tab latencies in milliseconds for a form of `fields` inputs."""
+    window, inputs = build_form(fields)
+    window.show()
+    app.processEvents()
+    inputs[0].setFocus()
+    app.processEvents()
+    samples = []
+    for _ in range(presses):
+        target = QApplication.focusWidget() or inputs[0]
+        start = time.perf_counter()
+        QTest.keyClick(target, Qt.Key_Tab)
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return samples
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800], help="form sizes (fields)")
+    parser.add_argument("--presses", type=int, default=100, help="Tab presses per form")
+    parser.add_argument("--rounds", type=int, default=1, help="repeat each size this many times")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    print(f"{'fields':>8} {'median ms':>10} {'p95 ms':>8} {'max ms':>8}")
+    for fields in args.sizes:
+        samples = []
+        for _ in range(args.rounds):
+            samples.extend(measure(app, fields, args.presses))
+        samples.sort()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"{fields:>8} {statistics.median(samples):>10.3f} {p95:>8.3f} {samples[-1]:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
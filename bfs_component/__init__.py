@@ -1,5 +1,28 @@
-"""bfs_component package"""
+"""bfs_component package
 
-from .components import bfs_traverse
+Exports are resolved on first access, so importing the package (as the
+``bfs-traverse`` CLI does) stays cheap; the Qt widgets live in the separate
+`bfs_component.ui` package and are never imported from here.
+"""
+import importlib
 
-__all__ = ["bfs_traverse"]
+# public name -> submodule that defines it
+_EXPORTS = {
+    "bfs_traverse": "components",
+    "bfs_iter": "components",
+}
+
+__all__ = ["bfs_traverse", "bfs_iter"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,178 @@
+"""Approximate neighborhood function (HyperANF-style).
+
+Counting the nodes within ``k`` hops of *every* node with `bfs_traverse`
+costs one traversal per node. HyperANF instead gives each node a
+HyperLogLog counter that starts out holding only the node itself. One
+iteration merges (register-wise max) each node's counter with the counters
+of its successors, so after ``t`` iterations the counter of ``v`` estimates
+the size of the ball of radius ``t`` around ``v``.
+
+All counters live in one ``(nodes, registers)`` uint8 NumPy array, so memory
+is linear in the number of nodes: ``2**p`` bytes per node, where ``p`` is
+chosen from the requested relative standard deviation (``rsd`` ≈
+``1.04 / sqrt(2**p)``).
+
+Requires NumPy (``pip install bfs-component-library[anf]``).
+
+Example:
+    est = approximate_neighborhood(graph, max_hops=3, rsd=0.05)
+    est.reach("A", 2)          # ~number of nodes within 2 hops of A
+    est.neighborhood_function() # summed over all nodes, per hop
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+MIN_REGISTER_BITS = 4
+MAX_REGISTER_BITS = 16
+# size of the (edges, registers) temporary gathered per merge chunk; the
+# number of edges per chunk shrinks as the register count grows
+_CHUNK_BYTES = 1 << 24
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "approximate_neighborhood requires NumPy; install it with "
+            "'pip install bfs-component-library[anf]'"
+        )
+
+
+def register_bits_for(rsd: float) -> int:
+    """Return the register exponent ``p`` giving at most `rsd` relative error."""
+    if rsd <= 0:
+        raise ValueError("rsd must be positive")
+    p = math.ceil(math.log2((1.04 / rsd) ** 2))
+    return min(MAX_REGISTER_BITS, max(MIN_REGISTER_BITS, p))
+
+
+class NeighborhoodEstimate:
+    """Per-node k-hop reach estimates produced by `approximate_neighborhood`.
+
+    `estimates[t, i]` is the estimated number of nodes within ``t`` hops of
+    node ``i`` (the node itself included).
+    """
+    def __init__(self, estimates, nodes: list[object] | None, register_bits: int):
+        self.estimates = estimates
+        self.nodes = nodes
+        self.register_bits = register_bits
+        self._ids = None if nodes is None else {n: i for i, n in enumerate(nodes)}
+
+    @property
+    def max_hops(self) -> int:
+        return self.estimates.shape[0] - 1
+
+    @property
+    def relative_error(self) -> float:
+        """Expected relative standard deviation of each estimate."""
+        return 1.04 / math.sqrt(1 << self.register_bits)
+
+    def reach(self, node, hops: int = None) -> float:
+        """Estimated number of nodes within `hops` (default: max) of `node`."""
+        idx = node if self._ids is None else self._ids[node]
+        return float(self.estimates[self.max_hops if hops is None else hops, idx])
+
+    def neighborhood_function(self):
+        """Estimated number of (u, v) pairs within t hops, for each t."""
+        return self.estimates.sum(axis=1)
+
+
+def _hash64(values):
+    # splitmix64 finalizer; uint64 arithmetic wraps as intended
+    z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _bit_length(w):
+    # vectorized int.bit_length for uint64 values
+    length = np.zeros(w.shape, dtype=np.int64)
+    w = w.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = w >= (np.uint64(1) << np.uint64(shift))
+        length[big] += shift
+        w[big] >>= np.uint64(shift)
+    return length + (w > 0)
+
+
+def _edge_arrays(graph):
+    """Return ``(nodes, num_nodes, offsets, targets)`` as NumPy CSR arrays."""
+    num_nodes = getattr(graph, "num_nodes", None)
+    offsets = getattr(graph, "offsets", None)
+    if num_nodes is not None and offsets is not None:
+        # graph_io.CSRGraph: reuse its buffers without copying
+        return None, num_nodes, np.asarray(offsets, dtype=np.int64), np.asarray(graph.targets, dtype=np.int64)
+    if num_nodes is not None:
+        nodes = None
+        adjacency = [graph.get(v, ()) for v in range(num_nodes)]
+    else:
+        ids = {}
+        for node, nbs in graph.items():
+            ids.setdefault(node, len(ids))
+            for nb in nbs:
+                ids.setdefault(nb, len(ids))
+        nodes = list(ids)
+        num_nodes = len(nodes)
+        adjacency = [[ids[nb] for nb in graph.get(node, ())] for node in nodes]
+    degrees = np.fromiter((len(a) for a in adjacency), dtype=np.int64, count=num_nodes)
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    targets = np.fromiter((t for a in adjacency for t in a), dtype=np.int64, count=int(offsets[-1]))
+    return nodes, num_nodes, offsets, targets
+
+
+def _estimate(registers, register_bits: int):
+    m = 1 << register_bits
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+    inverse_powers = np.ldexp(1.0, -np.arange(65))
+    z = inverse_powers[registers].sum(axis=1)
+    est = alpha * m * m / z
+    zeros = (registers == 0).sum(axis=1)
+    small = (est <= 2.5 * m) & (zeros > 0)
+    est[small] = m * np.log(m / zeros[small])
+    return est
+
+
+def approximate_neighborhood(graph, max_hops: int, rsd: float = 0.1, seed: int = 0) -> NeighborhoodEstimate:
+    """Estimate, for every node, how many nodes lie within 0..`max_hops` hops.
+
+    graph: adjacency mapping, `graph_io.CSRGraph` or any integer graph with
+        ``num_nodes`` and ``get(node, default)``
+    max_hops: number of merge iterations (largest radius reported)
+    rsd: target relative standard deviation of each estimate
+    seed: hash seed; different seeds give independent estimates
+    """
+    _require_numpy()
+    p = register_bits_for(rsd)
+    m = 1 << p
+    nodes, n, offsets, targets = _edge_arrays(graph)
+
+    salt = np.uint64((seed * 0xD1B54A32D192ED03) & 0xFFFFFFFFFFFFFFFF)
+    h = _hash64(np.arange(n, dtype=np.uint64) ^ salt)
+    bucket = (h & np.uint64(m - 1)).astype(np.int64)
+    rest = h >> np.uint64(p)
+    rho = (64 - p) - _bit_length(rest) + 1
+    registers = np.zeros((n, m), dtype=np.uint8)
+    registers[np.arange(n), bucket] = rho
+
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    estimates = np.empty((max_hops + 1, n), dtype=np.float64)
+    estimates[0] = _estimate(registers, p)
+    chunk = max(1, _CHUNK_BYTES // m)
+    # two register buffers, swapped after every hop
+    merged = np.empty_like(registers)
+    for t in range(1, max_hops + 1):
+        np.copyto(merged, registers)
+        for lo in range(0, len(targets), chunk):
+            np.maximum.at(merged, sources[lo:lo + chunk], registers[targets[lo:lo + chunk]])
+        if np.array_equal(merged, registers):
+            # every ball has stopped growing
+            estimates[t:] = estimates[t - 1]
+            break
+        registers, merged = merged, registers
+        estimates[t] = _estimate(registers, p)
+    return NeighborhoodEstimate(estimates, nodes, p)
@@ -0,0 +1,214 @@
+"""Resumable BFS with on-disk snapshots.
+
+`bfs_traverse` keeps its state in local variables, so a killed worker has to
+start over. `ResumableBFS` holds the same state in flat arrays that can be
+written to disk at intervals and loaded again, possibly on another machine:
+
+- a visited bitmap (one bit per node),
+- the BFS queue as an int64 array; entries before ``head`` have already been
+  expanded (they are the BFS order so far), the rest is the frontier,
+- progress counters (nodes expanded, edges scanned).
+
+Nodes must be integers ``0..n-1`` (e.g. a `graph_io.CSRGraph`).
+
+Example:
+    bfs = ResumableBFS(graph, [0])
+    order = bfs.run("job.ckpt", every_nodes=1_000_000)
+    # after a crash:
+    order = ResumableBFS.load("job.ckpt", graph).run("job.ckpt")
+"""
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Iterable
+
+SNAPSHOT_MAGIC = b"BFSR"
+SNAPSHOT_VERSION = 1
+_FLAG_KEEP_ORDER = 1
+# magic, version, flags, nodes, edges, head, queue length, expanded, scanned
+_HEADER = struct.Struct("<4sHHQQQQQQ")
+
+
+def _graph_size(graph, num_nodes: int | None):
+    if num_nodes is None:
+        num_nodes = getattr(graph, "num_nodes", None)
+    if num_nodes is None:
+        num_nodes = len(graph)
+    return num_nodes, getattr(graph, "num_edges", 0)
+
+
+class ResumableBFS:
+    """A BFS whose frontier, visited set and counters can be snapshotted.
+
+    Parameters
+    - graph: integer-node graph with a ``get(node, default)`` method
+    - sources: start node(s)
+    - num_nodes: node count; defaults to ``graph.num_nodes`` or ``len(graph)``
+    - keep_order: keep expanded nodes so `order` returns the full BFS order.
+      Disable for very long jobs that stream results elsewhere; snapshots then
+      only store the frontier.
+    """
+    def __init__(self, graph, sources: Iterable[int] = (), num_nodes: int = None, keep_order: bool = True):
+        self._graph = graph
+        self.num_nodes, self._num_edges = _graph_size(graph, num_nodes)
+        self.keep_order = keep_order
+        self._visited = bytearray((self.num_nodes + 7) // 8)
+        self._queue = array("q")
+        self._head = 0
+        self.nodes_expanded = 0
+        self.edges_scanned = 0
+        for s in ([sources] if isinstance(sources, int) else sources):
+            if not self.is_visited(s):
+                self._mark(s)
+                self._queue.append(s)
+
+    def _mark(self, node: int):
+        if not 0 <= node < self.num_nodes:
+            raise IndexError(f"node {node} outside 0..{self.num_nodes - 1}")
+        self._visited[node >> 3] |= 1 << (node & 7)
+
+    def is_visited(self, node: int) -> bool:
+        return 0 <= node < self.num_nodes and bool(self._visited[node >> 3] & (1 << (node & 7)))
+
+    @property
+    def done(self) -> bool:
+        return self._head >= len(self._queue)
+
+    @property
+    def frontier(self) -> list[int]:
+        """Nodes discovered but not yet expanded, in queue order."""
+        return self._queue[self._head:].tolist()
+
+    @property
+    def order(self) -> list[int]:
+        """Nodes expanded so far, in BFS order (requires `keep_order`)."""
+        if not self.keep_order:
+            raise RuntimeError("BFS order is not kept (keep_order=False)")
+        return self._queue[:self._head].tolist()
+
+    def step(self, max_nodes: int = None) -> int:
+        """Expand up to `max_nodes` queued nodes (all if None).
+
+        Returns the number of nodes expanded.
+        """
+        graph = self._graph
+        visited = self._visited
+        queue = self._queue
+        n = self.num_nodes
+        head = self._head
+        expanded = 0
+        scanned = 0
+        while head < len(queue):
+            if max_nodes is not None and expanded >= max_nodes:
+                break
+            node = queue[head]
+            head += 1
+            expanded += 1
+            for nb in graph.get(node, ()):
+                scanned += 1
+                if not 0 <= nb < n:
+                    raise IndexError(f"node {nb} outside 0..{n - 1}")
+                byte, bit = nb >> 3, 1 << (nb & 7)
+                if not visited[byte] & bit:
+                    visited[byte] |= bit
+                    queue.append(nb)
+        self._head = head
+        self.nodes_expanded += expanded
+        self.edges_scanned += scanned
+        return expanded
+
+    def _compact(self):
+        # drop expanded nodes when the order is not needed
+        if not self.keep_order and self._head:
+            del self._queue[:self._head]
+            self._head = 0
+
+    def run(self, checkpoint_path=None, every_nodes: int = 100_000, every_seconds: float = None) -> list[int] | None:
+        """Run to completion, snapshotting to `checkpoint_path` at intervals.
+
+        A snapshot is written after every `every_nodes` expanded nodes, or
+        sooner if `every_seconds` have passed since the last one, and once
+        more when the traversal finishes. Returns `order` if it is kept.
+        """
+        last_save = time.monotonic()
+        every_nodes = max(1, every_nodes)
+        # with a time interval, work in smaller chunks so the clock is checked
+        chunk = every_nodes if every_seconds is None else min(every_nodes, 10_000)
+        since_save = 0
+        while not self.done:
+            since_save += self.step(chunk)
+            if checkpoint_path is None:
+                continue
+            due_time = every_seconds is not None and time.monotonic() - last_save >= every_seconds
+            if since_save >= every_nodes or due_time or self.done:
+                self.save(checkpoint_path)
+                last_save = time.monotonic()
+                since_save = 0
+        return self.order if self.keep_order else None
+
+    def save(self, path) -> None:
+        """Atomically write a snapshot of the traversal state to `path`."""
+        self._compact()
+        queue = self._queue
+        if sys.byteorder != "little":
+            queue = array("q", queue)
+            queue.byteswap()
+        flags = _FLAG_KEEP_ORDER if self.keep_order else 0
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, self.num_nodes, self._num_edges,
+                self._head, len(self._queue), self.nodes_expanded, self.edges_scanned,
+            ))
+            fh.write(self._visited)
+            queue.tofile(fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, graph, num_nodes: int = None) -> "ResumableBFS":
+        """Restore a traversal saved with `save` for the same `graph`."""
+        with open(path, "rb") as fh:
+            header = fh.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError(f"{path}: truncated snapshot header")
+            magic, version, flags, nodes, edges, head, qlen, expanded, scanned = _HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path}: not a BFS snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"{path}: unsupported snapshot version {version}")
+            bfs = cls(graph, (), num_nodes=num_nodes, keep_order=bool(flags & _FLAG_KEEP_ORDER))
+            if (bfs.num_nodes, bfs._num_edges) != (nodes, edges):
+                raise ValueError(
+                    f"{path}: snapshot is for a graph with {nodes} nodes/{edges} edges, "
+                    f"got {bfs.num_nodes}/{bfs._num_edges}"
+                )
+            visited = fh.read(len(bfs._visited))
+            if len(visited) != len(bfs._visited):
+                raise ValueError(f"{path}: truncated visited bitmap")
+            bfs._visited[:] = visited
+            if head > qlen or qlen > nodes or (head and not bfs.keep_order):
+                raise ValueError(f"{path}: inconsistent snapshot header (head {head}, queue length {qlen})")
+            try:
+                bfs._queue.fromfile(fh, qlen)
+            except EOFError:
+                raise ValueError(f"{path}: truncated queue") from None
+            if fh.read(1):
+                raise ValueError(f"{path}: unexpected data after the queue")
+        if sys.byteorder != "little":
+            bfs._queue.byteswap()
+        queue = bfs._queue
+        if queue and not (0 <= min(queue) and max(queue) < nodes):
+            raise ValueError(f"{path}: queue holds nodes outside 0..{nodes - 1}")
+        # every queued node is visited; with the full order kept, every
+        # visited node is queued
+        marked = int.from_bytes(bfs._visited, "little").bit_count()
+        if marked < qlen or (bfs.keep_order and marked != qlen):
+            raise ValueError(f"{path}: visited bitmap does not match the queue")
+        bfs._head = head
+        bfs.nodes_expanded = expanded
+        bfs.edges_scanned = scanned
+        return bfs
@@ -1,16 +1,16 @@
 """Simple BFS traversal helper"""
 from collections import deque
-from typing import Dict, List, Set
+from collections.abc import Iterable, Iterator
 
 
-def bfs_traverse(graph: Dict[object, List[object]], start) -> List[object]:
+def bfs_traverse(graph: dict[object, list[object]], start) -> list[object]:
     """Return nodes in BFS order starting from start.
 
     graph: adjacency-list mapping
     start: starting node
     """
-    visited: Set[object] = set()
-    order: List[object] = []
+    visited: set[object] = set()
+    order: list[object] = []
     q = deque([start])
     visited.add(start)
     while q:
@@ -21,3 +21,29 @@ def bfs_traverse(graph: Dict[object, List[object]], start) -> List[object]:
                 visited.add(nb)
                 q.append(nb)
     return order
+
+
+def bfs_iter(graph: dict[object, list[object]], sources: Iterable[object]) -> Iterator[tuple[object, int, object]]:
+    """Yield (node, distance, parent) tuples in BFS order.
+
+    Unlike `bfs_traverse` this is a generator, so callers can stream results
+    while the traversal is still running. All sources start at distance 0
+    with parent None; a node reachable from several sources is reported once,
+    at its distance from the nearest one.
+
+    graph: adjacency-list mapping (anything with a `get(node, default)`)
+    sources: iterable of starting nodes
+    """
+    visited: set[object] = set()
+    q = deque()
+    for s in sources:
+        if s not in visited:
+            visited.add(s)
+            q.append((s, 0, None))
+    while q:
+        node, dist, parent = q.popleft()
+        yield node, dist, parent
+        for nb in graph.get(node, []):
+            if nb not in visited:
+                visited.add(nb)
+                q.append((nb, dist + 1, node))
@@ -0,0 +1,230 @@
+"""Compressed adjacency storage for large integer-node graphs.
+
+Each node's neighbor list is sorted, de-duplicated and gap-encoded as
+LEB128-style varints (7 bits per byte, high bit = "more bytes follow"):
+
+    varint(degree)
+    varint(payload length in bytes)    # only if degree > 0; lets seeks skip
+    varint(zigzag(first - node))       # neighbors tend to sit near the node
+    varint(next - previous - 1) ...    # remaining gaps
+
+Records are laid out back to back in one ``bytearray``. Every
+``block_size`` nodes the byte offset of the block start is kept in an index,
+so `neighbors(v)` seeks to ``v``'s block and skips at most
+``block_size - 1`` records instead of decoding the whole graph.
+
+Trade-off: on graphs with good locality (web/social graphs numbered in
+crawl or BFS order) the encoding needs roughly 1.5 bytes per edge against
+5 for `graph_io.CSRGraph` and 50+ for a dict of lists. Every neighbor
+access pays for varint decoding in Python, so a BFS over a
+`CompressedGraph` runs roughly 3-8x slower than over a CSR graph; larger
+``block_size`` values shrink the index but make random access slower.
+Use it when the graph would not fit in memory otherwise. See
+``docs/graph_storage.md`` for measured numbers.
+"""
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
+DEFAULT_BLOCK_SIZE = 16
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _put_varint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _get_varint(data, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+class CompressedGraph:
+    """Gap/varint-encoded adjacency with block-level random access.
+
+    Nodes are integers ``0..n-1``. `get(node, default)` mirrors ``dict.get``
+    so the graph works with `bfs_traverse`, `bfs_iter` and `ResumableBFS`
+    unchanged; neighbors come back in ascending order.
+
+    With `cache_blocks` > 0, `get` decodes a whole block at a time and keeps
+    the last `cache_blocks` decoded blocks. That pays off only when BFS
+    expands nodes with nearby ids together (strong locality); on graphs with
+    many long-range edges the cache thrashes and is slower than decoding
+    single records, so it is off by default.
+    """
+    def __init__(self, data: bytes, block_offsets: array, num_nodes: int, num_edges: int, block_size: int, cache_blocks: int = 0):
+        self._data = data
+        self._block_offsets = block_offsets
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self._block_cache = OrderedDict()
+
+    @classmethod
+    def from_adjacency(cls, graph: dict[int, Iterable[int]], num_nodes: int = None, block_size: int = DEFAULT_BLOCK_SIZE, cache_blocks: int = 0) -> "CompressedGraph":
+        """Encode any integer graph with a ``get(node, default)`` method.
+
+        `graph` may be a dict of lists or a `graph_io.CSRGraph`.
+        """
+        if num_nodes is None:
+            num_nodes = getattr(graph, "num_nodes", None)
+        if num_nodes is None:
+            num_nodes = 1 + max((max([k, *nbs]) for k, nbs in graph.items()), default=-1)
+        data = bytearray()
+        block_offsets = array("Q")
+        num_edges = 0
+        for v in range(num_nodes):
+            if v % block_size == 0:
+                block_offsets.append(len(data))
+            nbs = sorted(set(graph.get(v, ())))
+            _put_varint(data, len(nbs))
+            if not nbs:
+                continue
+            if nbs[0] < 0 or nbs[-1] >= num_nodes:
+                raise ValueError(f"node {v} has a neighbor outside 0..{num_nodes - 1}")
+            payload = bytearray()
+            _put_varint(payload, _zigzag(nbs[0] - v))
+            prev = nbs[0]
+            for nb in nbs[1:]:
+                _put_varint(payload, nb - prev - 1)
+                prev = nb
+            _put_varint(data, len(payload))
+            data += payload
+            num_edges += len(nbs)
+        return cls(bytes(data), block_offsets, num_nodes, num_edges, block_size, cache_blocks)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[int, int]], num_nodes: int = None, undirected: bool = False, block_size: int = DEFAULT_BLOCK_SIZE, cache_blocks: int = 0) -> "CompressedGraph":
+        from .graph_io import CSRGraph
+
+        csr = CSRGraph.from_edges(edges, num_nodes, undirected)
+        return cls.from_adjacency(csr, block_size=block_size, cache_blocks=cache_blocks)
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __contains__(self, node):
+        return isinstance(node, int) and 0 <= node < self.num_nodes
+
+    def _seek(self, node: int) -> int:
+        # jump to the block start, then skip whole records up to `node`
+        data = self._data
+        pos = self._block_offsets[node // self.block_size]
+        for _ in range(node % self.block_size):
+            degree, pos = _get_varint(data, pos)
+            if degree:
+                length, pos = _get_varint(data, pos)
+                pos += length
+        return pos
+
+    def _decode(self, node: int, pos: int) -> Iterator[int]:
+        data = self._data
+        degree, pos = _get_varint(data, pos)
+        if not degree:
+            return
+        _, pos = _get_varint(data, pos)
+        delta, pos = _get_varint(data, pos)
+        cur = node + _unzigzag(delta)
+        yield cur
+        for _ in range(degree - 1):
+            gap, pos = _get_varint(data, pos)
+            cur += gap + 1
+            yield cur
+
+    def neighbors(self, node: int) -> Iterator[int]:
+        """Iterate the neighbors of `node` without decoding other records."""
+        if node not in self:
+            raise KeyError(node)
+        return self._decode(node, self._seek(node))
+
+    def degree(self, node: int) -> int:
+        if node not in self:
+            raise KeyError(node)
+        return _get_varint(self._data, self._seek(node))[0]
+
+    def _decode_block(self, block: int) -> list[tuple[int, ...]]:
+        data = self._data
+        pos = self._block_offsets[block]
+        first = block * self.block_size
+        rows = []
+        for v in range(first, min(first + self.block_size, self.num_nodes)):
+            degree, pos = _get_varint(data, pos)
+            if not degree:
+                rows.append(())
+                continue
+            _, pos = _get_varint(data, pos)
+            delta, pos = _get_varint(data, pos)
+            cur = v + _unzigzag(delta)
+            nbs = [cur]
+            for _ in range(degree - 1):
+                b = data[pos]
+                if b < 0x80:
+                    # single-byte gap, by far the common case
+                    pos += 1
+                    cur += b + 1
+                else:
+                    gap, pos = _get_varint(data, pos)
+                    cur += gap + 1
+                nbs.append(cur)
+            rows.append(tuple(nbs))
+        return rows
+
+    def get(self, node, default=None):
+        if node not in self:
+            return default
+        if not self.cache_blocks:
+            return tuple(self._decode(node, self._seek(node)))
+        block, idx = divmod(node, self.block_size)
+        cache = self._block_cache
+        rows = cache.get(block)
+        if rows is None:
+            rows = self._decode_block(block)
+            cache[block] = rows
+            if len(cache) > self.cache_blocks:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(block)
+        return rows[idx]
+
+    def iter_adjacency(self) -> Iterator[tuple[int, list[int]]]:
+        """Decode all records sequentially, yielding ``(node, neighbors)``."""
+        data = self._data
+        pos = 0
+        for v in range(self.num_nodes):
+            degree, pos = _get_varint(data, pos)
+            nbs = []
+            if degree:
+                _, pos = _get_varint(data, pos)
+                delta, pos = _get_varint(data, pos)
+                cur = v + _unzigzag(delta)
+                nbs.append(cur)
+                for _ in range(degree - 1):
+                    gap, pos = _get_varint(data, pos)
+                    cur += gap + 1
+                    nbs.append(cur)
+            yield v, nbs
+
+    def nbytes(self) -> int:
+        """Bytes used by the encoded records plus the block index."""
+        return len(self._data) + self._block_offsets.itemsize * len(self._block_offsets)
+
+    def bits_per_edge(self) -> float:
+        return 8.0 * self.nbytes() / self.num_edges if self.num_edges else 0.0
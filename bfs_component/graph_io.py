@@ -0,0 +1,178 @@
+"""Graph loaders for the BFS helpers.
+
+Two on-disk formats are supported:
+
+- edge lists: one ``source target`` pair per line (whitespace or comma
+  separated, ``#`` starts a comment). Loaded into the plain adjacency-list
+  mapping that `bfs_traverse` expects.
+- binary graphs: a compact CSR (compressed sparse row) file holding integer
+  node ids ``0..n-1``. Loaded into a `CSRGraph`, which keeps the adjacency
+  in two flat arrays instead of one Python list per node.
+"""
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+
+BINARY_MAGIC = b"BFSG"
+BINARY_VERSION = 1
+# magic, version, bytes per target id, node count, edge count
+_HEADER = struct.Struct("<4sHHQQ")
+# target width in bytes -> array typecode
+_TARGET_TYPECODES = {4: "I", 8: "Q"}
+
+
+class CSRGraph:
+    """Adjacency stored as CSR arrays over integer node ids ``0..n-1``.
+
+    The neighbors of node ``v`` are ``targets[offsets[v]:offsets[v + 1]]``.
+    `get(node, default)` mirrors ``dict.get`` so a `CSRGraph` can be passed
+    straight to `bfs_traverse` and `bfs_iter`.
+    """
+    def __init__(self, offsets: array, targets: array):
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets do not describe the targets array")
+        self.offsets = offsets
+        self.targets = targets
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __contains__(self, node):
+        return isinstance(node, int) and 0 <= node < self.num_nodes
+
+    def get(self, node, default=None):
+        if node not in self:
+            return default
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def neighbors(self, node: int):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[int, int]], num_nodes: int = None, undirected: bool = False) -> "CSRGraph":
+        """Build a CSR graph from integer ``(source, target)`` pairs.
+
+        Neighbor order follows the input order, like appending to lists.
+        """
+        src = array("q")
+        dst = array("q")
+        for u, v in edges:
+            src.append(u)
+            dst.append(v)
+            if undirected and u != v:
+                src.append(v)
+                dst.append(u)
+        if num_nodes is None:
+            num_nodes = max(max(src, default=-1), max(dst, default=-1)) + 1
+        counts = array("Q", bytes(8 * (num_nodes + 1)))
+        for u in src:
+            counts[u + 1] += 1
+        for i in range(num_nodes):
+            counts[i + 1] += counts[i]
+        offsets = array("Q", counts)
+        typecode = "I" if num_nodes <= 0xFFFFFFFF else "Q"
+        targets = array(typecode, bytes(array(typecode).itemsize * len(dst)))
+        fill = array("Q", counts[:-1])
+        for u, v in zip(src, dst):
+            targets[fill[u]] = v
+            fill[u] += 1
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_adjacency(cls, graph: dict[int, list[int]], num_nodes: int = None) -> "CSRGraph":
+        """Convert an integer-keyed adjacency mapping to CSR form."""
+        if num_nodes is None:
+            num_nodes = 1 + max(
+                (max([k, *nbs]) for k, nbs in graph.items()), default=-1
+            )
+        return cls.from_edges(
+            ((u, v) for u in range(num_nodes) for v in graph.get(u, [])),
+            num_nodes=num_nodes,
+        )
+
+
+def _split_edge_line(line: str):
+    line = line.split("#", 1)[0].strip()
+    if not line:
+        return None
+    parts = line.replace(",", " ").split()
+    if len(parts) < 2:
+        raise ValueError(f"malformed edge line: {line!r}")
+    return parts[0], parts[1]
+
+
+def load_edge_list(path, undirected: bool = False, int_nodes: bool = False) -> dict[object, list[object]]:
+    """Read an edge-list file into an adjacency-list mapping.
+
+    Node labels are kept as strings unless `int_nodes` is set.
+    """
+    graph: dict[object, list[object]] = {}
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            pair = _split_edge_line(line)
+            if pair is None:
+                continue
+            u, v = (int(pair[0]), int(pair[1])) if int_nodes else pair
+            graph.setdefault(u, []).append(v)
+            if undirected:
+                graph.setdefault(v, []).append(u)
+            else:
+                graph.setdefault(v, [])
+    return graph
+
+
+def save_binary(graph: CSRGraph, path) -> None:
+    """Write `graph` in the binary CSR format read by `load_binary`."""
+    offsets = array("Q", graph.offsets)
+    targets = graph.targets
+    if sys.byteorder != "little":
+        offsets = array(offsets.typecode, offsets)
+        targets = array(targets.typecode, targets)
+        offsets.byteswap()
+        targets.byteswap()
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, targets.itemsize, graph.num_nodes, graph.num_edges))
+        offsets.tofile(fh)
+        targets.tofile(fh)
+
+
+def load_binary(path) -> CSRGraph:
+    """Read a graph written by `save_binary`."""
+    with open(path, "rb") as fh:
+        header = fh.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, width, num_nodes, num_edges = _HEADER.unpack(header)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"{path}: not a binary BFS graph")
+        if version != BINARY_VERSION:
+            raise ValueError(f"{path}: unsupported binary graph version {version}")
+        typecode = _TARGET_TYPECODES.get(width)
+        if typecode is None:
+            raise ValueError(f"{path}: unsupported target width {width}")
+        offsets = array("Q")
+        targets = array(typecode)
+        try:
+            offsets.fromfile(fh, num_nodes + 1)
+            targets.fromfile(fh, num_edges)
+        except EOFError:
+            raise ValueError(f"{path}: truncated graph data") from None
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        targets.byteswap()
+    return CSRGraph(offsets, targets)
+
+
+def is_binary_graph(path) -> bool:
+    """Return True if `path` starts with the binary graph magic bytes."""
+    with open(path, "rb") as fh:
+        return fh.read(len(BINARY_MAGIC)) == BINARY_MAGIC
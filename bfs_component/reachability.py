@@ -0,0 +1,270 @@
+"""Precomputed reachability (and hop-distance) index.
+
+Checking "does B appear in the BFS order from A" with `bfs_traverse` costs a
+full traversal per query. `ReachabilityIndex` pays once at build time and
+then answers queries by intersecting two small label sets.
+
+Build steps:
+
+1. Strongly connected components (iterative Tarjan). Nodes in the same SCC
+   reach each other, so queries within a component are answered directly.
+2. Pruned landmark labeling (2-hop labels). Vertices are processed from
+   most to least connected; each runs a forward and a backward BFS that
+   stops wherever the labels built so far already answer the query. ``a``
+   reaches ``b`` iff ``out_label[a]`` and ``in_label[b]`` share a hub.
+
+Reachability-only indexes are built on the SCC condensation (a DAG), which
+keeps labels small. With ``with_distances=True`` the labels are built on the
+original graph and store hop counts, so `distance` returns exact BFS
+distances. Distance labels stay small on graphs with hubs (social, web,
+road-like hierarchies) but can grow to hundreds of entries per node on
+uniformly random graphs; check `report()` after building.
+
+Example:
+    index = ReachabilityIndex(graph)
+    index.reachable("A", "E")
+    print(index.report())
+"""
+import sys
+import time
+
+
+class ReachabilityIndex:
+    """Answer "can A reach B" (and optionally "in how many hops") queries.
+
+    Parameters
+    - graph: adjacency mapping, `graph_io.CSRGraph` or `compressed.CompressedGraph`
+    - with_distances: build distance labels so `distance` is available
+    """
+    def __init__(self, graph, with_distances: bool = False):
+        self.with_distances = with_distances
+        self.rebuild(graph)
+
+    # -- build -------------------------------------------------------------
+    def rebuild(self, graph=None) -> "ReachabilityIndex":
+        """(Re)build the index, for `graph` or the graph it was built from."""
+        if graph is not None:
+            self._graph = graph
+        t0 = time.perf_counter()
+        self._index_nodes()
+        self._component = _strongly_connected_components(self._adj)
+        if self.with_distances:
+            self._out_labels, self._in_labels = _pruned_labels(self._adj, with_distances=True)
+        else:
+            dag = _condense(self._adj, self._component)
+            self._out_labels, self._in_labels = _pruned_labels(dag, with_distances=False)
+        # the int adjacency is only needed while building
+        self._adj = None
+        self.build_seconds = time.perf_counter() - t0
+        return self
+
+    def _index_nodes(self):
+        graph = self._graph
+        num_nodes = getattr(graph, "num_nodes", None)
+        if num_nodes is not None:
+            # integer graphs (CSR / compressed) are used as-is
+            self._ids = None
+            self._adj = [list(graph.get(v, ())) for v in range(num_nodes)]
+            return
+        ids: dict[object, int] = {}
+        for node, nbs in graph.items():
+            ids.setdefault(node, len(ids))
+            for nb in nbs:
+                ids.setdefault(nb, len(ids))
+        adj: list[list[int]] = [[] for _ in range(len(ids))]
+        for node, nbs in graph.items():
+            adj[ids[node]] = [ids[nb] for nb in nbs]
+        self._ids = ids
+        self._adj = adj
+
+    # -- queries -----------------------------------------------------------
+    def _id(self, node) -> int | None:
+        if self._ids is None:
+            return node if isinstance(node, int) and 0 <= node < len(self._component) else None
+        return self._ids.get(node)
+
+    def __contains__(self, node):
+        return self._id(node) is not None
+
+    def reachable(self, source, target) -> bool:
+        """Return True if `target` is in the BFS order from `source`.
+
+        Unknown nodes only reach themselves, matching `bfs_traverse`.
+        """
+        a, b = self._id(source), self._id(target)
+        if a is None or b is None:
+            return source == target
+        ca, cb = self._component[a], self._component[b]
+        if ca == cb:
+            return True
+        if self.with_distances:
+            return _min_hop(self._out_labels[a], self._in_labels[b]) is not None
+        return not self._out_labels[ca].isdisjoint(self._in_labels[cb])
+
+    def distance(self, source, target) -> int | None:
+        """Return the BFS hop distance, or None if `target` is unreachable."""
+        if not self.with_distances:
+            raise RuntimeError("index was built without distances (with_distances=False)")
+        a, b = self._id(source), self._id(target)
+        if a is None or b is None:
+            return 0 if source == target else None
+        if a == b:
+            return 0
+        return _min_hop(self._out_labels[a], self._in_labels[b])
+
+    # -- reporting ---------------------------------------------------------
+    def stats(self) -> dict:
+        """Return build time, sizes and an approximate memory footprint."""
+        labels = self._out_labels + self._in_labels
+        entries = sum(len(lbl) for lbl in labels)
+        label_bytes = sum(sys.getsizeof(lbl) for lbl in labels)
+        if self.with_distances:
+            # small ints are cached; count one pointer per stored distance
+            label_bytes += 8 * entries
+        component_bytes = sys.getsizeof(self._component)
+        id_bytes = sys.getsizeof(self._ids) if self._ids is not None else 0
+        return {
+            "nodes": len(self._component),
+            "components": len(set(self._component)),
+            "label_entries": entries,
+            "avg_label_size": entries / max(1, len(self._out_labels)),
+            "memory_bytes": label_bytes + component_bytes + id_bytes,
+            "build_seconds": self.build_seconds,
+            "with_distances": self.with_distances,
+        }
+
+    def report(self) -> str:
+        s = self.stats()
+        return (
+            f"ReachabilityIndex: {s['nodes']} nodes, {s['components']} SCCs, "
+            f"{s['label_entries']} label entries (avg {s['avg_label_size']:.1f}), "
+            f"~{s['memory_bytes'] / 1024:.1f} KiB, built in {s['build_seconds'] * 1000:.1f} ms"
+            + (" with distances" if s["with_distances"] else "")
+        )
+
+
+def _min_hop(out_label: dict, in_label: dict) -> int | None:
+    if len(out_label) > len(in_label):
+        out_label, in_label = in_label, out_label
+    best = None
+    for hub, d in out_label.items():
+        other = in_label.get(hub)
+        if other is not None and (best is None or d + other < best):
+            best = d + other
+    return best
+
+
+def _strongly_connected_components(adj: list[list[int]]) -> list[int]:
+    """Iterative Tarjan; returns a component id per node."""
+    n = len(adj)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    component = [-1] * n
+    stack: list[int] = []
+    counter = 0
+    comp_count = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            v, i = work[-1]
+            nbs = adj[v]
+            if i < len(nbs):
+                work[-1] = (v, i + 1)
+                w = nbs[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component[w] = comp_count
+                    if w == v:
+                        break
+                comp_count += 1
+    return component
+
+
+def _condense(adj: list[list[int]], component: list[int]) -> list[list[int]]:
+    count = max(component, default=-1) + 1
+    dag = [set() for _ in range(count)]
+    for v, nbs in enumerate(adj):
+        cv = component[v]
+        for w in nbs:
+            cw = component[w]
+            if cv != cw:
+                dag[cv].add(cw)
+    return [list(s) for s in dag]
+
+
+def _pruned_labels(adj: list[list[int]], with_distances: bool):
+    """Pruned landmark labeling over an int adjacency list.
+
+    Returns ``(out_labels, in_labels)``: frozensets of hub ranks for plain
+    reachability, or ``{hub_rank: hops}`` dicts when `with_distances`.
+    """
+    n = len(adj)
+    radj: list[list[int]] = [[] for _ in range(n)]
+    for v, nbs in enumerate(adj):
+        for w in nbs:
+            radj[w].append(v)
+    order = sorted(range(n), key=lambda v: (len(adj[v]) + 1) * (len(radj[v]) + 1), reverse=True)
+    out_labels = [{} for _ in range(n)]
+    in_labels = [{} for _ in range(n)]
+
+    for rank, root in enumerate(order):
+        # forward BFS: root becomes a hub on the way *into* every node it reaches
+        _pruned_bfs(root, rank, adj, out_labels, in_labels, True, with_distances)
+        # backward BFS: root becomes a hub on the way *out of* nodes reaching it
+        _pruned_bfs(root, rank, radj, out_labels, in_labels, False, with_distances)
+
+    if with_distances:
+        return out_labels, in_labels
+    return [frozenset(lbl) for lbl in out_labels], [frozenset(lbl) for lbl in in_labels]
+
+
+def _pruned_bfs(root, rank, adj, out_labels, in_labels, forward, with_distances):
+    # skip (and do not expand) nodes the existing labels already cover; for
+    # plain reachability any covering hub will do, for distances it must be
+    # at least as short as this BFS level
+    if forward:
+        root_label, targets = out_labels[root], in_labels
+    else:
+        root_label, targets = in_labels[root], out_labels
+    frontier = [root]
+    seen = {root}
+    dist = 0
+    while frontier:
+        nxt = []
+        for u in frontier:
+            if forward:
+                known = _min_hop(root_label, in_labels[u])
+            else:
+                known = _min_hop(out_labels[u], root_label)
+            if known is not None and (not with_distances or known <= dist):
+                continue
+            targets[u][rank] = dist
+            for w in adj[u]:
+                if w not in seen:
+                    seen.add(w)
+                    nxt.append(w)
+        frontier = nxt
+        dist += 1
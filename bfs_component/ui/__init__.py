@@ -0,0 +1,48 @@
+"""PySide6 widgets for the BFS Component Library.
+
+Widgets are loaded on first access, so ``from bfs_component.ui import
+TextInput`` only imports the input module and the Qt classes it needs, not
+every widget in the library.
+"""
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    "Card": "cards",
+    "CardPool": "cards",
+    "CompanyCard": "cards",
+    "ContactCard": "cards",
+    "HeaderWidget": "cards",
+    "MainFrame": "cards",
+    "CardListView": "card_list",
+    "ContactCardDelegate": "card_list",
+    "ContactListModel": "card_list",
+    "StyledLineEdit": "inputs",
+    "TextInput": "inputs",
+    "RadioGroup": "radio",
+    "StyledRadioButton": "radio",
+    "SearchableSelect": "select",
+    "StyledComboBox": "select",
+    "MainWindow": "main_window",
+    "TitleBar": "main_window",
+    "StatusChannel": "status",
+    "TaskHandle": "tasks",
+    "TaskRunner": "tasks",
+    "ThemeManager": "theme",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
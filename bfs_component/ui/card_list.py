@@ -0,0 +1,247 @@
+"""Virtualized contact lists: `CardListView` paints contact cards from a model.
+
+A `ContactCard` is a widget tree (a frame, layouts and one label per line),
+so a directory of 10k contacts built from cards is some 70k widgets.
+`CardListView` is a `QListView` over a `ContactListModel` instead; its
+`ContactCardDelegate` paints the `ContactCard` visuals straight from the
+row data, so no per-contact widgets exist and only rows in view are painted.
+
+Example:
+    view = CardListView(contacts)              # list, one card per row
+    grid = CardListView(contacts, grid=True)   # cards wrap into columns
+    view.contact_activated.connect(open_contact)
+"""
+import weakref
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QFont, QFontMetrics, QPainter, QPalette, QPen
+from PySide6.QtWidgets import QApplication, QListView, QStyle, QStyledItemDelegate
+
+from bfs_component.ui.cards import normalize_contact
+from bfs_component.ui.theme import add_cache_invalidator, current_theme, token_brush, token_color, widget_tokens
+
+DEFAULT_CARD_WIDTH = 280
+
+_card_style = None
+_views = weakref.WeakSet()
+
+
+def _style() -> dict:
+    """Return the brushes and colors of the card roles, resolved once per theme."""
+    global _card_style
+    if _card_style is None:
+        tokens = widget_tokens(current_theme())
+        _card_style = {
+            "card": token_brush(tokens["card_bg"]),
+            "avatar": token_brush(tokens["avatar"]),
+            "on_accent": token_color(tokens["on_accent"]),
+            "text": token_color(tokens["label_text"]),
+            "muted": token_color(tokens["muted"]),
+        }
+    return _card_style
+
+
+def clear_card_style_cache():
+    """Drop the resolved card tokens and repaint every `CardListView`."""
+    global _card_style
+    _card_style = None
+    for view in list(_views):
+        view.viewport().update()
+
+
+# ThemeManager.set_theme re-resolves the tokens along with the stylesheet
+add_cache_invalidator(clear_card_style_cache)
+
+
+class ContactListModel(QAbstractListModel):
+    """A flat list model of contacts (see `cards.normalize_contact`).
+
+    - `Qt.DisplayRole` returns the name, `Qt.UserRole` the contact dict
+    """
+    def __init__(self, contacts=None, parent=None):
+        super().__init__(parent)
+        self._contacts = [normalize_contact(c) for c in contacts or ()]
+
+    def contacts(self) -> list:
+        return self._contacts
+
+    def set_contacts(self, contacts):
+        self.beginResetModel()
+        self._contacts = [normalize_contact(c) for c in contacts or ()]
+        self.endResetModel()
+
+    def contact(self, row: int) -> dict:
+        return self._contacts[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._contacts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        contact = self._contacts[index.row()]
+        if role == Qt.DisplayRole:
+            return contact["name"]
+        if role == Qt.UserRole:
+            return contact
+        return None
+
+
+class ContactCardDelegate(QStyledItemDelegate):
+    """Paints a `ContactCard` (avatar, name, role, email, phone) for a row.
+
+    Geometry follows the card widget's layouts: an 8px frame margin, the
+    style's layout margins and spacing, a 48x48 avatar and one line per
+    field. Every row gets the size of a card with all five fields, so the
+    view can use uniform item sizes.
+    """
+    CARD_MARGIN = 8
+    CARD_RADIUS = 8.0
+    AVATAR_SIZE = 48
+    AVATAR_RADIUS = 12.0
+
+    def __init__(self, parent=None, card_width: int = DEFAULT_CARD_WIDTH):
+        super().__init__(parent)
+        self.card_width = card_width
+        self._name_font = QFont("Segoe UI", 10, QFont.Bold)
+
+    def _layout(self, font: QFont):
+        style = QApplication.style()
+        margin = self.CARD_MARGIN + style.pixelMetric(QStyle.PM_LayoutLeftMargin)
+        spacing = style.pixelMetric(QStyle.PM_LayoutHorizontalSpacing)
+        name_h = QFontMetrics(self._name_font).height()
+        line_h = QFontMetrics(font).height()
+        block_h = name_h + 3 * (line_h + spacing)
+        return margin, spacing, name_h, line_h, max(self.AVATAR_SIZE, block_h)
+
+    def sizeHint(self, option, index):
+        margin, spacing, _, _, content_h = self._layout(option.font)
+        return QSize(self.card_width, 2 * margin + content_h)
+
+    def paint(self, painter, option, index):
+        contact = index.data(Qt.UserRole)
+        if contact is None:
+            return
+        style = _style()
+        margin, spacing, name_h, line_h, content_h = self._layout(option.font)
+        rect = option.rect
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # card background
+        card = QRectF(rect)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(style["card"])
+        painter.drawRoundedRect(card, self.CARD_RADIUS, self.CARD_RADIUS)
+        if option.state & QStyle.State_Selected:
+            pen = QPen(option.palette.highlight().color())
+            pen.setWidthF(1.5)
+            painter.setPen(pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(card.adjusted(0.75, 0.75, -0.75, -0.75), self.CARD_RADIUS, self.CARD_RADIUS)
+
+        # avatar, vertically centred on the text block
+        top = rect.top() + margin
+        avatar = QRectF(rect.left() + margin, top + (content_h - self.AVATAR_SIZE) / 2,
+                        self.AVATAR_SIZE, self.AVATAR_SIZE)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(style["avatar"])
+        painter.drawRoundedRect(avatar, self.AVATAR_RADIUS, self.AVATAR_RADIUS)
+        avatar_font = QFont(option.font)
+        avatar_font.setBold(True)
+        painter.setFont(avatar_font)
+        painter.setPen(style["on_accent"])
+        painter.drawText(avatar, Qt.AlignCenter, contact["initials"])
+
+        # text lines; empty email/phone lines are skipped like in ContactCard
+        x = avatar.right() + spacing
+        width = max(0, rect.right() - margin - x)
+        lines = [(self._name_font, name_h, style["text"], contact["name"]),
+                 (option.font, line_h, style["muted"], contact["role"])]
+        lines.extend((option.font, line_h, style["text"], contact[field])
+                     for field in ("email", "phone") if contact[field])
+        y = top
+        for font, height, color, text in lines:
+            painter.setFont(font)
+            painter.setPen(color)
+            elided = QFontMetrics(font).elidedText(text, Qt.ElideRight, int(width))
+            painter.drawText(QRectF(x, y, width, height), Qt.AlignLeft | Qt.AlignVCenter, elided)
+            y += height + spacing
+        painter.restore()
+
+
+class CardListView(QListView):
+    """A virtualized list (or wrapping grid) of contact cards.
+
+    - `set_contacts(contacts)` replaces the rows (dicts or `ContactCard`
+      argument tuples, see `cards.normalize_contact`) with one model reset
+    - `set_grid(True)` wraps fixed-width cards into as many columns as fit
+    - Emits `contact_activated(contact)` when a card is activated (Enter, or
+      a double or single click depending on the platform)
+    """
+    contact_activated = Signal(object)
+
+    def __init__(self, contacts=None, parent=None, grid: bool = False, card_width: int = DEFAULT_CARD_WIDTH):
+        super().__init__(parent)
+        self._card_width = card_width
+        self._contact_model = ContactListModel(contacts, self)
+        self.setModel(self._contact_model)
+        self._delegate = ContactCardDelegate(self, card_width)
+        self.setItemDelegate(self._delegate)
+        # every card has the same size, so layout and scrolling only touch
+        # the rows in view
+        self.setUniformItemSizes(True)
+        self.setSpacing(4)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setSelectionMode(QListView.SingleSelection)
+        self.setFrameShape(QListView.NoFrame)
+        # cards sit on the window background, as ContactCard widgets do
+        self.viewport().setBackgroundRole(QPalette.Window)
+        self.setResizeMode(QListView.Adjust)
+        self._grid = None
+        self.set_grid(grid)
+        self.activated.connect(self._on_activated)
+        _views.add(self)
+
+    def contact_model(self) -> ContactListModel:
+        return self._contact_model
+
+    def contacts(self) -> list:
+        return self._contact_model.contacts()
+
+    def set_contacts(self, contacts):
+        self._contact_model.set_contacts(contacts)
+
+    def set_grid(self, enabled: bool = True):
+        """Wrap cards into columns (True) or show one full-width card per row."""
+        enabled = bool(enabled)
+        if enabled == self._grid:
+            return
+        self._grid = enabled
+        self.setFlow(QListView.LeftToRight if enabled else QListView.TopToBottom)
+        self.setWrapping(enabled)
+        self._update_card_width()
+
+    def is_grid(self) -> bool:
+        return self._grid
+
+    def _update_card_width(self):
+        if self._grid:
+            width = self._card_width
+        else:
+            width = max(1, self.viewport().width() - 2 * self.spacing())
+        if width != self._delegate.card_width:
+            self._delegate.card_width = width
+            # the view caches the uniform item size; have it measure again
+            self._delegate.sizeHintChanged.emit(self._contact_model.index(0))
+
+    def resizeEvent(self, event):
+        if not self._grid:
+            self._update_card_width()
+        super().resizeEvent(event)
+
+    def _on_activated(self, index):
+        if index.isValid():
+            self.contact_activated.emit(self._contact_model.contact(index.row()))
@@ -0,0 +1,506 @@
+"""Card widgets, the `CardPool` that recycles them and the sample `MainFrame`."""
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QFont, QRegion
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QVBoxLayout, QWidget
+
+from bfs_component.ui.theme import set_role
+
+CONTACT_FIELDS = ("initials", "name", "role", "email", "phone")
+
+
+def initials_for(name: str) -> str:
+    """Return up to two upper-case initials for `name` ("Jane Doe" -> "JD")."""
+    return "".join(word[0] for word in str(name).split()[:2]).upper()
+
+
+def normalize_contact(contact) -> dict:
+    """Return `contact` as a dict with every key of `CONTACT_FIELDS`.
+
+    Accepts a mapping (extra keys, such as an id, are kept) or a sequence in
+    `ContactCard` argument order. Missing fields default to "", and missing
+    initials are derived from the name.
+    """
+    if hasattr(contact, "keys"):
+        data = dict(contact)
+    else:
+        data = dict(zip(CONTACT_FIELDS, contact))
+    for field in CONTACT_FIELDS:
+        data[field] = str(data.get(field) or "")
+    if not data["initials"]:
+        data["initials"] = initials_for(data["name"])
+    return data
+
+
+class HeaderWidget(QWidget):
+    """A small header widget used inside MainFrame.
+
+    Shows a circular logo placeholder and a title label. This is a lightweight
+    helper intended for composing the `MainFrame` content.
+    """
+    def __init__(self, title: str = "BFS"):
+        super().__init__()
+        layout = QHBoxLayout()
+        layout.setContentsMargins(12, 12, 12, 12)
+        logo = QLabel()
+        logo.setFixedSize(36, 36)
+        set_role(logo, "header-logo")
+        layout.addWidget(logo)
+        title_label = QLabel(title)
+        title_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        set_role(title_label, "label")
+        layout.addWidget(title_label)
+        layout.addStretch()
+        self.setLayout(layout)
+
+
+class _Rebindable:
+    """Adds `update(data)` to card widgets for reuse with `CardPool`.
+
+    `update()` without data (or with a QRect/QRegion or x, y, w, h) keeps
+    `QWidget.update`'s meaning and schedules a repaint, so code that
+    repaints widgets is unaffected.
+    """
+    def update(self, data=None, *args):
+        if data is None or args or isinstance(data, (QRect, QRegion)):
+            return super().update(*(() if data is None else (data,)), *args)
+        self.bind(data)
+
+    def bind(self, data):
+        raise NotImplementedError
+
+
+class Card(_Rebindable, QFrame):
+    """A generic card widget with header/body/footer slots.
+
+    Usage:
+        card = Card()
+        card.set_header(QLabel('Header'))
+        card.set_body(QWidget())
+        card.set_footer(QLabel('Footer'))
+
+    `update({"header": ..., "body": ..., "footer": ...})` rebinds the slots;
+    a string sets the text of a QLabel slot (creating the label if needed),
+    a widget replaces the slot.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.StyledPanel)
+        set_role(self, "card")
+        self._main_layout = QVBoxLayout()
+        self._main_layout.setContentsMargins(8, 8, 8, 8)
+        self._main_layout.setSpacing(6)
+        self.setLayout(self._main_layout)
+
+    def set_header(self, widget: QWidget):
+        if hasattr(self, "_header") and self._header is not None:
+            self._main_layout.removeWidget(self._header)
+            self._header.setParent(None)
+        self._header = widget
+        self._main_layout.insertWidget(0, widget)
+
+    def set_body(self, widget: QWidget):
+        if hasattr(self, "_body") and self._body is not None:
+            self._main_layout.removeWidget(self._body)
+            self._body.setParent(None)
+        # body inserted after header if present
+        idx = 1 if hasattr(self, "_header") and self._header is not None else 0
+        self._body = widget
+        self._main_layout.insertWidget(idx, widget)
+
+    def set_footer(self, widget: QWidget):
+        # footer at the end
+        if hasattr(self, "_footer") and self._footer is not None:
+            self._main_layout.removeWidget(self._footer)
+            self._footer.setParent(None)
+        self._footer = widget
+        self._main_layout.addWidget(widget)
+
+    def bind(self, data: dict):
+        for slot in ("header", "body", "footer"):
+            if slot not in data:
+                continue
+            value = data[slot]
+            current = getattr(self, f"_{slot}", None)
+            if isinstance(value, QWidget):
+                if value is not current:
+                    getattr(self, f"set_{slot}")(value)
+            elif isinstance(current, QLabel):
+                current.setText(str(value))
+            else:
+                getattr(self, f"set_{slot}")(QLabel(str(value)))
+
+
+class ContactCard(Card):
+    """Contact card implemented on top of Card. Keeps same visual layout but
+    uses Card slots for consistency.
+
+    `update(contact)` rebinds the card to another contact (a dict or tuple,
+    see `normalize_contact`); empty email/phone lines are hidden.
+    """
+    def __init__(self, initials: str = "", name: str = "", role: str = "", email: str = "", phone: str = ""):
+        super().__init__()
+        layout = QHBoxLayout()
+        self._avatar = QLabel()
+        self._avatar.setFixedSize(48, 48)
+        self._avatar.setAlignment(Qt.AlignCenter)
+        set_role(self._avatar, "avatar")
+        layout.addWidget(self._avatar)
+
+        v = QVBoxLayout()
+        self._name_label = QLabel()
+        self._name_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        set_role(self._name_label, "label")
+        v.addWidget(self._name_label)
+        self._role_label = QLabel()
+        set_role(self._role_label, "muted")
+        v.addWidget(self._role_label)
+
+        # email and phone lines always exist so any contact can be bound
+        # later; empty ones are hidden and take no space
+        self._email_label = QLabel()
+        set_role(self._email_label, "label")
+        v.addWidget(self._email_label)
+        self._phone_label = QLabel()
+        set_role(self._phone_label, "label")
+        v.addWidget(self._phone_label)
+
+        layout.addLayout(v)
+        # put our layout inside a body container to preserve Card slots
+        body_container = QWidget()
+        body_container.setLayout(layout)
+        self.set_body(body_container)
+        self.bind({"initials": initials, "name": name, "role": role, "email": email, "phone": phone})
+
+    def bind(self, contact):
+        data = normalize_contact(contact)
+        self._data = data
+        self._avatar.setText(data["initials"])
+        self._name_label.setText(data["name"])
+        self._role_label.setText(data["role"])
+        self._email_label.setText(data["email"])
+        self._email_label.setVisible(bool(data["email"]))
+        self._phone_label.setText(data["phone"])
+        self._phone_label.setVisible(bool(data["phone"]))
+
+    def data(self) -> dict:
+        """Return the contact shown, as a `normalize_contact` dict."""
+        return self._data
+
+
+class CompanyCard(_Rebindable, QFrame):
+    """A company overview card with logo, name and tag badges.
+
+    Parameters
+    - name: company name
+    - tags: optional list of tag strings to show as badges
+
+    `update({"name": ..., "tags": [...]})` (or just a name) rebinds the card;
+    tag badges are reused and hidden rather than recreated.
+    """
+    def __init__(self, name: str = "", tags: list[str] = None):
+        super().__init__()
+        self.setFrameShape(QFrame.StyledPanel)
+        set_role(self, "company-card")
+        layout = QHBoxLayout()
+        left = QVBoxLayout()
+        self._logo = QLabel()
+        self._logo.setFixedSize(64, 64)
+        self._logo.setAlignment(Qt.AlignCenter)
+        set_role(self._logo, "company-logo")
+        left.addWidget(self._logo)
+        left.addStretch()
+        layout.addLayout(left)
+
+        mid = QVBoxLayout()
+        self._title = QLabel()
+        self._title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        set_role(self._title, "label")
+        mid.addWidget(self._title)
+        self._tags_widget = QWidget()
+        self._tags_layout = QHBoxLayout(self._tags_widget)
+        self._tags_layout.setContentsMargins(0, 0, 0, 0)
+        self._tags_layout.addStretch()
+        self._tag_labels = []
+        mid.addWidget(self._tags_widget)
+        layout.addLayout(mid)
+
+        right = QVBoxLayout()
+        add_btn = QPushButton("+ Add Contact")
+        set_role(add_btn, "primary-button")
+        right.addWidget(add_btn)
+        right.addStretch()
+        layout.addLayout(right)
+
+        self.setLayout(layout)
+        self.bind({"name": name, "tags": tags})
+
+    def bind(self, company):
+        data = {"name": company} if isinstance(company, str) else dict(company)
+        data["name"] = str(data.get("name") or "")
+        data["tags"] = [str(t) for t in data.get("tags") or ()]
+        self._data = data
+        self._logo.setText(data["name"][:2].upper())
+        self._title.setText(data["name"])
+        tags = data["tags"]
+        while len(self._tag_labels) < len(tags):
+            tag = QLabel()
+            set_role(tag, "tag")
+            # before the trailing stretch
+            self._tags_layout.insertWidget(len(self._tag_labels), tag)
+            self._tag_labels.append(tag)
+        for i, label in enumerate(self._tag_labels):
+            if i < len(tags):
+                label.setText(tags[i])
+            label.setVisible(i < len(tags))
+        self._tags_widget.setVisible(bool(tags))
+
+    def data(self) -> dict:
+        """Return the company shown: ``{"name": ..., "tags": [...]}``."""
+        return self._data
+
+
+class CardPool:
+    """A bounded pool of card widgets that are rebound instead of rebuilt.
+
+    Building a card parses its role rules and creates its layouts and
+    labels; paging through records with fresh cards repeats that for every
+    page. A pool hands out released cards again and rebinds them with
+    `update(data)`:
+
+        pool = CardPool(ContactCard, max_size=50, prewarm=20)
+        card = pool.acquire(contact)      # reused if one is idle
+        layout.addWidget(card)
+        ...
+        layout.removeWidget(card)
+        pool.release(card)                # hidden and kept for reuse
+
+    `factory` is called without arguments (a card class works). At most
+    `max_size` idle cards are kept; cards released beyond that are deleted.
+    """
+    DEFAULT_MAX_SIZE = 64
+
+    def __init__(self, factory, max_size: int = DEFAULT_MAX_SIZE, prewarm: int = 0):
+        self._factory = factory
+        self.max_size = max(0, max_size)
+        self._idle = []
+        self._idle_ids = set()
+        self.created = 0
+        self.reused = 0
+        if prewarm:
+            self.prewarm(prewarm)
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle cards ready to be acquired."""
+        return len(self._idle)
+
+    def _create(self):
+        self.created += 1
+        return self._factory()
+
+    def prewarm(self, count: int) -> int:
+        """Build idle cards up front (up to `max_size`); returns how many."""
+        added = 0
+        while added < count and len(self._idle) < self.max_size:
+            card = self._create()
+            self._idle.append(card)
+            self._idle_ids.add(id(card))
+            added += 1
+        return added
+
+    def acquire(self, data=None, parent: QWidget = None):
+        """Return an idle card (or a new one), bound to `data` if given."""
+        if self._idle:
+            card = self._idle.pop()
+            self._idle_ids.discard(id(card))
+            self.reused += 1
+        else:
+            card = self._create()
+        if data is not None:
+            card.update(data)
+        if parent is not None and card.parentWidget() is not parent:
+            # reparenting also clears the hidden state set by `release`, so
+            # adding the card to a layout shows it again
+            card.setParent(parent)
+        elif card.parentWidget() is not None:
+            card.show()
+        return card
+
+    def release(self, card):
+        """Hide `card` and keep it for reuse, or delete it if the pool is full."""
+        if id(card) in self._idle_ids:
+            return
+        if not card.isHidden():
+            card.hide()
+        if len(self._idle) < self.max_size:
+            self._idle.append(card)
+            self._idle_ids.add(id(card))
+        else:
+            card.setParent(None)
+            card.deleteLater()
+
+    def release_all(self, cards):
+        for card in cards:
+            self.release(card)
+
+    def clear(self):
+        """Delete every idle card."""
+        for card in self._idle:
+            card.setParent(None)
+            card.deleteLater()
+        self._idle.clear()
+        self._idle_ids.clear()
+
+
+SAMPLE_COMPANY = {"name": "Acme Corporation", "tags": ["Technology", "Active"]}
+SAMPLE_CONTACTS = [
+    ("JD", "Jane Doe", "Project Manager", "jane@acme.com", "+47 934 88 112"),
+    ("JS", "John Smith", "Sales Representative", "", "+1 202 555 0168"),
+    ("JS", "John Smith", "Sales Representative", "", "+1 202 555 0168"),
+    ("C", "Carol Remecom", "Marketing Director"),
+    ("MB", "Michael Brown", "Sales Representative", "", "+1 202 555 0168"),
+]
+
+
+def contact_key(contact: dict):
+    """Default `MainFrame` contact key: the ``id`` field, else name and email."""
+    key = contact.get("id")
+    return key if key is not None else (contact["name"], contact["email"])
+
+
+class MainFrame(QWidget):
+    """The main content frame that composes header, company card and contacts.
+
+    This widget is intended as a reusable content panel that can be injected
+    into `MainWindow` via `set_content`.
+
+    The frame is bound to data: `set_data(company, contacts)` diffs the new
+    contacts against the shown ones by key (`key(contact)`, default
+    `contact_key`) and only adds, removes, moves or `update`s the cards that
+    changed, so a live view can refresh without rebuilding the widget tree.
+    Contacts fill two columns (the first half on the left); removed cards go
+    to a `CardPool` and are reused for later additions. Without data the
+    frame shows the sample company and contacts.
+    """
+    COLUMN_SPACING = 14
+    POOL_SIZE = 16
+
+    def __init__(self, company=None, contacts=None, key=contact_key):
+        super().__init__()
+        self._key = key
+        self._pool = CardPool(ContactCard, max_size=self.POOL_SIZE)
+        self._cards = {}
+        self._order = []
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(16, 16, 16, 16)
+        header = HeaderWidget("BFS")
+        layout.addWidget(header)
+        layout.addSpacing(12)
+
+        self._company_card = CompanyCard()
+        self._company_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        layout.addWidget(self._company_card)
+        layout.addSpacing(12)
+
+        # contacts area
+        contacts_h = QHBoxLayout()
+        self._columns = (QVBoxLayout(), QVBoxLayout())
+        for column in self._columns:
+            column.setSpacing(self.COLUMN_SPACING)
+            contacts_h.addLayout(column)
+
+        layout.addLayout(contacts_h)
+        layout.addStretch()
+
+        self.setLayout(layout)
+        self.set_data(SAMPLE_COMPANY if company is None else company,
+                      SAMPLE_CONTACTS if contacts is None else contacts)
+
+    def company(self) -> dict:
+        return self._company_card.data()
+
+    def contacts(self) -> list:
+        """Return the shown contacts (`normalize_contact` dicts) in order."""
+        return [self._cards[k].data() for k in self._order]
+
+    def contact_cards(self) -> list:
+        """Return the contact cards in data order."""
+        return [self._cards[k] for k in self._order]
+
+    def set_company(self, company):
+        if company != self._company_card.data():
+            self._company_card.update(company)
+
+    def set_contacts(self, contacts) -> dict:
+        """Show `contacts`, touching only the cards that changed.
+
+        Returns counts of the ``added``, ``removed``, ``updated`` and
+        ``moved`` cards.
+        """
+        data = [normalize_contact(c) for c in contacts]
+        keys, seen = [], {}
+        for contact in data:
+            key = self._key(contact)
+            # identical keys stay distinct, matched in order of appearance
+            n = seen[key] = seen.get(key, -1) + 1
+            keys.append((key, n))
+        stats = {"added": 0, "removed": 0, "updated": 0, "moved": 0}
+
+        self.setUpdatesEnabled(False)
+        try:
+            old = self._cards
+            wanted = set(keys)
+            # release first, so additions in the same diff reuse those cards
+            for key in [k for k in old if k not in wanted]:
+                card = old.pop(key)
+                self._remove_card(card)
+                self._pool.release(card)
+                stats["removed"] += 1
+            cards = {}
+            for key, contact in zip(keys, data):
+                card = old.get(key)
+                if card is None:
+                    card = self._pool.acquire(contact, self)
+                    stats["added"] += 1
+                elif card.data() != contact:
+                    card.update(contact)
+                    stats["updated"] += 1
+                cards[key] = card
+            self._cards = cards
+            self._order = keys
+
+            half = len(keys) // 2
+            for column, wanted in zip(self._columns, (keys[:half], keys[half:])):
+                stats["moved"] += self._arrange(column, [cards[k] for k in wanted])
+        finally:
+            self.setUpdatesEnabled(True)
+        # new cards were counted as placed, not moved
+        stats["moved"] -= stats["added"]
+        return stats
+
+    def set_data(self, company=None, contacts=None) -> dict:
+        """Bind the frame to `company` and `contacts`; None leaves a part as is."""
+        if company is not None:
+            self.set_company(company)
+        if contacts is None:
+            return {"added": 0, "removed": 0, "updated": 0, "moved": 0}
+        return self.set_contacts(contacts)
+
+    def _remove_card(self, card):
+        for column in self._columns:
+            if column.indexOf(card) >= 0:
+                column.removeWidget(card)
+
+    def _arrange(self, column, wanted) -> int:
+        """Put `wanted` into `column` in order; returns how many were placed."""
+        placed = 0
+        for i, card in enumerate(wanted):
+            item = column.itemAt(i)
+            if item is not None and item.widget() is card:
+                continue
+            self._remove_card(card)
+            column.insertWidget(i, card)
+            card.show()
+            placed += 1
+        return placed
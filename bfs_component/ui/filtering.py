@@ -0,0 +1,214 @@
+"""Option filtering used by the selection widgets.
+
+Kept free of Qt so it can run on worker threads and be tested on its own.
+"""
+import heapq
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+
+DEFAULT_CACHE_SIZE = 64
+DEFAULT_FUZZY_LIMIT = 50
+
+
+def trigrams(text: str) -> set:
+    """Return the set of padded character trigrams of `text`."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Inverted trigram index for typo-tolerant, ranked label search.
+
+    Built once per option set. A query's trigrams are looked up in posting
+    lists (sorted row arrays); a label must share at least `min_overlap` of
+    the query's trigrams to be a candidate. All but the `PROBED_LISTS`
+    longest posting lists are counted in bulk; since a candidate can gain at
+    most one match per skipped list, only labels already close to the
+    threshold are probed in the long lists with a binary search. Candidates
+    are ranked by Dice similarity, with labels containing the query as a
+    substring first.
+    """
+    PROBED_LISTS = 3
+
+    def __init__(self, labels: Sequence[str], min_overlap: float = 0.5, casefolded: bool = False):
+        self.min_overlap = min_overlap
+        # `casefolded` labels are used as is, without a copy
+        self._labels = labels if casefolded else [str(lbl).casefold() for lbl in labels]
+        postings: dict[str, array] = {}
+        sizes = array("H")
+        for row, label in enumerate(self._labels):
+            grams = trigrams(label)
+            sizes.append(min(len(grams), 0xFFFF))
+            for g in grams:
+                posting = postings.get(g)
+                if posting is None:
+                    posting = postings[g] = array("I")
+                posting.append(row)
+        self._postings = postings
+        self._sizes = sizes
+
+    def __len__(self):
+        return len(self._labels)
+
+    def search(self, query: str, limit: int = DEFAULT_FUZZY_LIMIT) -> list[int]:
+        """Return up to `limit` label indices, best match first."""
+        q = query.strip().casefold()
+        if not q:
+            return []
+        qgrams = trigrams(q)
+        lists = sorted((self._postings.get(g, ()) for g in qgrams), key=len)
+        required = max(1, math.ceil(len(qgrams) * self.min_overlap))
+        # count the shorter posting lists in bulk; the few longest ones are
+        # only probed for labels that can still reach `required`
+        skip = min(self.PROBED_LISTS, required - 1)
+        scanned, probed = lists[:len(lists) - skip], lists[len(lists) - skip:]
+
+        counts = Counter()
+        for posting in scanned:
+            counts.update(posting)
+        threshold = required - skip
+        candidates = {}
+        for row, shared in counts.items():
+            if shared < threshold:
+                continue
+            for posting in probed:
+                i = bisect_left(posting, row)
+                if i < len(posting) and posting[i] == row:
+                    shared += 1
+            if shared >= required:
+                candidates[row] = shared
+
+        labels = self._labels
+        sizes = self._sizes
+        nq = len(qgrams)
+        scored = (
+            (q in labels[row], 2.0 * shared / (nq + sizes[row]), -row)
+            for row, shared in candidates.items()
+        )
+        return [-item[2] for item in heapq.nlargest(limit, scored)]
+
+
+class OptionFilter:
+    """Case-insensitive substring filter over a fixed list of labels.
+
+    Labels are casefolded once, when the index is built. Results for recent
+    queries are cached, and a query that contains a cached query (typically
+    the previous keystroke's prefix) only rescans that query's matches, so
+    per-keystroke cost follows the current match count rather than the
+    option count.
+
+    With `fuzzy` enabled, queries go through a `TrigramIndex` instead and
+    return the `fuzzy_limit` best-ranked matches, tolerating typos. The index
+    is built by the first fuzzy query, so on the thread that filters (a
+    worker, for large option lists) rather than the one setting the labels,
+    and only once per label set: queries arriving during the build wait for
+    it.
+    """
+    def __init__(self, labels: Sequence[str] = (), cache_size: int = DEFAULT_CACHE_SIZE,
+                 fuzzy: bool = False, fuzzy_limit: int = DEFAULT_FUZZY_LIMIT):
+        self._lock = threading.Lock()
+        # held while the trigram index is built; taken before `_lock`
+        self._build_lock = threading.Lock()
+        self._cache_size = cache_size
+        self._fuzzy = fuzzy
+        self.fuzzy_limit = fuzzy_limit
+        self._trigrams = None
+        self.set_labels(labels)
+
+    def set_labels(self, labels: Sequence[str]):
+        labels = list(labels)
+        folded = [str(lbl).casefold() for lbl in labels]
+        with self._lock:
+            self._raw_labels = labels
+            self._labels = folded
+            # built on demand by `filter`
+            self._trigrams = None
+            self._cache = OrderedDict()
+
+    @property
+    def fuzzy(self) -> bool:
+        return self._fuzzy
+
+    def set_fuzzy(self, enabled: bool, limit: int = None):
+        """Switch between substring and trigram matching."""
+        if limit is not None:
+            self.fuzzy_limit = limit
+        if enabled == self._fuzzy:
+            with self._lock:
+                self._cache = OrderedDict()
+            return
+        self._fuzzy = enabled
+        # drops the trigram index (rebuilt on demand) and cached results
+        self.set_labels(self._raw_labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return query.strip().casefold()
+
+    def _narrowest_cached(self, query: str):
+        # any cached query that is a substring of `query` matches a superset
+        best = None
+        for cached, rows in self._cache.items():
+            if cached in query and (best is None or len(rows) < len(best)):
+                best = rows
+        return best
+
+    def _trigram_index(self, labels: list[str]):
+        """Return the trigram index of `labels`, building it if needed.
+
+        Returns None if `labels` were replaced before the build started.
+        """
+        # builds outside `_lock`, so set_labels never waits for one
+        with self._build_lock:
+            with self._lock:
+                if labels is not self._labels:
+                    return None
+                if self._trigrams is not None:
+                    return self._trigrams
+            trigram_index = TrigramIndex(labels, casefolded=True)
+            with self._lock:
+                if labels is self._labels:
+                    self._trigrams = trigram_index
+            return trigram_index
+
+    def filter(self, query: str) -> list[int] | None:
+        """Return matching label indices in order, or None if `query` is blank."""
+        q = self.normalize(query)
+        if not q:
+            return None
+        with self._lock:
+            labels = self._labels
+            cache = self._cache
+            rows = cache.get(q)
+            if rows is not None:
+                cache.move_to_end(q)
+                return rows
+            fuzzy = self._fuzzy
+            trigram_index = self._trigrams
+            # fuzzy results are not subsets of shorter queries' results
+            base = None if fuzzy else self._narrowest_cached(q)
+        if fuzzy:
+            if trigram_index is None:
+                trigram_index = self._trigram_index(labels)
+                if trigram_index is None:
+                    # the labels were replaced meanwhile; nothing to match
+                    return []
+            rows = trigram_index.search(q, self.fuzzy_limit)
+        elif base is None:
+            rows = [i for i, lbl in enumerate(labels) if q in lbl]
+        else:
+            rows = [i for i in base if q in labels[i]]
+        with self._lock:
+            # labels may have been replaced while we were scanning
+            if labels is self._labels:
+                cache[q] = rows
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+        return rows
@@ -0,0 +1,318 @@
+"""Text inputs: `StyledLineEdit` and the labelled `TextInput`.
+
+The gradient focus ring is rendered once per size and theme into a cached
+pixmap (`focus_ring_pixmap`) and blitted on paint.
+"""
+from collections import OrderedDict
+
+from PySide6.QtCore import QPointF, QRectF, QRegularExpression, Qt, Signal
+from PySide6.QtGui import (
+    QColor,
+    QLinearGradient,
+    QPainter,
+    QPen,
+    QPixmap,
+    QRadialGradient,
+    QRegularExpressionValidator,
+    QValidator,
+)
+from PySide6.QtWidgets import QLabel, QLineEdit, QVBoxLayout, QWidget
+
+from bfs_component.ui.theme import add_cache_invalidator, current_theme, set_role, widget_tokens
+
+
+_DEFAULT_FOCUS_STOPS = ['#00C6FF', '#9047FF', '#FF6F61']
+_FOCUS_RING_CACHE_SIZE = 32
+_focus_ring_cache = OrderedDict()
+_focus_ring_tokens = None
+_error_qcolor = None
+
+
+def _focus_ring_theme():
+    """Return ``(stops, ring_width)`` from the theme tokens, read once."""
+    global _focus_ring_tokens
+    if _focus_ring_tokens is None:
+        theme = current_theme()
+        stops = theme.get('colors', {}).get('input_focus_stops', _DEFAULT_FOCUS_STOPS)
+        ring_w = theme.get('utils', {}).get('focus_ring_width', 6)
+        _focus_ring_tokens = (tuple(stops), ring_w)
+    return _focus_ring_tokens
+
+
+def _error_color() -> QColor:
+    """Return the input error border color from the theme tokens, read once."""
+    global _error_qcolor
+    if _error_qcolor is None:
+        _error_qcolor = QColor(widget_tokens(current_theme())["error"])
+    return _error_qcolor
+
+
+def clear_focus_ring_cache():
+    """Drop cached focus-ring artwork; call after changing theme tokens."""
+    global _focus_ring_tokens, _error_qcolor
+    _focus_ring_cache.clear()
+    _focus_ring_tokens = None
+    _error_qcolor = None
+
+
+# ThemeManager.set_theme clears the artwork along with the stylesheet
+add_cache_invalidator(clear_focus_ring_cache)
+
+
+def _paint_focus_ring(painter, width: int, height: int, stops, ring_w):
+    # inset the stroke slightly so it doesn't overlap text area
+    r = QRectF(0, 0, width, height)
+    inset = 2.0
+    r.adjust(inset, inset, -inset, -inset)
+
+    # paint a warm radial glow at the top-left (under the stroke)
+    glow_center = r.topLeft() + QPointF(r.width() * 0.18, r.height() * 0.2)
+    rg = QRadialGradient(glow_center, max(r.width(), r.height()) * 0.9)
+    rg.setColorAt(0.0, QColor(249, 115, 22, 160))
+    rg.setColorAt(0.25, QColor(236, 72, 153, 90))
+    rg.setColorAt(1.0, QColor(8, 18, 42, 0))
+    painter.setBrush(rg)
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(r, 10.0, 10.0)
+    painter.setBrush(Qt.NoBrush)
+
+    # diagonal gradient stroke: cyan -> lilla -> orange, equivalent to
+    # border: 2px solid qlineargradient(x1:0,y1:0,x2:1,y2:1,...)
+    grad = QLinearGradient(r.topLeft(), r.bottomRight())
+    grad.setColorAt(0.0, QColor(stops[0]))
+    grad.setColorAt(0.5, QColor(stops[1]))
+    grad.setColorAt(1.0, QColor(stops[2]))
+    pen = QPen()
+    pen.setBrush(grad)
+    pen.setWidthF(1.0)
+    pen.setJoinStyle(Qt.RoundJoin)
+    painter.setPen(pen)
+    painter.drawRoundedRect(r, 10.0, 10.0)
+
+    # outer focus ring drawn inside widget bounds so it is always visible
+    r_out = r.adjusted(3.0, 3.0, -3.0, -3.0)
+    grad_out = QLinearGradient(r_out.topLeft(), r_out.bottomRight())
+    grad_out.setColorAt(0.0, QColor(stops[0]))
+    grad_out.setColorAt(0.5, QColor(stops[1]))
+    grad_out.setColorAt(1.0, QColor(stops[2]))
+    outer_pen = QPen()
+    outer_pen.setBrush(grad_out)
+    outer_pen.setWidthF(max(1.0, float(ring_w) - 2.0))
+    outer_pen.setJoinStyle(Qt.RoundJoin)
+    painter.setPen(outer_pen)
+    painter.drawRoundedRect(r_out, 12.0, 12.0)
+
+    # faint outer translucent stroke to add contrast for warm colors
+    outer_highlight = QPen(QColor(255, 255, 255, 30))
+    outer_highlight.setWidthF(1.0)
+    painter.setPen(outer_highlight)
+    painter.drawRoundedRect(r.adjusted(-0.5, -0.5, 0.5, 0.5), 10.0, 10.0)
+
+
+def focus_ring_pixmap(width: int, height: int, dpr: float = 1.0) -> QPixmap:
+    """Return the cached focus glow/ring artwork for a `width` x `height` input.
+
+    Cached per (size, device pixel ratio, theme tokens); a resize simply
+    selects another entry, and the least recently used sizes are evicted.
+    """
+    stops, ring_w = _focus_ring_theme()
+    key = (width, height, dpr, stops, ring_w)
+    pixmap = _focus_ring_cache.get(key)
+    if pixmap is not None:
+        _focus_ring_cache.move_to_end(key)
+        return pixmap
+    pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    _paint_focus_ring(painter, width, height, stops, ring_w)
+    painter.end()
+    _focus_ring_cache[key] = pixmap
+    if len(_focus_ring_cache) > _FOCUS_RING_CACHE_SIZE:
+        _focus_ring_cache.popitem(last=False)
+    return pixmap
+
+
+class StyledLineEdit(QLineEdit):
+    """A small QLineEdit subclass for consistent styling and validation.
+
+    Provides a helper to set a regular-expression validator and a simple
+    is_valid() method. This avoids duplicating input behavior and keeps
+    styling centralized.
+
+    Focus and error state are painted (see `paintEvent`), so focus changes
+    and `set_error_state` never make Qt re-resolve the stylesheet.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._regex = None
+        self._regex_validator = None
+        self._regex_error = None
+        # Default dark/neon input styling inspired by the design board, from
+        # the application stylesheet (see bfs_component.ui.theme):
+        # - dark background
+        # - rounded corners
+        # - subtle translucent border normally
+        # - no stylesheet border on focus; the gradient ring is painted
+        set_role(self, "input")
+        self._error_state = False
+
+    def set_error_state(self, error: bool = True):
+        """Show or clear the painted error border."""
+        error = bool(error)
+        if error != self._error_state:
+            self._error_state = error
+            self.update()
+
+    def error_state(self) -> bool:
+        return self._error_state
+
+    def paintEvent(self, event):
+        # let the base class draw the line edit (text, background, caret)
+        super().paintEvent(event)
+        # QLineEdit repaints on focus in/out, so focus changes need no
+        # unpolish/polish; the glow below comes from the focus-ring cache
+        focused = self.hasFocus()
+        if not focused and not self._error_state:
+            return
+
+        try:
+            painter = QPainter(self)
+            if focused:
+                # the glow and rings are rendered once per size/dpr/theme and
+                # blitted, so caret blinks cost a single draw
+                pixmap = focus_ring_pixmap(self.width(), self.height(), self.devicePixelRatioF())
+                painter.drawPixmap(0, 0, pixmap)
+            if self._error_state:
+                painter.setRenderHint(QPainter.Antialiasing)
+                pen = QPen(_error_color())
+                pen.setWidthF(1.0)
+                painter.setPen(pen)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 10.0, 10.0)
+            painter.end()
+        except Exception:
+            # be forgiving - if painting fails, don't crash
+            return
+
+    def set_validation_regex(self, pattern: str, error_message: str = "Invalid"):
+        self._regex = QRegularExpression(pattern)
+        self._regex_validator = QRegularExpressionValidator(self._regex)
+        self._regex_error = error_message
+
+    def is_valid(self):
+        if getattr(self, '_regex_validator', None) is None:
+            return True
+        state, _, _ = self._regex_validator.validate(self.text(), 0)
+        return state == QValidator.Acceptable
+
+
+class TextInput(QWidget):
+    """A labelled text input with validation and inline error display.
+
+    Features:
+    - label text above the input
+    - placeholder text
+    - required flag (shows error when empty)
+    - regex validator (QRegularExpression) with an error message
+    - `text_changed` signal emitted when the text changes
+
+    Simple usage:
+        t = TextInput(label="Name", placeholder="Full name")
+        t.set_required(True)
+        t.set_validation_regex(r"^[A-Za-z ]+$", "Only letters and spaces allowed")
+    """
+    text_changed = Signal(str)
+
+    def __init__(self, label: str = "", placeholder: str = "", parent=None):
+        """TextInput is a thin composed widget that uses a styled QLineEdit.
+
+        Internally we reuse a QLineEdit subclass (`StyledLineEdit`) so the
+        underlying behaviour comes from Qt's native input widget and is easier
+        to style and integrate with toolkits.
+        """
+        super().__init__(parent)
+        self._label_text = label
+        self._required = False
+        self._regex_error = "Invalid input"
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._label = QLabel(label)
+        set_role(self._label, "field-label")
+        layout.addWidget(self._label)
+
+        # use StyledLineEdit (subclass of QLineEdit) so we don't reinvent
+        # validation and styling behavior
+        self._input = StyledLineEdit()
+        self._input.setPlaceholderText(placeholder)
+        self._input.textChanged.connect(self._on_text_changed)
+        layout.addWidget(self._input)
+
+        self._error = QLabel("")
+        set_role(self._error, "field-error")
+        self._error.setVisible(False)
+        layout.addWidget(self._error)
+
+        self.setLayout(layout)
+
+    def _on_text_changed(self, txt: str):
+        self.clear_error()
+        self.text_changed.emit(txt)
+
+    def set_placeholder(self, text: str):
+        self._input.setPlaceholderText(text)
+
+    def set_required(self, required: bool = True, error_message: str = "This field is required"):
+        self._required = required
+        self._required_error = error_message
+
+    def set_validation_regex(self, pattern: str, error_message: str = "Invalid input"):
+        """Set a regular expression validator. Pattern is a Python/Qt regex.
+
+        The widget will validate via `is_valid()` and you can display the
+        error message by calling `validate(show_error=True)` or checking
+        `is_valid()` programmatically.
+        """
+        # delegate to the styled line edit which keeps the validator
+        self._input.set_validation_regex(pattern, error_message)
+        self._regex_error = error_message
+
+    def text(self) -> str:
+        return self._input.text()
+
+    def set_text(self, value: str):
+        self._input.setText(value)
+
+    def clear(self):
+        self._input.clear()
+        self.clear_error()
+
+    def is_valid(self) -> bool:
+        """Return True if current text satisfies required/regex rules."""
+        txt = self.text()
+        if self._required and not txt:
+            return False
+        return self._input.is_valid()
+
+    def validate(self, show_error: bool = True) -> bool:
+        ok = self.is_valid()
+        if not ok and show_error:
+            if self._required and not self.text():
+                self._show_error(getattr(self, "_required_error", "This field is required"))
+            elif getattr(self, "_regex", None) is not None:
+                self._show_error(getattr(self, "_regex_error", "Invalid input"))
+            else:
+                self._show_error("Invalid input")
+        return ok
+
+    def _show_error(self, msg: str):
+        self._error.setText(msg)
+        self._error.setVisible(True)
+        self._input.set_error_state(True)
+
+    def clear_error(self):
+        self._error.setText("")
+        self._error.setVisible(False)
+        self._input.set_error_state(False)
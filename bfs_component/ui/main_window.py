@@ -8,21 +8,34 @@ Public API highlights:
 - MainWindow.set_content(widget)
 - MainWindow.clear_content()
 - MainWindow.set_title(title)
-- MainWindow.set_status_message(message, timeout_ms)
+- MainWindow.set_status_message(message, timeout_ms, priority)
+- MainWindow.status_channel()
+- MainWindow.run_task(fn, *args, **kwargs)
+- MainWindow.register_page(name, factory) / MainWindow.show_page(name)
 """
+from collections import OrderedDict
+
+
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
     QVBoxLayout,
     QLabel,
+    QLineEdit,
+    QMenuBar,
     QPushButton,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
+    QSpacerItem,
+    QStackedWidget,
+    QStatusBar,
 )
-from PySide6.QtCore import Qt, QPoint
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import QFont, QColor, QPainter, QPixmap, QRegion
 
-from bfs_component.ui.components import MainFrame
+from bfs_component.ui.shadow import paint_shadow
+from bfs_component.ui.status import StatusChannel
+from bfs_component.ui.tasks import TaskRunner
+from bfs_component.ui.theme import set_role
 
 
 class TitleBar(QWidget):
@@ -47,35 +60,29 @@ class TitleBar(QWidget):
         self._logo_widget.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         layout.addWidget(self._logo_widget)
         # small gap between logo and search field
-        from PySide6.QtWidgets import QSpacerItem, QSizePolicy
         layout.addItem(QSpacerItem(12, 1, QSizePolicy.Fixed, QSizePolicy.Minimum))
         if logo is not None:
             self.set_logo(logo)
 
         # simple menu bar area (inserted before the title)
-        from PySide6.QtWidgets import QMenuBar
         self._menu_bar = QMenuBar()
-        self._menu_bar.setStyleSheet("QMenuBar{background: transparent; color: white;} QMenuBar::item{spacing: 6px; padding: 4px 8px;}")
+        set_role(self._menu_bar, "titlebar-menu")
         self._menu_bar.setFixedHeight(28)
         layout.addWidget(self._menu_bar)
 
         # title label
         self._title_label = QLabel(title)
         self._title_label.setFont(QFont("Segoe UI", 12, QFont.DemiBold))
-        self._title_label.setStyleSheet("color: white;")
+        set_role(self._title_label, "titlebar-title")
         layout.addWidget(self._title_label)
 
         # search field (left of the search icon)
-        from PySide6.QtWidgets import QLineEdit
-
         self.search_field = QLineEdit()
         self.search_field.setPlaceholderText("Search...")
         # reduce height by 1/6 (36 -> 30)
         self.search_field.setFixedHeight(30)
         # add a bit more blue tint to the background
-        self.search_field.setStyleSheet(
-            "QLineEdit{background: rgba(59,130,246,0.12); color: white; border: 1px solid rgba(59,130,246,0.18); border-radius: 8px; padding: 4px 10px;} QLineEdit:focus{border:1px solid rgba(99,102,241,0.26);}"
-        )
+        set_role(self.search_field, "titlebar-search")
         self.search_field.setMaximumWidth(420)
         # place search field and icon together in a small sublayout
         search_wrap = QHBoxLayout()
@@ -83,7 +90,7 @@ class TitleBar(QWidget):
         search_wrap.addWidget(self.search_field)
         search = QPushButton("🔍")
         search.setFixedSize(34, 28)
-        search.setStyleSheet("background: transparent; color: white; border: none;")
+        set_role(search, "titlebar-button")
         search_wrap.addWidget(search)
         layout.addLayout(search_wrap)
         layout.addStretch()
@@ -91,25 +98,25 @@ class TitleBar(QWidget):
         # avatar placeholder
         avatar = QLabel("")
         avatar.setFixedSize(36, 36)
-        avatar.setStyleSheet("background: white; border-radius: 18px;")
+        set_role(avatar, "titlebar-avatar")
         layout.addWidget(avatar)
 
         # window control buttons
         btn_min = QPushButton("—")
         btn_min.setFixedSize(36, 28)
-        btn_min.setStyleSheet("background: transparent; color: white; border: none;")
+        set_role(btn_min, "titlebar-button")
         btn_min.clicked.connect(self.on_minimize)
         layout.addWidget(btn_min)
 
         btn_max = QPushButton("▢")
         btn_max.setFixedSize(36, 28)
-        btn_max.setStyleSheet("background: transparent; color: white; border: none;")
+        set_role(btn_max, "titlebar-button")
         btn_max.clicked.connect(self.on_max_restore)
         layout.addWidget(btn_max)
 
         btn_close = QPushButton("✕")
         btn_close.setFixedSize(36, 28)
-        btn_close.setStyleSheet("background: transparent; color: white; border: none; font-weight: bold;")
+        set_role(btn_close, "titlebar-close")
         btn_close.clicked.connect(self.on_close)
         layout.addWidget(btn_close)
 
@@ -150,9 +157,6 @@ class TitleBar(QWidget):
 
     def set_logo(self, logo):
         """Accept a path, QPixmap, or QWidget to replace the logo placeholder."""
-        from PySide6.QtGui import QPixmap
-        from PySide6.QtWidgets import QWidget
-
         # remove existing if widget
         if isinstance(logo, QWidget):
             # replace widget
@@ -183,32 +187,55 @@ class MainWindow(QWidget):
 
     This replaces the native window decorations with a custom-drawn frame so the
     application can match the provided design.
+
+    Pages registered with `register_page(name, factory)` are built on their
+    first `show_page(name)` and kept in a `QStackedWidget`, so switching back
+    to a page is just a stack switch. At most `max_pages` built pages are
+    kept; the least recently shown one is destroyed beyond that and rebuilt
+    from its factory on the next visit.
+
+    The frame's drop shadow is painted into the window margin from a cached,
+    pre-blurred pixmap (see `ui.shadow`) rather than through a graphics
+    effect that re-renders and blurs the whole frame on every repaint.
+    While the window is being resized, the layout is applied at most once
+    per `RESIZE_COALESCE_MS` instead of on every resize event.
     """
+    DEFAULT_MAX_PAGES = 5
+    SHADOW_BLUR = 40
+    SHADOW_OFFSET = QPointF(0, 12)
+    SHADOW_COLOR = QColor(0, 0, 0, 160)
+    # matches the window-frame role's border-radius
+    FRAME_RADIUS = 14
+    RESIZE_COALESCE_MS = 16
+
+    page_changed = Signal(str)
 
-    def __init__(self, logo=None):
+    def __init__(self, logo=None, max_pages: int = DEFAULT_MAX_PAGES, max_tasks: int = None):
         """Create a frameless `MainWindow`.
 
         Args:
             logo: optional path/pixmap/widget to show at the far left of the titlebar.
+            max_pages: how many built pages `show_page` keeps alive.
+            max_tasks: how many `run_task` tasks run at once (default: one per core).
         """
         super().__init__()
+        self._page_factories = {}
+        # name -> built page, least recently shown first
+        self._pages = OrderedDict()
+        self._page_stack = None
+        self._current_page = None
+        self._max_pages = max(1, max_pages)
         # set frameless window hint via setWindowFlag
         self.setWindowFlag(Qt.FramelessWindowHint, True)
         # translucent background for rounded corners
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        # outer container to apply shadow and rounded background
+        # outer container with the rounded background; its shadow is
+        # painted by paintEvent
         self._outer = QWidget(self)
         self._outer.setObjectName("outer")
-        self._outer.setStyleSheet(
-            "QWidget#outer{background: qlineargradient(x1:0 y1:0, x2:1 y2:0, stop:0 #0f172a, stop:1 #111827); border-radius:14px;}"
-        )
-
-        shadow = QGraphicsDropShadowEffect(self._outer)
-        shadow.setBlurRadius(40)
-        shadow.setOffset(0, 12)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        self._outer.setGraphicsEffect(shadow)
+        self._outer.setAttribute(Qt.WA_StyledBackground, True)
+        set_role(self._outer, "window-frame")
 
         # layout inside outer
         outer_layout = QVBoxLayout(self._outer)
@@ -231,14 +258,21 @@ class MainWindow(QWidget):
         self._old_geometry = self.geometry()
 
         # status bar area (hidden until used)
-        from PySide6.QtWidgets import QStatusBar
-        from PySide6.QtCore import QTimer
-
         self._status_bar = QStatusBar()
-        self._status_bar.setStyleSheet("QStatusBar{background: transparent; color: #374151;}")
+        set_role(self._status_bar, "status")
         self._status_bar.setVisible(False)
         root.addWidget(self._status_bar)
-        self._status_timer = None
+        # thread-safe and rate limited; see set_status_message
+        self._status = StatusChannel(self._status_bar, parent=self)
+        self._max_tasks = max_tasks
+        # created by the first run_task
+        self._tasks = None
+
+        # applies the layout once a burst of resize events settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_COALESCE_MS)
+        self._resize_timer.timeout.connect(self._finish_resize)
 
     def set_logo(self, logo):
         if hasattr(self, "titlebar"):
@@ -255,6 +289,10 @@ class MainWindow(QWidget):
             self._content_holder.setParent(None)
             self._content_holder.deleteLater()
             self._content_holder = None
+        # built pages lived in the holder and go with it
+        self._pages.clear()
+        self._page_stack = None
+        self._current_page = None
 
     def set_content(self, widget):
         """Create an off-white content holder and insert the provided widget into it.
@@ -267,9 +305,8 @@ class MainWindow(QWidget):
         # create holder
         self._content_holder = QWidget()
         self._content_holder.setObjectName("content_holder")
-        self._content_holder.setStyleSheet(
-            "QWidget#content_holder{background: #F8FAFC; border-top-left-radius:0px; border-top-right-radius:0px; border-bottom-left-radius:10px; border-bottom-right-radius:10px;}"
-        )
+        self._content_holder.setAttribute(Qt.WA_StyledBackground, True)
+        set_role(self._content_holder, "content")
         ch_layout = QVBoxLayout(self._content_holder)
         ch_layout.setContentsMargins(12, 12, 12, 12)
         ch_layout.setSpacing(8)
@@ -279,6 +316,79 @@ class MainWindow(QWidget):
         outer_layout = self._outer.layout()
         outer_layout.addWidget(self._content_holder)
 
+    # page navigation
+    def register_page(self, name: str, factory):
+        """Register page `name`, built by calling `factory()` when first shown.
+
+        Re-registering a name drops its built page, if any.
+        """
+        self._page_factories[name] = factory
+        self.invalidate_page(name)
+
+    def unregister_page(self, name: str):
+        self.invalidate_page(name)
+        self._page_factories.pop(name, None)
+
+    def page_names(self) -> list:
+        return list(self._page_factories)
+
+    def page(self, name: str):
+        """Return the built page `name`, or None if it is not alive."""
+        return self._pages.get(name)
+
+    def current_page(self):
+        """Return the name of the page shown by `show_page`, or None."""
+        return self._current_page
+
+    def show_page(self, name: str):
+        """Show page `name`, building it on first use; returns the page widget."""
+        if name not in self._page_factories:
+            raise KeyError(name)
+        page = self._pages.get(name)
+        if page is None:
+            page = self._page_factories[name]()
+            self._ensure_page_stack().addWidget(page)
+            self._pages[name] = page
+        self._pages.move_to_end(name)
+        self._page_stack.setCurrentWidget(page)
+        changed = name != self._current_page
+        self._current_page = name
+        self._evict_pages()
+        if changed:
+            self.page_changed.emit(name)
+        return page
+
+    def invalidate_page(self, name: str):
+        """Destroy the built page `name`; it is rebuilt when shown again.
+
+        The page on screen is kept until another page is shown.
+        """
+        page = self._pages.get(name)
+        if page is None or name == self._current_page:
+            return
+        del self._pages[name]
+        self._page_stack.removeWidget(page)
+        page.deleteLater()
+
+    def set_max_pages(self, max_pages: int):
+        """Change how many built pages are kept, evicting the oldest now."""
+        self._max_pages = max(1, max_pages)
+        self._evict_pages()
+
+    def _ensure_page_stack(self) -> QStackedWidget:
+        if self._page_stack is None:
+            stack = QStackedWidget()
+            # set_content replaces ad-hoc content and resets the page state
+            self.set_content(stack)
+            self._page_stack = stack
+        return self._page_stack
+
+    def _evict_pages(self):
+        for name in list(self._pages):
+            if len(self._pages) <= self._max_pages:
+                break
+            self.invalidate_page(name)
+
     # QMainWindow-like convenience methods
     def set_title(self, title: str):
         """Set the window title shown in the titlebar and the native window title."""
@@ -297,26 +407,41 @@ class MainWindow(QWidget):
             # QWidget has no setWindowTitle in some contexts, ignore
             pass
 
-    def set_status_message(self, message: str, timeout: int = 0):
+    def set_status_message(self, message: str, timeout: int = 0, priority: int = 0):
         """Show a status message in the status bar. timeout in milliseconds.
 
         If timeout > 0 the message will clear after timeout milliseconds.
+        Safe to call from worker threads; rapid calls are coalesced by the
+        window's `StatusChannel`, and a message is only replaced by one of
+        equal or higher `priority` until it expires.
         """
-        # show status bar
-        self._status_bar.showMessage(message)
-        self._status_bar.setVisible(True)
-        from PySide6.QtCore import QTimer
-        # clear any existing timer
-        try:
-            if self._status_timer is not None:
-                self._status_timer.stop()
-        except Exception:
-            pass
-        if timeout and timeout > 0:
-            self._status_timer = QTimer(self)
-            self._status_timer.setSingleShot(True)
-            self._status_timer.timeout.connect(lambda: self._status_bar.clearMessage())
-            self._status_timer.start(timeout)
+        self._status.post(message, timeout, priority)
+
+    def status_channel(self) -> StatusChannel:
+        """Return the channel behind `set_status_message` (sticky messages, rate)."""
+        return self._status
+
+    # background tasks
+    def run_task(self, fn, *args, name: str = None, process: bool = False, **kwargs):
+        """Run `fn(*args, **kwargs)` off the GUI thread; returns a `TaskHandle`.
+
+        The handle's `finished`, `failed`, `progress` and `cancelled` signals
+        arrive on the GUI thread, and progress and errors also show in the
+        status bar. A `fn` that accepts a ``task`` argument gets a
+        `TaskContext` for progress reports and cancellation. ``process=True``
+        runs a picklable `fn` in a process pool instead (see `ui.tasks`).
+        """
+        return self.task_runner().submit(fn, *args, name=name, process=process, **kwargs)
+
+    def task_runner(self) -> TaskRunner:
+        if self._tasks is None:
+            self._tasks = TaskRunner(self._max_tasks, status=self._status, parent=self)
+        return self._tasks
+
+    def closeEvent(self, event):
+        if self._tasks is not None:
+            self._tasks.shutdown()
+        super().closeEvent(event)
 
     def add_toolbar(self, widget):
         """Add a widget to the titlebar area, aligned to the right of the titlebar."""
@@ -332,6 +457,35 @@ class MainWindow(QWidget):
         """Alias for set_content for QMainWindow compatibility."""
         self.set_content(widget)
 
+    # shadow and resize handling
+    def paintEvent(self, event):
+        frame = self._outer.geometry()
+        if frame.isEmpty():
+            return
+        painter = QPainter(self)
+        # the frame covers the shadow's centre; only the margin needs paint
+        painter.setClipRegion(QRegion(event.rect()).subtracted(QRegion(frame)))
+        paint_shadow(painter, QRectF(frame), self.SHADOW_BLUR, self.FRAME_RADIUS, self.SHADOW_COLOR,
+                     self.SHADOW_OFFSET, self.devicePixelRatioF())
+        painter.end()
+
+    def resizeEvent(self, event):
+        # the layout handles the first resize of a burst before this runs;
+        # park it until the burst settles so mouse-driven resizes do not
+        # re-layout the whole frame on every event
+        layout = self.layout()
+        if self.isVisible() and layout.isEnabled():
+            layout.setEnabled(False)
+        if not layout.isEnabled():
+            self._resize_timer.start()
+        super().resizeEvent(event)
+
+    def _finish_resize(self):
+        layout = self.layout()
+        layout.setEnabled(True)
+        layout.setGeometry(self.contentsRect())
+        self.update()
+
     # ensure minimum size so controls are usable
     def show(self):
         self.resize(980, 640)
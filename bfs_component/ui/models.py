@@ -0,0 +1,391 @@
+"""Item models shared by the selection widgets.
+
+`OptionListModel` holds ``(value, label)`` options once and exposes them to
+Qt views through a row mapping. Filtering only swaps that mapping (a list of
+source row numbers); no per-option items are created, and views with
+uniform item sizes only ask for the rows they paint.
+
+`PagedOptionModel` loads options on demand from a provider instead, one
+page at a time as views scroll (`canFetchMore`/`fetchMore`).
+"""
+import inspect
+from collections import OrderedDict
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, Qt, Signal
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CACHED_PAGES = 16
+
+
+def normalize_options(options) -> list:
+    """Return `options` as a list of ``(value, label)`` tuples.
+
+    Accepts plain values (used as both value and label) and ``(value, label)``
+    tuples, like the widgets' constructors always have.
+    """
+    normalized = []
+    for o in options or ():
+        if isinstance(o, tuple) and len(o) >= 2:
+            normalized.append((o[0], str(o[1])))
+        else:
+            normalized.append((o, str(o)))
+    return normalized
+
+
+def index_values(index: dict, options, start: int = 0) -> bool:
+    """Add ``value -> row`` entries for `options` (rows from `start`) to `index`.
+
+    The first row wins for duplicate values, like a linear scan. Returns
+    True if some value was unhashable and had to be left out.
+    """
+    unhashable = False
+    for row, (value, _) in enumerate(options, start):
+        try:
+            index.setdefault(value, row)
+        except TypeError:
+            unhashable = True
+    return unhashable
+
+
+def lookup_value(index: dict, has_unhashable: bool, options, value):
+    """Return the first row whose value equals `value`, or None.
+
+    Uses the hashed `index`; falls back to a linear scan over `options` only
+    when `value` itself is unhashable or the options contain unhashable
+    values that the index could not hold.
+    """
+    try:
+        row = index.get(value)
+    except TypeError:
+        row, has_unhashable = None, True
+    if row is None and has_unhashable:
+        for i, (candidate, _) in enumerate(options):
+            if candidate == value:
+                return i
+    return row
+
+
+class OptionListModel(QAbstractListModel):
+    """A flat list model of ``(value, label)`` options with a row filter.
+
+    - `Qt.DisplayRole` returns the label, `Qt.UserRole` the value
+    - `set_rows(rows)` shows only the given source rows (None shows all)
+    - `source_row(row)` maps a view row back to the option index
+    - `row_for_value(value)` finds an option's index in O(1), whether or not
+      the current filter shows it
+    """
+    def __init__(self, options=None, parent=None):
+        super().__init__(parent)
+        self._options = normalize_options(options)
+        self._rows = None
+        self._value_index = None
+        self._has_unhashable = False
+
+    # -- data --------------------------------------------------------------
+    def options(self) -> list:
+        return self._options
+
+    def set_options(self, options):
+        self.beginResetModel()
+        self._options = normalize_options(options)
+        self._rows = None
+        # rebuilt on the next lookup, so bulk replacement stays one pass
+        self._value_index = None
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Show only the source rows in `rows` (in that order); None shows all."""
+        if rows is None and self._rows is None:
+            return
+        self.beginResetModel()
+        self._rows = None if rows is None else list(rows)
+        self.endResetModel()
+
+    def is_filtered(self) -> bool:
+        return self._rows is not None
+
+    def source_row(self, row: int) -> int:
+        return row if self._rows is None else self._rows[row]
+
+    def option(self, row: int):
+        """Return the ``(value, label)`` option shown at view row `row`."""
+        return self._options[self.source_row(row)]
+
+    def row_for_value(self, value):
+        """Return the option index (source row) holding `value`, or None."""
+        if self._value_index is None:
+            self._value_index = {}
+            self._has_unhashable = index_values(self._value_index, self._options)
+        return lookup_value(self._value_index, self._has_unhashable, self._options, value)
+
+    # -- QAbstractListModel ------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._options) if self._rows is None else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value, label = self.option(index.row())
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return label
+        if role == Qt.UserRole:
+            return value
+        return None
+
+
+def provider_fetch(provider):
+    """Return the ``fetch(query, offset, limit)`` callable of `provider`.
+
+    A provider is either such a callable or an object with a ``fetch``
+    method. It returns up to ``limit`` options (plain values or
+    ``(value, label)`` tuples) matching ``query``, starting at ``offset``;
+    returning fewer than ``limit`` marks the end of the results. ``fetch``
+    may also be a coroutine function.
+
+    By default each awaited page runs in a fresh event loop (``asyncio.run``)
+    on a pool thread, which breaks clients bound to another loop, such as an
+    aiohttp session. Pass that loop as `PagedOptionModel(loop=...)` (or to
+    the widgets' ``set_provider``) to run the coroutines there instead.
+    """
+    fetch = getattr(provider, "fetch", None)
+    return fetch if fetch is not None else provider
+
+
+class _PageSignals(QObject):
+    """Carries pages fetched by async providers back to the GUI thread."""
+    loaded = Signal(int, int, object)
+    failed = Signal(int, str)
+
+
+def _emit_page(signals, generation: int, offset: int, future):
+    """Report a finished page future through `signals` (any thread)."""
+    try:
+        if future.cancelled():
+            signals.failed.emit(generation, "page request was cancelled")
+        elif future.exception() is not None:
+            signals.failed.emit(generation, str(future.exception()))
+        else:
+            signals.loaded.emit(generation, offset, future.result())
+    except RuntimeError:
+        # the model was deleted while the page was in flight
+        pass
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+class _PageTask(QRunnable):
+    """Awaits an async provider's page on a `QThreadPool` worker."""
+    def __init__(self, awaitable, generation: int, offset: int, signals: _PageSignals):
+        super().__init__()
+        self._awaitable = awaitable
+        self._generation = generation
+        self._offset = offset
+        self._signals = signals
+
+    def run(self):
+        # asyncio is only needed once an async provider is used; importing
+        # it with the module would slow down every widget import
+        import asyncio
+
+        try:
+            options = asyncio.run(_await(self._awaitable))
+        except Exception as exc:  # reported to the GUI thread, not raised here
+            self._emit(self._signals.failed, self._generation, str(exc))
+            return
+        self._emit(self._signals.loaded, self._generation, self._offset, options)
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # the model was deleted while the page was in flight
+            pass
+
+
+class PagedOptionModel(QAbstractListModel):
+    """A list model that loads ``(value, label)`` options page by page.
+
+    Rows are fetched from `provider` (see `provider_fetch`) only when a view
+    asks for more through `canFetchMore`/`fetchMore`, so opening a form does
+    not read the whole option source. `set_query(query)` restarts paging for
+    a new query. The last `cache_pages` pages are kept, keyed by
+    ``(query, offset)``, so retyping a recent query does not hit the provider
+    again; call `invalidate()` when the source data changes.
+
+    Synchronous providers are called inline. Awaitables returned by async
+    providers run on the global `QThreadPool` with their own event loop, or
+    on `loop` (a running asyncio loop, usually in another thread) when one
+    is given; pages for a superseded query are dropped when they arrive.
+
+    - `Qt.DisplayRole` returns the label, `Qt.UserRole` the value
+    - `fetch_failed(message)` is emitted when the provider raises
+    """
+    fetch_failed = Signal(str)
+
+    def __init__(self, provider, page_size: int = DEFAULT_PAGE_SIZE, cache_pages: int = DEFAULT_CACHED_PAGES,
+                 parent=None, loop=None):
+        super().__init__(parent)
+        self._fetch = provider_fetch(provider)
+        self._loop = loop
+        self.page_size = max(1, page_size)
+        self._cache_pages = cache_pages
+        self._cache = OrderedDict()
+        self._query = ""
+        self._options = []
+        self._value_index = {}
+        self._has_unhashable = False
+        self._exhausted = False
+        self._loading = False
+        self._inserting = False
+        self._fetch_enabled = True
+        self._generation = 0
+        self._signals = _PageSignals(self)
+        self._signals.loaded.connect(self._on_page_loaded)
+        self._signals.failed.connect(self._on_page_failed)
+
+    # -- data --------------------------------------------------------------
+    def query(self) -> str:
+        return self._query
+
+    def set_query(self, query: str):
+        """Drop the loaded rows and start paging results for `query`."""
+        # views fetch on reset too; only the first page below is requested
+        self._inserting = True
+        try:
+            self.beginResetModel()
+            self._generation += 1
+            self._query = query
+            self._options = []
+            self._value_index = {}
+            self._has_unhashable = False
+            self._exhausted = False
+            self._loading = False
+            self.endResetModel()
+        finally:
+            self._inserting = False
+        self.fetchMore()
+
+    def invalidate(self):
+        """Forget cached pages and reload the current query."""
+        self._cache.clear()
+        self.set_query(self._query)
+
+    def options(self) -> list:
+        """Return the options loaded so far."""
+        return self._options
+
+    def is_loading(self) -> bool:
+        return self._loading
+
+    def is_exhausted(self) -> bool:
+        return self._exhausted
+
+    def source_row(self, row: int) -> int:
+        return row
+
+    def option(self, row: int):
+        """Return the ``(value, label)`` option shown at view row `row`."""
+        return self._options[row]
+
+    def row_for_value(self, value):
+        """Return the row of a loaded option holding `value`, or None."""
+        return lookup_value(self._value_index, self._has_unhashable, self._options, value)
+
+    # -- paging ------------------------------------------------------------
+    def set_fetch_enabled(self, enabled: bool):
+        """Allow or refuse page requests, e.g. while attaching the model.
+
+        QComboBox and QCompleter fetch from a model they are given until it
+        stops offering more, which would load several pages up front.
+        """
+        self._fetch_enabled = enabled
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._inserting or not self._fetch_enabled:
+            # views re-check while rows are inserted; one page per request
+            return False
+        return not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        generation, offset = self._generation, len(self._options)
+        key = (self._query, offset)
+        page = self._cache.get(key)
+        if page is not None:
+            self._cache.move_to_end(key)
+            self._append_page(offset, page)
+            return
+        self._loading = True
+        try:
+            result = self._fetch(self._query, offset, self.page_size)
+        except Exception as exc:
+            self._on_page_failed(generation, str(exc))
+            return
+        if inspect.isawaitable(result):
+            if self._loop is None:
+                QThreadPool.globalInstance().start(_PageTask(result, generation, offset, self._signals))
+                return
+            import asyncio
+
+            coroutine = result if inspect.iscoroutine(result) else _await(result)
+            future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+            signals = self._signals
+            future.add_done_callback(lambda f: _emit_page(signals, generation, offset, f))
+            return
+        self._on_page_loaded(generation, offset, result)
+
+    def _on_page_loaded(self, generation: int, offset: int, options):
+        if generation != self._generation or offset != len(self._options):
+            # page for a query that has since been replaced
+            return
+        self._loading = False
+        page = normalize_options(options)
+        self._cache[(self._query, offset)] = page
+        while len(self._cache) > self._cache_pages:
+            self._cache.popitem(last=False)
+        self._append_page(offset, page)
+
+    def _on_page_failed(self, generation: int, message: str):
+        if generation != self._generation:
+            return
+        self._loading = False
+        # stop paging until the query changes or `invalidate()` is called
+        self._exhausted = True
+        self.fetch_failed.emit(message)
+
+    def _append_page(self, offset: int, page: list):
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if not page:
+            return
+        self._inserting = True
+        try:
+            self.beginInsertRows(QModelIndex(), offset, offset + len(page) - 1)
+            self._options.extend(page)
+            if index_values(self._value_index, page, offset):
+                self._has_unhashable = True
+            self.endInsertRows()
+        finally:
+            self._inserting = False
+
+    # -- QAbstractListModel ------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._options)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value, label = self._options[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return label
+        if role == Qt.UserRole:
+            return value
+        return None
@@ -0,0 +1,83 @@
+"""Radio button widgets: `StyledRadioButton` and `RadioGroup`."""
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QButtonGroup, QHBoxLayout, QRadioButton, QVBoxLayout, QWidget
+
+
+class StyledRadioButton(QRadioButton):
+    """A thin subclass of QRadioButton to centralize styling for the library.
+
+    We keep it minimal: primarily a hook to apply a shared stylesheet later.
+    """
+    def __init__(self, label: str = "", parent=None):
+        super().__init__(label, parent)
+
+
+class RadioGroup(QWidget):
+    """A simple radio-button group component.
+
+    - Use `set_options(items)` where items is list[str] or list[(value,label)]
+    - Emits `selection_changed(value)` when selection changes
+    - Methods: set_value(value), get_value()
+    """
+    selection_changed = Signal(object)
+
+    def __init__(self, items: list = None, orientation: Qt = Qt.Vertical, parent=None):
+        super().__init__(parent)
+        self._layout = QVBoxLayout() if orientation == Qt.Vertical else QHBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        self._button_group = QButtonGroup(self)
+        self._button_group.setExclusive(True)
+        self._id_to_value = {}
+        self._value_to_id = {}
+
+        if items:
+            self.set_options(items)
+
+        self._button_group.idToggled.connect(self._on_id_toggled)
+
+    def set_options(self, items: list):
+        # clear existing buttons
+        for i in reversed(range(self._layout.count())):
+            w = self._layout.itemAt(i).widget()
+            if w:
+                self._layout.removeWidget(w)
+                w.setParent(None)
+
+        self._id_to_value.clear()
+        self._value_to_id.clear()
+        self._button_group = type(self._button_group)(self)
+        self._button_group.setExclusive(True)
+
+        for idx, it in enumerate(items):
+            if isinstance(it, tuple) and len(it) >= 2:
+                val, lbl = it[0], str(it[1])
+            else:
+                val, lbl = it, str(it)
+            btn = StyledRadioButton(lbl)
+            self._layout.addWidget(btn)
+            self._button_group.addButton(btn, idx)
+            self._id_to_value[idx] = val
+            self._value_to_id[val] = idx
+
+    def _on_id_toggled(self, id_, checked):
+        if checked:
+            val = self._id_to_value.get(id_)
+            self.selection_changed.emit(val)
+
+    def set_value(self, value):
+        idx = self._value_to_id.get(value)
+        if idx is not None:
+            btn = self._button_group.button(idx)
+            if btn:
+                btn.setChecked(True)
+                return True
+        return False
+
+    def get_value(self):
+        btn = self._button_group.checkedButton()
+        if btn is None:
+            return None
+        id_ = self._button_group.id(btn)
+        return self._id_to_value.get(id_)
@@ -0,0 +1,571 @@
+"""Selection widgets: `SearchableSelect` and `StyledComboBox`.
+
+Both keep their options in the item models from `bfs_component.ui.models`
+and filter through `bfs_component.ui.filtering`.
+"""
+from PySide6.QtCore import (
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QCompleter,
+    QHBoxLayout,
+    QLineEdit,
+    QListView,
+    QToolButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from bfs_component.ui.filtering import OptionFilter
+from bfs_component.ui.inputs import StyledLineEdit
+from bfs_component.ui.models import DEFAULT_PAGE_SIZE, OptionListModel, PagedOptionModel
+
+
+class _FilterSignals(QObject):
+    """Carries background filter results back to the GUI thread."""
+    finished = Signal(int, object)
+
+
+class _FilterTask(QRunnable):
+    """Runs `OptionFilter.filter` on a `QThreadPool` worker.
+
+    `is_current(generation)` is checked before the scan starts so queries
+    that were superseded while queued are skipped entirely.
+    """
+    def __init__(self, option_filter, query: str, generation: int, signals: _FilterSignals, is_current):
+        super().__init__()
+        self._filter = option_filter
+        self._query = query
+        self._generation = generation
+        self._signals = signals
+        self._is_current = is_current
+
+    def run(self):
+        if not self._is_current(self._generation):
+            return
+        rows = self._filter.filter(self._query)
+        try:
+            self._signals.finished.emit(self._generation, rows)
+        except RuntimeError:
+            # the select was deleted while the scan was running
+            pass
+
+
+class SearchableSelect(QWidget):
+    """A combo-like widget with a text input and a filtered drop-down list.
+
+    - Provide a list of options (sequence of strings or (value, label) tuples)
+    - Typing filters visible options (case-insensitive, substring match)
+    - Arrow keys navigate, Enter selects, clicking selects
+    - Emits `selection_changed` with the selected value (label if string list)
+
+    The drop-down is a `QListView` over an `OptionListModel`: options are
+    stored once and filtering only changes the model's row mapping, so large
+    option lists do not create one item per option.
+
+    Filtering runs inline for small option lists. From `background_threshold`
+    options up, keystrokes are debounced by `filter_delay_ms` (default
+    `DEFAULT_FILTER_DELAY_MS` when None) and the scan runs on the global
+    `QThreadPool`; every query gets a generation number and only the result
+    for the latest one reaches the popup.
+
+    With `fuzzy=True` matching is typo-tolerant: a trigram index is built
+    once per option set and the popup shows the `fuzzy_limit` best matches,
+    ranked by similarity.
+
+    Instead of `options`, a `provider` with ``fetch(query, offset, limit)``
+    (sync or async, see `models.provider_fetch`) can supply the options: the
+    popup then pages results in through a `PagedOptionModel` as it scrolls,
+    and the typed text is passed to the provider as the query.
+    """
+    selection_changed = Signal(object)
+
+    DEFAULT_FILTER_DELAY_MS = 120
+    DEFAULT_BACKGROUND_THRESHOLD = 20000
+
+    def __init__(self, options: list = None, placeholder: str = "", parent=None, show_all_on_focus: bool = True,
+                 filter_delay_ms: int = None, background_threshold: int = DEFAULT_BACKGROUND_THRESHOLD,
+                 fuzzy: bool = False, fuzzy_limit: int = 50, provider=None, page_size: int = DEFAULT_PAGE_SIZE):
+        super().__init__(parent)
+        self._list_model = OptionListModel(options)
+        self._model = self._list_model
+        self._raw_options = self._list_model.options()
+        self._filter = OptionFilter([label for _, label in self._raw_options], fuzzy=fuzzy, fuzzy_limit=fuzzy_limit)
+        self._current = None
+        self._popup_wanted = False
+
+        self._filter_delay_ms = filter_delay_ms
+        self._background_threshold = background_threshold
+        self._filter_generation = 0
+        self._pending_query = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._run_pending_filter)
+        self._filter_signals = _FilterSignals(self)
+        self._filter_signals.finished.connect(self._on_filter_finished)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # input with a trailing dropdown button to mimic a combobox
+        h = QHBoxLayout()
+        h.setContentsMargins(0, 0, 0, 0)
+        self._input = QLineEdit()
+        self._input.setPlaceholderText(placeholder)
+        h.addWidget(self._input)
+
+        self._button = QToolButton()
+        self._button.setText("\u25BE")  # down arrow
+        self._button.setCursor(self._input.cursor())
+        self._button.setFocusPolicy(Qt.NoFocus)
+        h.addWidget(self._button)
+
+        layout.addLayout(h)
+
+        # use a popup list so options only appear while focus is on the select;
+        # uniform item sizes let the view lay out and paint only visible rows
+        self._popup = QListView(None)
+        self._popup.setWindowFlags(Qt.Popup)
+        self._popup.setFocusPolicy(Qt.StrongFocus)
+        self._popup.setUniformItemSizes(True)
+        self._popup.setMaximumHeight(200)
+        self._popup.setModel(self._model)
+        if provider is not None:
+            self.set_provider(provider, page_size)
+
+        self.setLayout(layout)
+
+        # signals and behavior
+        self._show_all_on_focus = show_all_on_focus
+        self._input.textChanged.connect(self._on_text_changed)
+        # wrap keypress
+        self._input.keyPressEvent = self._input_keypress_wrapper(self._input.keyPressEvent)
+        self._popup.clicked.connect(self._on_index_clicked)
+        self._button.clicked.connect(self.toggle_popup)
+
+        # forward typing from the popup to the input and hide on focus loss
+        self._popup.installEventFilter(self)
+
+        if self._show_all_on_focus:
+            orig_focus_in = getattr(self._input, 'focusInEvent', None)
+
+            def _focus_in(event):
+                # show all options when focused
+                self._show_all()
+                self._show_popup()
+                if orig_focus_in:
+                    return orig_focus_in(event)
+
+            self._input.focusInEvent = _focus_in
+
+        # ensure input losing focus hides popup unless popup itself gets focus
+        orig_focus_out = getattr(self._input, 'focusOutEvent', None)
+
+        def _focus_out(event):
+            # schedule check after focus changes
+            QTimer.singleShot(0, self._hide_if_focus_lost)
+            if orig_focus_out:
+                return orig_focus_out(event)
+
+        self._input.focusOutEvent = _focus_out
+
+    def set_options(self, options: list):
+        """Replace the options (strings or (value, label) tuples).
+
+        Also switches back from a provider to an in-memory option list.
+        """
+        self._drop_pending_filter()
+        self._list_model.set_options(options)
+        self._raw_options = self._list_model.options()
+        self._filter.set_labels([label for _, label in self._raw_options])
+        self._current = None
+        self._set_model(self._list_model)
+        if self._input.text():
+            self._model.set_rows(self._filter_rows(self._input.text()))
+
+    def set_provider(self, provider, page_size: int = DEFAULT_PAGE_SIZE, loop=None):
+        """Load options on demand from `provider` instead of a fixed list.
+
+        `loop` is the asyncio loop async providers must run on, if any (see
+        `models.provider_fetch`).
+        """
+        model = PagedOptionModel(provider, page_size, parent=self, loop=loop)
+        model.rowsInserted.connect(self._on_rows_loaded)
+        self._drop_pending_filter()
+        self._current = None
+        self._set_model(model)
+
+    def _drop_pending_filter(self):
+        # results of queued or running scans refer to the old option rows
+        self._filter_timer.stop()
+        self._filter_generation += 1
+
+    def _set_model(self, model):
+        old = self._model
+        if model is old:
+            return
+        self._model = model
+        self._popup.setModel(model)
+        if old is not self._list_model:
+            old.deleteLater()
+
+    def _uses_provider(self) -> bool:
+        return self._model is not self._list_model
+
+    def _show_all(self):
+        if self._uses_provider():
+            if self._model.query() or self._model.rowCount() == 0:
+                self._model.set_query("")
+        else:
+            self._model.set_rows(None)
+
+    def set_fuzzy(self, enabled: bool = True, limit: int = None):
+        """Toggle typo-tolerant, ranked matching (see class docstring)."""
+        self._filter.set_fuzzy(enabled, limit)
+        if self._input.text():
+            self._on_text_changed(self._input.text())
+
+    def _filter_rows(self, txt: str):
+        """Return the source rows matching `txt`, or None for all options."""
+        return self._filter.filter(txt)
+
+    def _uses_background_filter(self) -> bool:
+        return not self._uses_provider() and len(self._raw_options) >= self._background_threshold
+
+    def _filter_delay(self) -> int:
+        if self._filter_delay_ms is not None:
+            return self._filter_delay_ms
+        # provider queries usually hit a database, so debounce them too
+        slow = self._uses_provider() or self._uses_background_filter()
+        return self.DEFAULT_FILTER_DELAY_MS if slow else 0
+
+    def _on_text_changed(self, txt: str):
+        # any newer keystroke invalidates queued or running scans
+        self._filter_generation += 1
+        self._pending_query = txt
+        delay = self._filter_delay()
+        if delay > 0:
+            self._filter_timer.start(delay)
+        else:
+            self._run_pending_filter()
+
+    def _run_pending_filter(self):
+        txt = self._pending_query
+        generation = self._filter_generation
+        if self._uses_provider():
+            self._model.set_query(txt.strip())
+            self._apply_filter_result(None)
+            return
+        if not self._uses_background_filter() or not OptionFilter.normalize(txt):
+            self._apply_filter_result(self._filter_rows(txt))
+            return
+        task = _FilterTask(self._filter, txt, generation, self._filter_signals, self._is_current_generation)
+        QThreadPool.globalInstance().start(task)
+
+    def _is_current_generation(self, generation: int) -> bool:
+        return generation == self._filter_generation
+
+    def _on_filter_finished(self, generation: int, rows):
+        if generation != self._filter_generation:
+            # stale result for a query the user has already typed past
+            return
+        self._apply_filter_result(rows)
+
+    def _apply_filter_result(self, rows):
+        if not self._uses_provider():
+            self._model.set_rows(rows)
+        if self._model.rowCount() > 0:
+            self._show_popup()
+        else:
+            self._popup.hide()
+            # an async provider may still deliver the first page
+            self._popup_wanted = self._uses_provider() and self._model.is_loading()
+
+    def _on_rows_loaded(self, parent, first, last):
+        if self._popup_wanted and first == 0:
+            self._popup_wanted = False
+            self._show_popup()
+
+    def _show_popup(self):
+        if self._model.rowCount() == 0:
+            self._popup_wanted = self._uses_provider() and self._model.is_loading()
+            return
+        pos = self.mapToGlobal(QPoint(0, self.height()))
+        self._popup.setFixedWidth(max(self.width(), 120))
+        self._popup.move(pos)
+        self._popup.show()
+
+    def _hide_if_focus_lost(self):
+        focused = QApplication.focusWidget()
+        if focused is not self._input and focused is not self._popup:
+            self._popup.hide()
+
+    def eventFilter(self, obj, event):
+        # the popup can outlive the Python side during teardown
+        popup = getattr(self, "_popup", None)
+        if popup is not None and obj is popup and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                idx = self._popup.currentIndex()
+                if idx.isValid():
+                    self._select_row(idx.row())
+                return True
+            if key == Qt.Key_Escape:
+                self._popup.hide()
+                return True
+            if key not in (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Home, Qt.Key_End):
+                # keep typing in the input while the popup is open
+                self._input.event(event)
+                return True
+        return super().eventFilter(obj, event)
+
+    def _input_keypress_wrapper(self, orig):
+        def _wrapper(event):
+            key = event.key()
+            if key in (Qt.Key_Down, Qt.Key_Up):
+                # navigate the popup list
+                if not self._popup.isVisible():
+                    self._show_popup()
+                count = self._model.rowCount()
+                cur = self._popup.currentIndex().row()
+                if key == Qt.Key_Down:
+                    cur = min(count - 1, cur + 1) if cur >= 0 else 0
+                else:
+                    cur = max(0, cur - 1) if cur >= 0 else max(0, count - 1)
+                self._popup.setCurrentIndex(self._model.index(cur))
+                return
+            if key == Qt.Key_Return or key == Qt.Key_Enter:
+                idx = self._popup.currentIndex()
+                if idx.isValid():
+                    self._select_row(idx.row())
+                return
+            # default
+            return orig(event)
+
+        return _wrapper
+
+    def _on_index_clicked(self, index):
+        self._select_row(index.row())
+
+    def toggle_popup(self):
+        if self._popup.isVisible():
+            self._popup.hide()
+        else:
+            # show all options
+            self._show_all()
+            self._show_popup()
+
+    # Combobox-like convenience API
+    def set_current_value(self, value):
+        """Select the option holding `value`, even if the filter hides it.
+
+        Looks the value up in the model's hashed value index, so this is O(1)
+        rather than a scan over the options. With a provider, only options
+        loaded so far can be found.
+        """
+        row = self._model.row_for_value(value)
+        if row is None:
+            return False
+        self._select_option(self._model.options()[row])
+        return True
+
+    def get_current_value(self):
+        return self.current_value()
+
+    def _select_row(self, row: int):
+        self._select_option(self._model.option(row))
+
+    def _select_option(self, option):
+        self._current = option
+        val, label = option
+        self._popup_wanted = False
+        # the label is not a new query: keep textChanged from filtering all
+        # options for it, and drop any filter still pending for typed text
+        self._drop_pending_filter()
+        with QSignalBlocker(self._input):
+            self._input.setText(label)
+        self._popup.hide()
+        self.selection_changed.emit(val)
+
+    def current_value(self):
+        # return value of current selection if any
+        if self._current is None:
+            return None
+        return self._current[0]
+
+
+class StyledComboBox(QWidget):
+    """A combobox-like component built from QComboBox (editable) + StyledLineEdit.
+
+    - Uses Qt's QCompleter for inline filtering and navigation
+    - Provides `set_items(items)` where items is list[str] or list[(val,label)]
+    - The combobox and its completer share one `OptionListModel`, so items
+      are stored once and `set_items` is a single model reset
+    - `set_provider(provider)` loads items on demand instead (see
+      `models.provider_fetch`); the drop-down pages items in as it scrolls
+      and completions are queried from the provider as the user types
+    - Emits `selection_changed(value)` when an item is selected
+    """
+    selection_changed = Signal(object)
+
+    DEFAULT_QUERY_DELAY_MS = 120
+
+    def __init__(self, items: list[str] | list[tuple] = None, parent=None, provider=None,
+                 page_size: int = DEFAULT_PAGE_SIZE):
+        super().__init__(parent)
+        self._combobox = QComboBox()
+        self._combobox.setEditable(True)
+        # replace line edit with StyledLineEdit for consistent styling
+        self._input = StyledLineEdit()
+        self._combobox.setLineEdit(self._input)
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._combobox)
+        self.setLayout(layout)
+
+        self._model = OptionListModel(parent=self)
+        self._combobox.setModel(self._model)
+        self._completer = QCompleter(self._model, self)
+        self._completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._combobox.setCompleter(self._completer)
+
+        self._completion_model = None
+        self._completed = None
+        # debounces provider completion queries; reused across providers
+        self._query_timer = QTimer(self)
+        self._query_timer.setSingleShot(True)
+        self._query_timer.timeout.connect(self._run_completion_query)
+        if items:
+            self.set_items(items)
+        if provider is not None:
+            self.set_provider(provider, page_size)
+
+        self._combobox.activated.connect(self._on_activated)
+
+    @property
+    def _items(self) -> list:
+        return self._model.options()
+
+    def set_items(self, items: list):
+        # store as list of (value,label); one reset updates the combobox
+        # and the completer, which share the model
+        self._clear_provider()
+        self._model.set_options(items)
+        if self._model.rowCount() > 0:
+            # keep QComboBox.addItem's behaviour of selecting the first item
+            self._combobox.setCurrentIndex(0)
+
+    def set_provider(self, provider, page_size: int = DEFAULT_PAGE_SIZE, loop=None):
+        """Load items page by page from `provider` instead of a fixed list.
+
+        Only the first page is requested up front. The completer gets its own
+        `PagedOptionModel` whose query follows the typed text (debounced by
+        `DEFAULT_QUERY_DELAY_MS`), so completions are not limited to the pages
+        the drop-down has loaded so far. `loop` is the asyncio loop async
+        providers must run on, if any (see `models.provider_fetch`).
+        """
+        self._clear_provider()
+        self._model.set_options([])
+        model = PagedOptionModel(provider, page_size, parent=self, loop=loop)
+        # attached with paging off, or the combobox and the completer would
+        # each fetch pages from their new model right away
+        model.set_fetch_enabled(False)
+        self._combobox.setModel(model)
+        model.set_fetch_enabled(True)
+        model.fetchMore()
+
+        # the completer's model loads once the user types a query
+        completions = PagedOptionModel(provider, page_size, parent=self, loop=loop)
+        completions.rowsInserted.connect(self._on_completions_loaded)
+        self._completion_model = completions
+        completions.set_fetch_enabled(False)
+        self._completer.setModel(completions)
+        completions.set_fetch_enabled(True)
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.activated[QModelIndex].connect(self._on_completion_activated)
+        self._input.textEdited.connect(self._on_text_edited)
+
+    def _clear_provider(self):
+        completions = self._completion_model
+        if completions is None:
+            return
+        self._input.textEdited.disconnect(self._on_text_edited)
+        self._completer.activated[QModelIndex].disconnect(self._on_completion_activated)
+        self._completer.setCompletionMode(QCompleter.PopupCompletion)
+        self._query_timer.stop()
+        paged = self._combobox.model()
+        self._combobox.setModel(self._model)
+        self._completer.setModel(self._model)
+        paged.deleteLater()
+        completions.deleteLater()
+        self._completion_model = None
+        self._completed = None
+
+    def _on_text_edited(self, txt: str):
+        self._completed = None
+        self._query_timer.start(self.DEFAULT_QUERY_DELAY_MS)
+
+    def _run_completion_query(self):
+        if self._completion_model is None:
+            return
+        self._completion_model.set_query(self._input.text().strip())
+
+    def _on_completions_loaded(self, parent, first, last):
+        if first == 0 and self._input.hasFocus():
+            self._completer.complete()
+
+    def _on_completion_activated(self, index):
+        value = index.data(Qt.UserRole)
+        idx = self._combobox.currentIndex()
+        if idx >= 0 and self._combobox.itemData(idx) == value:
+            # the item was already loaded; QComboBox emitted `activated` itself
+            return
+        self._completed = (value, index.data(Qt.DisplayRole))
+        self.selection_changed.emit(value)
+
+    def _on_activated(self, index_or_text):
+        # QComboBox.activated can send either index or text depending on usage
+        if isinstance(index_or_text, int):
+            val = self._combobox.itemData(index_or_text)
+            self.selection_changed.emit(val)
+        else:
+            # find matching label
+            txt = str(index_or_text)
+            for val, lbl in self._items:
+                if lbl == txt:
+                    self.selection_changed.emit(val)
+                    return
+
+    def current_value(self):
+        completed = self._completed
+        if completed is not None and completed[1] == self._combobox.currentText():
+            # picked from provider completions that the drop-down has not loaded
+            return completed[0]
+        idx = self._combobox.currentIndex()
+        if idx >= 0:
+            return self._combobox.itemData(idx)
+        # fall back to text
+        return self._combobox.currentText()
+
+    def set_current_value(self, value):
+        # O(1) lookup in the model's value index (only loaded pages with a
+        # provider); the combobox shows every model row, so rows match
+        row = self._combobox.model().row_for_value(value)
+        if row is not None:
+            self._combobox.setCurrentIndex(row)
+            return True
+        # fallback: set text
+        self._combobox.setCurrentText(str(value))
+        return False
@@ -0,0 +1,100 @@
+"""Cached drop shadows painted from a pre-blurred nine-slice pixmap.
+
+A `QGraphicsDropShadowEffect` renders the whole widget offscreen and blurs it
+on every repaint. A rounded-rect shadow only depends on its blur radius,
+corner radius, color and device pixel ratio, so it is blurred once into a
+small pixmap (`shadow_pixmap`) and `paint_shadow` stretches that pixmap's
+edges around any rectangle: corners are drawn as is, edges are stretched and
+the centre, which the shadowed widget covers, is skipped.
+"""
+from collections import OrderedDict
+
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene
+
+_SHADOW_CACHE_SIZE = 8
+_shadow_cache = OrderedDict()
+
+
+def clear_shadow_cache():
+    """Drop all cached shadow pixmaps."""
+    _shadow_cache.clear()
+
+
+def _blurred_rounded_rect(size: int, blur_radius: float, corner_radius: float, color: QColor) -> QImage:
+    shape = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color)
+    inset = blur_radius
+    painter.drawRoundedRect(QRectF(inset, inset, size - 2 * inset, size - 2 * inset), corner_radius, corner_radius)
+    painter.end()
+
+    # blur once through a throwaway scene; only runs on a cache miss
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur_radius)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    blurred = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.transparent)
+    painter = QPainter(blurred)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    painter.end()
+    return blurred
+
+
+def shadow_pixmap(blur_radius: int, corner_radius: int, color: QColor, dpr: float = 1.0) -> QPixmap:
+    """Return the cached nine-slice source for a rounded-rect shadow.
+
+    The pixmap is ``2 * (blur_radius + corner_radius) + 1`` logical pixels
+    square: each corner slice is ``blur_radius + corner_radius`` wide and a
+    1px middle row and column are stretched along the edges.
+    """
+    color = QColor(color)
+    key = (blur_radius, corner_radius, color.rgba(), dpr)
+    pixmap = _shadow_cache.get(key)
+    if pixmap is not None:
+        _shadow_cache.move_to_end(key)
+        return pixmap
+    size = 2 * (blur_radius + corner_radius) + 1
+    image = _blurred_rounded_rect(max(1, round(size * dpr)), blur_radius * dpr, corner_radius * dpr, color)
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    _shadow_cache[key] = pixmap
+    if len(_shadow_cache) > _SHADOW_CACHE_SIZE:
+        _shadow_cache.popitem(last=False)
+    return pixmap
+
+
+def paint_shadow(painter: QPainter, rect: QRectF, blur_radius: int, corner_radius: int, color: QColor,
+                 offset: QPointF = QPointF(0, 0), dpr: float = 1.0):
+    """Paint the shadow of `rect` (moved by `offset`) from the cached pixmap.
+
+    Only the eight border slices are drawn; the centre lies under `rect`.
+    """
+    pixmap = shadow_pixmap(blur_radius, corner_radius, color, dpr)
+    corner = blur_radius + corner_radius
+    target = QRectF(rect).translated(offset).adjusted(-blur_radius, -blur_radius, blur_radius, blur_radius)
+    if target.width() < 2 * corner or target.height() < 2 * corner:
+        return
+    # source and target edges per axis: (offset, length) for start, middle, end
+    src = ((0, corner), (corner, 1), (corner + 1, corner))
+    xs = ((target.left(), corner), (target.left() + corner, target.width() - 2 * corner),
+          (target.right() - corner, corner))
+    ys = ((target.top(), corner), (target.top() + corner, target.height() - 2 * corner),
+          (target.bottom() - corner, corner))
+    for row in range(3):
+        for col in range(3):
+            if row == 1 and col == 1:
+                continue
+            painter.drawPixmap(
+                QRectF(xs[col][0], ys[row][0], xs[col][1], ys[row][1]),
+                pixmap,
+                QRectF(src[col][0] * dpr, src[row][0] * dpr, src[col][1] * dpr, src[row][1] * dpr),
+            )
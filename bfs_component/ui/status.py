@@ -0,0 +1,169 @@
+"""Thread-safe, rate-limited status messages: `StatusChannel`.
+
+Background jobs may report progress hundreds of times per second and from
+any thread. `StatusChannel.post` only records the message under a lock and
+wakes the GUI thread once; the GUI thread then shows the newest message at
+most `max_rate` times per second. A message is only replaced by one of equal
+or higher priority until it expires, and a sticky message (e.g. "Ready") is
+shown whenever no other message is.
+
+Example:
+    channel = StatusChannel(status_bar)
+    channel.set_sticky("Ready")
+    channel.post(f"Visited {count} nodes")             # from any thread
+    channel.post("Export failed", timeout=5000, priority=10)
+"""
+import threading
+import time
+from typing import NamedTuple
+
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal
+
+DEFAULT_MAX_RATE = 10
+
+
+class StatusMessage(NamedTuple):
+    text: str
+    timeout: int = 0
+    priority: int = 0
+
+
+class StatusChannel(QObject):
+    """Shows status messages posted from any thread on a `QStatusBar`.
+
+    - `post(message, timeout=0, priority=0)` queues a message; timeout in
+      milliseconds, 0 keeps it until it is replaced or cleared
+    - `set_sticky(message)` sets the message shown when nothing else is
+    - `clear()` drops the current and queued messages
+    - Emits `message_changed(text)` on the GUI thread when the shown text
+      changes
+
+    Posts are coalesced: only the newest message of the highest queued
+    priority is shown when the next update is due; lower priorities keep
+    their newest message for when it expires, and updates happen at most
+    `max_rate` times per second. One timer handles both the rate limit and
+    message expiry.
+    """
+    message_changed = Signal(str)
+    _wake = Signal()
+
+    def __init__(self, status_bar=None, max_rate: int = DEFAULT_MAX_RATE, parent=None):
+        super().__init__(parent)
+        self._status_bar = status_bar
+        self._interval = 1.0 / max(1, max_rate)
+        # shared with posting threads, guarded by _lock
+        self._lock = threading.Lock()
+        # newest queued message per priority
+        self._pending = {}
+        self._pending_sticky = None
+        self._pending_clear = False
+        self._woken = False
+        # GUI thread state
+        self._current = None
+        self._expires = None
+        self._sticky = ""
+        self._shown = ""
+        self._last_update = float("-inf")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._update)
+        self._wake.connect(self._update, Qt.QueuedConnection)
+
+    def set_max_rate(self, max_rate: int):
+        """Change the maximum number of status updates per second."""
+        self._interval = 1.0 / max(1, max_rate)
+
+    def current_message(self) -> str:
+        """Return the text currently shown (GUI thread)."""
+        return self._shown
+
+    def post(self, message: str, timeout: int = 0, priority: int = 0):
+        """Queue `message`; safe to call from any thread."""
+        message = StatusMessage(str(message), max(0, int(timeout or 0)), priority)
+        with self._lock:
+            self._pending[message.priority] = message
+        self._notify()
+
+    def set_sticky(self, message: str):
+        """Set the fallback message shown when no other message is; any thread."""
+        with self._lock:
+            self._pending_sticky = str(message or "")
+        self._notify()
+
+    def clear(self):
+        """Drop the shown and queued messages, falling back to the sticky one."""
+        with self._lock:
+            self._pending.clear()
+            self._pending_clear = True
+        self._notify()
+
+    def flush(self):
+        """Apply queued messages now, ignoring the rate limit (GUI thread)."""
+        self._last_update = float("-inf")
+        self._update()
+
+    def _notify(self):
+        if QThread.currentThread() is self.thread():
+            self._update()
+            return
+        with self._lock:
+            if self._woken:
+                return
+            self._woken = True
+        try:
+            self._wake.emit()
+        except RuntimeError:
+            # the channel was deleted while a worker was still posting
+            pass
+
+    def _update(self):
+        now = time.monotonic()
+        due = self._last_update + self._interval
+        if self._current is not None and self._expires is not None and self._expires <= now:
+            self._current = None
+            self._expires = None
+        with self._lock:
+            self._woken = False
+            take = now >= due
+            if take:
+                if self._pending_clear:
+                    self._current = None
+                    self._expires = None
+                    self._pending_clear = False
+                if self._pending_sticky is not None:
+                    self._sticky = self._pending_sticky
+                    self._pending_sticky = None
+                if self._pending:
+                    priority = max(self._pending)
+                    if self._current is None or priority >= self._current.priority:
+                        message = self._pending.pop(priority)
+                        self._current = message
+                        self._expires = now + message.timeout / 1000 if message.timeout else None
+            has_pending = bool(self._pending) or self._pending_sticky is not None or self._pending_clear
+        self._show(self._current.text if self._current is not None else self._sticky, now)
+        self._schedule(now, has_pending, take)
+
+    def _show(self, text: str, now: float):
+        if text == self._shown:
+            return
+        self._shown = text
+        self._last_update = now
+        if self._status_bar is not None:
+            if text:
+                self._status_bar.showMessage(text)
+                self._status_bar.setVisible(True)
+            else:
+                self._status_bar.clearMessage()
+        self.message_changed.emit(text)
+
+    def _schedule(self, now: float, has_pending: bool, took: bool):
+        deadlines = []
+        if self._expires is not None:
+            deadlines.append(self._expires)
+        # a message held back by a higher priority one waits for its expiry
+        if has_pending and not took:
+            deadlines.append(self._last_update + self._interval)
+        if not deadlines:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, int((min(deadlines) - now) * 1000 + 0.999)))
@@ -0,0 +1,366 @@
+"""Background tasks for the UI: `TaskRunner` and `TaskHandle`.
+
+Long operations (a `bfs_traverse` over a large graph, loading or exporting
+data) block the event loop when run from a slot. `TaskRunner.submit` runs
+them on its own `QThreadPool`, or in a process pool for CPU-bound work, and
+reports back on the GUI thread through the returned `TaskHandle`'s signals.
+
+A function that accepts a ``task`` keyword argument gets a `TaskContext`
+for progress reports and cooperative cancellation:
+
+    def load(path, task):
+        rows = []
+        for i, line in enumerate(open(path)):
+            task.check_cancelled()
+            task.progress(i, total)
+            rows.append(line)
+        return rows
+
+    handle = runner.submit(load, "people.csv", name="Loading")
+    handle.finished.connect(show_rows)
+    handle.cancel()
+"""
+import inspect
+import threading
+import time
+from collections import deque
+from functools import partial
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+
+# shortest interval between progress signals of one task, in seconds
+PROGRESS_INTERVAL = 0.05
+
+PENDING = "pending"
+RUNNING = "running"
+FINISHED = "finished"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class TaskCancelled(Exception):
+    """Raised by `TaskContext.check_cancelled` once the task was cancelled."""
+
+
+def _accepts_task(fn) -> bool:
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        # builtins without a signature
+        return False
+    parameter = parameters.get("task")
+    return parameter is not None and parameter.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+class TaskContext:
+    """Passed as ``task=`` to thread-pool functions that accept it.
+
+    `progress` may be called as often as convenient: reports are forwarded
+    at most every `PROGRESS_INTERVAL` seconds (and always on completion,
+    ``done >= total``).
+    """
+    def __init__(self, handle: "TaskHandle"):
+        self._handle = handle
+        self._last_report = float("-inf")
+
+    @property
+    def name(self) -> str:
+        return self._handle.name
+
+    def cancelled(self) -> bool:
+        return self._handle._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise `TaskCancelled` if the task was cancelled."""
+        if self._handle._cancel_event.is_set():
+            raise TaskCancelled(self._handle.name)
+
+    def progress(self, done: int, total: int = 0, message: str = ""):
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL and not (total and done >= total):
+            return
+        self._last_report = now
+        self._handle._emit(self._handle._progress, done, total, message)
+
+
+class TaskHandle(QObject):
+    """A submitted task; its signals are emitted on the GUI thread.
+
+    - `started()` when a worker thread or process picks the task up
+    - `progress(done, total, message)` from `TaskContext.progress`
+    - `finished(result)`, `failed(exception)` or `cancelled()` once, at the end
+    - `cancel()` drops a queued task right away; a running one is asked to
+      stop through its `TaskContext` and reports `cancelled()` when it
+      returns. A process task that already started runs to completion, but
+      its result is discarded.
+    """
+    started = Signal()
+    # object, not int: Qt ints are 32-bit and byte counts easily exceed that
+    progress = Signal(object, object, str)
+    finished = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+    # emitted from worker threads, delivered queued to the GUI thread
+    _started = Signal()
+    _progress = Signal(object, object, str)
+    _done = Signal(str, object)
+
+    def __init__(self, name: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._state = PENDING
+        self._result = None
+        self._error = None
+        self._cancel_event = threading.Event()
+        # set by TaskRunner: undoes the submission while it is still queued
+        self._withdraw = None
+        self._runnable = None
+        self._started.connect(self._on_started)
+        self._progress.connect(self.progress)
+        self._done.connect(self._on_done)
+
+    def state(self) -> str:
+        """One of "pending", "running", "finished", "failed", "cancelled"."""
+        return self._state
+
+    def is_done(self) -> bool:
+        return self._state in (FINISHED, FAILED, CANCELLED)
+
+    def result(self):
+        return self._result
+
+    def error(self):
+        return self._error
+
+    def cancel(self):
+        """Request cancellation (GUI thread)."""
+        if self.is_done():
+            return
+        self._cancel_event.set()
+        if self._withdraw is not None and self._withdraw():
+            self._on_done(CANCELLED, None)
+
+    def _emit(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # the handle was deleted while the task was still running
+            pass
+
+    def _on_started(self):
+        if self._state == PENDING:
+            self._state = RUNNING
+            self.started.emit()
+
+    def _on_done(self, state: str, value):
+        if self.is_done():
+            return
+        if state == FINISHED and self._cancel_event.is_set():
+            # the function ignored the request; drop its result
+            state = CANCELLED
+        self._state = state
+        self._withdraw = None
+        if state == FINISHED:
+            self._result = value
+            self.finished.emit(value)
+        elif state == FAILED:
+            self._error = value
+            self.failed.emit(value)
+        else:
+            self.cancelled.emit()
+
+
+class _TaskRunnable(QRunnable):
+    """Runs a task function on a `QThreadPool` worker."""
+    def __init__(self, handle: TaskHandle, fn, args, kwargs):
+        super().__init__()
+        # kept alive by the handle until the task is done, so a queued task
+        # can still be taken back from the pool
+        self.setAutoDelete(False)
+        self._handle = handle
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        try:
+            self._run(self._handle)
+        finally:
+            self.release()
+
+    def _run(self, handle: TaskHandle):
+        if handle._cancel_event.is_set():
+            handle._emit(handle._done, CANCELLED, None)
+            return
+        handle._emit(handle._started)
+        kwargs = self._kwargs
+        if _accepts_task(self._fn):
+            kwargs = dict(kwargs, task=TaskContext(handle))
+        try:
+            result = self._fn(*self._args, **kwargs)
+        except TaskCancelled:
+            handle._emit(handle._done, CANCELLED, None)
+        except Exception as exc:  # reported to the GUI thread, not raised here
+            handle._emit(handle._done, FAILED, exc)
+        else:
+            handle._emit(handle._done, FINISHED, result)
+
+    def release(self):
+        # the handle keeps this runnable until it is done; do not keep the
+        # inputs, or the handle itself, alive with it
+        self._handle = self._fn = self._args = self._kwargs = None
+
+
+def _emit_process_result(handle: TaskHandle, future):
+    """Report a finished process-pool future through `handle` (any thread)."""
+    if future.cancelled():
+        handle._emit(handle._done, CANCELLED, None)
+    elif future.exception() is not None:
+        handle._emit(handle._done, FAILED, future.exception())
+    else:
+        handle._emit(handle._done, FINISHED, future.result())
+
+
+class TaskRunner(QObject):
+    """Runs functions off the GUI thread with a concurrency limit.
+
+    - `submit(fn, *args, name=None, process=False, **kwargs)` returns a
+      `TaskHandle`; at most `max_concurrent` thread-pool tasks run at once
+      and the rest queue
+    - ``process=True`` runs `fn` in a process pool instead (at most
+      `max_processes` at once, default one per core); `fn`, its arguments
+      and its result must be picklable, and it gets no `TaskContext`.
+      Process tasks wait in the runner's own queue until a worker process
+      is free, so a queued one can still be cancelled
+    - `status` is an optional `StatusChannel` that shows the progress,
+      completion and errors of every task
+    """
+    task_started = Signal(object)
+    task_done = Signal(object)
+
+    def __init__(self, max_concurrent: int = None, max_processes: int = None, status=None, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, max_concurrent or QThread.idealThreadCount()))
+        self._max_processes = max(1, max_processes or QThread.idealThreadCount())
+        self._executor = None
+        # (handle, fn, args, kwargs) waiting for a free worker process
+        self._process_queue = deque()
+        self._process_running = set()
+        self._status = status
+        self._handles = []
+        self._counter = 0
+
+    def max_concurrent(self) -> int:
+        return self._pool.maxThreadCount()
+
+    def set_max_concurrent(self, max_concurrent: int):
+        self._pool.setMaxThreadCount(max(1, max_concurrent))
+
+    def active_tasks(self) -> list:
+        """Return the handles of queued and running tasks."""
+        return list(self._handles)
+
+    def submit(self, fn, *args, name: str = None, process: bool = False, **kwargs) -> TaskHandle:
+        self._counter += 1
+        if name is None:
+            name = getattr(fn, "__name__", None) or f"task {self._counter}"
+        # not parented, so handles the caller drops are freed once done; the
+        # runner's slots find the handle through sender() rather than
+        # closures, which the connections would keep alive
+        handle = TaskHandle(name)
+        self._handles.append(handle)
+        handle.started.connect(self._on_task_started)
+        handle.progress.connect(self._on_task_progress)
+        handle.finished.connect(self._on_task_done)
+        handle.failed.connect(self._on_task_done)
+        handle.cancelled.connect(self._on_task_done)
+        if process:
+            entry = (handle, fn, args, kwargs)
+            self._process_queue.append(entry)
+            handle._withdraw = lambda: self._withdraw_process(entry)
+            self._start_process_tasks()
+        else:
+            runnable = _TaskRunnable(handle, fn, args, kwargs)
+            handle._runnable = runnable
+            handle._withdraw = lambda: self._withdraw_runnable(runnable)
+            self._pool.start(runnable)
+        return handle
+
+    def _withdraw_runnable(self, runnable: "_TaskRunnable") -> bool:
+        if not self._pool.tryTake(runnable):
+            return False
+        runnable.release()
+        return True
+
+    def _withdraw_process(self, entry) -> bool:
+        # by identity; comparing entries would compare their arguments
+        for i, queued in enumerate(self._process_queue):
+            if queued is entry:
+                del self._process_queue[i]
+                return True
+        return False
+
+    def _start_process_tasks(self):
+        while self._process_queue and len(self._process_running) < self._max_processes:
+            handle, fn, args, kwargs = self._process_queue.popleft()
+            if self._executor is None:
+                # only process tasks need these; keep them off the import path
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # forking a process that runs Qt threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    self._max_processes, mp_context=multiprocessing.get_context("spawn"))
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._process_running.add(handle)
+            # a worker process is free, so the call starts right away and
+            # can no longer be withdrawn; cancel() discards its result
+            handle._withdraw = None
+            future.add_done_callback(partial(_emit_process_result, handle))
+            handle._on_started()
+
+    def cancel_all(self):
+        for handle in list(self._handles):
+            handle.cancel()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the thread-pool tasks are done (not their signals)."""
+        return self._pool.waitForDone(msecs)
+
+    def shutdown(self):
+        """Cancel every task and stop the process pool, if one was started."""
+        self.cancel_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _on_task_started(self):
+        self.task_started.emit(self.sender())
+
+    def _on_task_progress(self, done, total, message: str):
+        if self._status is None:
+            return
+        name = self.sender().name
+        text = f"{name}: {done * 100 // total}%" if total else f"{name}: {done}"
+        if message:
+            text = f"{text} — {message}"
+        self._status.post(text)
+
+    def _on_task_done(self, *_):
+        handle = self.sender()
+        if handle in self._handles:
+            self._handles.remove(handle)
+        if handle in self._process_running:
+            self._process_running.discard(handle)
+            self._start_process_tasks()
+        if self._status is not None:
+            state = handle.state()
+            if state == FINISHED:
+                self._status.post(f"{handle.name} done", timeout=3000)
+            elif state == FAILED:
+                self._status.post(f"{handle.name} failed: {handle.error()}", timeout=5000, priority=10)
+            else:
+                self._status.post(f"{handle.name} cancelled", timeout=3000)
+        self.task_done.emit(handle)
@@ -0,0 +1,449 @@
+"""Theme engine: compiles design tokens into one application stylesheet.
+
+Components used to call `setStyleSheet` with their own QSS string, so Qt
+parsed and polished a separate stylesheet for every card, label and button.
+Instead, components now declare a role with `set_role(widget, "card")` (the
+``bfsRole`` dynamic property) and a single stylesheet, compiled from the
+``THEME["widgets"]`` tokens in `design_instructions/theme.py`, is installed on
+the QApplication. Compiled stylesheets are cached per token set.
+
+`ThemeManager` switches between token sets at runtime (``THEMES`` in
+`design_instructions/theme.py`). All sets are compiled into one stylesheet
+up front; rules that differ between sets are gated on a ``bfsTheme``
+property, so a switch only re-polishes widgets whose role looks different.
+
+Example:
+    from bfs_component.ui.theme import ThemeManager, apply_stylesheet
+    apply_stylesheet(app)           # optional; components install it lazily
+
+    themes = ThemeManager()
+    themes.install(app)
+    themes.set_theme("dark")
+"""
+import json
+import re
+import weakref
+from string import Template
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QGradient, QLinearGradient, QPalette
+from PySide6.QtWidgets import QApplication
+
+from bfs_component.ui.tokens import WIDGET_TOKENS
+
+ROLE_PROPERTY = "bfsRole"
+THEME_PROPERTY = "bfsTheme"
+BEGIN_MARKER = "/* bfs-theme:begin */"
+END_MARKER = "/* bfs-theme:end */"
+
+# the design theme's widget tokens, or their copy in `tokens` when
+# design_instructions is not importable (e.g. installed package)
+DEFAULT_WIDGET_TOKENS = WIDGET_TOKENS
+
+
+def _sel(widget_type: str, role: str, suffix: str = "") -> str:
+    return f'{widget_type}[{ROLE_PROPERTY}="{role}"]{suffix}'
+
+
+# role -> [(selector, declarations)]; declarations use $token placeholders
+ROLE_RULES = {
+    "input": [
+        (_sel("QLineEdit", "input"),
+         "background: $input_bg; color: $input_text; border-radius: 10px; padding: 8px 12px; "
+         "border: 1px solid $input_border; selection-background-color: $input_selection; "
+         "selection-color: white; font-size: 12pt;"),
+        # no stylesheet border on focus so the painted gradient ring shows;
+        # the error border is painted too (StyledLineEdit.set_error_state)
+        (_sel("QLineEdit", "input", ":focus"), "border: none; background: $input_focus_bg;"),
+    ],
+    "header-logo": [
+        (_sel("QLabel", "header-logo"), "background: $header_logo; border-radius: 8px;"),
+    ],
+    "card": [
+        (_sel("QFrame", "card"), "background: $card_bg; border-radius: 8px;"),
+    ],
+    "company-card": [
+        (_sel("QFrame", "company-card"), "background: $card_bg; border-radius: 12px;"),
+    ],
+    "avatar": [
+        (_sel("QLabel", "avatar"),
+         "background: $avatar; color: $on_accent; border-radius: 12px; font-weight: bold;"),
+    ],
+    "muted": [
+        (_sel("QLabel", "muted"), "color: $muted;"),
+    ],
+    "company-logo": [
+        (_sel("QLabel", "company-logo"),
+         "background: $company_logo; color: $on_accent; border-radius: 16px; font-weight: bold; font-size: 18pt;"),
+    ],
+    "tag": [
+        (_sel("QLabel", "tag"), "background: $tag_bg; border-radius: 6px; padding: 4px; color: $text;"),
+    ],
+    "primary-button": [
+        (_sel("QPushButton", "primary-button"),
+         "background: $primary_button; color: $on_accent; padding: 8px; border-radius: 8px;"),
+    ],
+    "label": [
+        (_sel("QLabel", "label"), "color: $label_text;"),
+    ],
+    "field-label": [
+        (_sel("QLabel", "field-label"), "font-weight: 600; color: $label_text;"),
+    ],
+    "field-error": [
+        (_sel("QLabel", "field-error"), "color: $error; font-size: 11px;"),
+    ],
+    "titlebar-menu": [
+        (_sel("QMenuBar", "titlebar-menu"), "background: transparent; color: $titlebar_text;"),
+        (_sel("QMenuBar", "titlebar-menu", "::item"), "spacing: 6px; padding: 4px 8px;"),
+    ],
+    "titlebar-title": [
+        (_sel("QLabel", "titlebar-title"), "color: $titlebar_text;"),
+    ],
+    "titlebar-search": [
+        (_sel("QLineEdit", "titlebar-search"),
+         "background: $search_bg; color: $titlebar_text; border: 1px solid $search_border; "
+         "border-radius: 8px; padding: 4px 10px;"),
+        (_sel("QLineEdit", "titlebar-search", ":focus"), "border: 1px solid $search_focus_border;"),
+    ],
+    "titlebar-button": [
+        (_sel("QPushButton", "titlebar-button"), "background: transparent; color: $titlebar_text; border: none;"),
+    ],
+    "titlebar-close": [
+        (_sel("QPushButton", "titlebar-close"),
+         "background: transparent; color: $titlebar_text; border: none; font-weight: bold;"),
+    ],
+    "titlebar-avatar": [
+        (_sel("QLabel", "titlebar-avatar"), "background: $titlebar_avatar; border-radius: 18px;"),
+    ],
+    "window-frame": [
+        (_sel("QWidget", "window-frame"), "background: $window_bg; border-radius: 14px;"),
+    ],
+    "content": [
+        (_sel("QWidget", "content"),
+         "background: $content_bg; border-top-left-radius: 0px; border-top-right-radius: 0px; "
+         "border-bottom-left-radius: 10px; border-bottom-right-radius: 10px;"),
+    ],
+    "status": [
+        (_sel("QStatusBar", "status"), "background: transparent; color: $status_text;"),
+    ],
+}
+
+_compiled = {}
+_active_manager = None
+# set once a library stylesheet is on the application, so `set_role` does
+# not read the application stylesheet again for every widget
+_stylesheet_installed = False
+_cache_invalidators = []
+
+
+def default_theme() -> dict:
+    """Return ``design_instructions.theme.THEME``, or an empty theme."""
+    try:
+        from design_instructions.theme import THEME
+    except ImportError:
+        return {}
+    return THEME
+
+
+def default_themes() -> dict:
+    """Return ``design_instructions.theme.THEMES`` (name -> token set)."""
+    try:
+        from design_instructions.theme import THEMES
+    except ImportError:
+        return {"light": {}}
+    return THEMES
+
+
+def current_theme() -> dict:
+    """Return the token set in use: the active `ThemeManager`'s, or the default."""
+    if _active_manager is not None:
+        return _active_manager.theme()
+    return default_theme()
+
+
+def add_cache_invalidator(callback):
+    """Call `callback()` whenever the active theme changes.
+
+    For caches of painted artwork that depend on theme tokens.
+    """
+    if callback not in _cache_invalidators:
+        _cache_invalidators.append(callback)
+
+
+def remove_cache_invalidator(callback):
+    """Stop calling `callback` on theme changes (see `add_cache_invalidator`)."""
+    if callback in _cache_invalidators:
+        _cache_invalidators.remove(callback)
+
+
+def _invalidate_caches():
+    for callback in list(_cache_invalidators):
+        callback()
+
+
+def widget_tokens(theme: dict = None) -> dict:
+    """Return the widget tokens of `theme` (default theme if None)."""
+    tokens = dict(DEFAULT_WIDGET_TOKENS)
+    tokens.update((default_theme() if theme is None else theme).get("widgets", {}))
+    return tokens
+
+
+def compile_role(role: str, tokens: dict) -> str:
+    """Return the QSS rules of `role` with `tokens` substituted."""
+    return "\n".join(
+        f"{selector} {{ {Template(body).substitute(tokens)} }}" for selector, body in ROLE_RULES[role]
+    )
+
+
+_RGB_RE = re.compile(r"rgba?\(\s*([^)]*)\)")
+_PALETTE_RE = re.compile(r"palette\(\s*([\w-]+)\s*\)")
+_GRADIENT_POINT_RE = re.compile(r"\b([xy][12])\s*:\s*([-\d.]+)")
+_GRADIENT_STOP_RE = re.compile(r"stop\s*:\s*([\d.]+)\s+(rgba?\([^)]*\)|[^,\s)]+)")
+
+
+def token_color(value: str, palette: QPalette = None) -> QColor:
+    """Return the QColor for a color token as written in QSS.
+
+    Handles names and hex colors, ``rgb()``/``rgba()`` (alpha as 0-1 or
+    0-255) and ``palette(role)``, resolved against `palette` (the
+    application palette by default). For gradients, see `token_brush`.
+    """
+    value = value.strip()
+    match = _PALETTE_RE.fullmatch(value)
+    if match:
+        role = "".join(part.capitalize() for part in match.group(1).split("-"))
+        if palette is None:
+            palette = QApplication.palette()
+        return palette.color(getattr(QPalette.ColorRole, role, QPalette.ColorRole.WindowText))
+    match = _RGB_RE.fullmatch(value)
+    if match:
+        parts = [float(p) for p in match.group(1).split(",")]
+        color = QColor(*(int(p) for p in parts[:3]))
+        if len(parts) > 3:
+            alpha = parts[3]
+            color.setAlpha(round(alpha * 255) if alpha <= 1 else int(alpha))
+        return color
+    return QColor(value)
+
+
+def token_brush(value: str, palette: QPalette = None) -> QBrush:
+    """Return a QBrush for a color or ``qlineargradient(...)`` token.
+
+    Gradients use object-bounding coordinates, like QSS, so one brush fills
+    any rectangle the way the stylesheet would.
+    """
+    value = value.strip()
+    if not value.startswith("qlineargradient"):
+        return QBrush(token_color(value, palette))
+    points = {"x1": 0.0, "y1": 0.0, "x2": 0.0, "y2": 0.0}
+    points.update((k, float(v)) for k, v in _GRADIENT_POINT_RE.findall(value))
+    gradient = QLinearGradient(points["x1"], points["y1"], points["x2"], points["y2"])
+    gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+    for pos, color in _GRADIENT_STOP_RE.findall(value):
+        gradient.setColorAt(float(pos), token_color(color, palette))
+    return QBrush(gradient)
+
+
+def compile_stylesheet(theme: dict = None) -> str:
+    """Compile `theme` into the library's application stylesheet (cached).
+
+    The result is wrapped in `BEGIN_MARKER`/`END_MARKER` comments so it can
+    be replaced inside an application stylesheet that has other rules too.
+    """
+    tokens = widget_tokens(theme)
+    key = json.dumps(tokens, sort_keys=True)
+    qss = _compiled.get(key)
+    if qss is None:
+        body = "\n".join(compile_role(role, tokens) for role in ROLE_RULES)
+        qss = _compiled[key] = f"{BEGIN_MARKER}\n{body}\n{END_MARKER}"
+    return qss
+
+
+def strip_stylesheet(stylesheet: str) -> str:
+    """Return `stylesheet` without a previously installed library block."""
+    start = stylesheet.find(BEGIN_MARKER)
+    if start < 0:
+        return stylesheet
+    end = stylesheet.find(END_MARKER, start)
+    end = len(stylesheet) if end < 0 else end + len(END_MARKER)
+    return (stylesheet[:start] + stylesheet[end:]).strip()
+
+
+def apply_stylesheet(app=None, theme: dict = None) -> bool:
+    """Install the compiled stylesheet on `app`, keeping its other rules.
+
+    Returns False (and leaves Qt alone) if it is already installed, since
+    every `QApplication.setStyleSheet` call repolishes all widgets.
+    """
+    global _stylesheet_installed
+    app = app or QApplication.instance()
+    if app is None:
+        return False
+    current = app.styleSheet()
+    qss = compile_stylesheet(theme)
+    _stylesheet_installed = True
+    if qss in current:
+        return False
+    rest = strip_stylesheet(current)
+    app.setStyleSheet(f"{rest}\n{qss}" if rest else qss)
+    return True
+
+
+def ensure_stylesheet():
+    """Install the default stylesheet unless some library theme already is.
+
+    Only checks the application once; call `apply_stylesheet` again after
+    replacing the application stylesheet wholesale.
+    """
+    global _stylesheet_installed
+    if _stylesheet_installed:
+        return
+    app = QApplication.instance()
+    if app is None:
+        return
+    if BEGIN_MARKER in app.styleSheet():
+        _stylesheet_installed = True
+    else:
+        apply_stylesheet(app)
+
+
+def set_role(widget, role: str):
+    """Style `widget` with the stylesheet rules of `role` (see `ROLE_RULES`)."""
+    if not _stylesheet_installed:
+        # the first styled widget installs the default stylesheet
+        ensure_stylesheet()
+    widget.setProperty(ROLE_PROPERTY, role)
+    if _active_manager is not None:
+        _active_manager.register(widget, role)
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        # already styled under its previous role
+        widget.style().polish(widget)
+
+
+class ThemeManager:
+    """Runtime switching between precompiled token sets.
+
+    Every role is compiled once per theme. Roles whose rules are the same in
+    all themes are emitted once; the others are emitted per theme with a
+    ``[bfsTheme="<name>"]`` selector. `set_theme` then updates that property
+    and re-polishes only the widgets of roles whose rules differ between the
+    old and the new theme, instead of replacing the application stylesheet
+    (which would re-polish every widget). Painted-artwork caches registered
+    with `add_cache_invalidator` are cleared on every switch.
+
+    Parameters
+    - themes: mapping of name -> token set (default: ``THEMES``)
+    - initial: name of the starting theme (default: the first one)
+    """
+    def __init__(self, themes: dict = None, initial: str = None):
+        self._themes = dict(default_themes() if themes is None else themes)
+        if not self._themes:
+            raise ValueError("ThemeManager needs at least one theme")
+        self._current = initial if initial is not None else next(iter(self._themes))
+        if self._current not in self._themes:
+            raise KeyError(f"unknown theme {self._current!r}")
+        tokens = {name: widget_tokens(theme) for name, theme in self._themes.items()}
+        # role -> theme name -> compiled rules
+        self._rules = {
+            role: {name: compile_role(role, t) for name, t in tokens.items()} for role in ROLE_RULES
+        }
+        self._gated = {role for role, rules in self._rules.items() if len(set(rules.values())) > 1}
+        self._stylesheet = self._compile()
+        # role -> widgets currently styled with it; only gated roles are tracked
+        self._widgets = {}
+
+    def _compile(self) -> str:
+        parts = []
+        for role, rules in self._rules.items():
+            if role not in self._gated:
+                parts.append(next(iter(rules.values())))
+                continue
+            attr = f'[{ROLE_PROPERTY}="{role}"]'
+            for name, qss in rules.items():
+                parts.append(qss.replace(attr, f'{attr}[{THEME_PROPERTY}="{name}"]'))
+        body = "\n".join(parts)
+        return f"{BEGIN_MARKER}\n{body}\n{END_MARKER}"
+
+    @property
+    def current(self) -> str:
+        return self._current
+
+    def names(self) -> list:
+        return list(self._themes)
+
+    def theme(self, name: str = None) -> dict:
+        """Return the token set `name` (default: the current one)."""
+        return self._themes[self._current if name is None else name]
+
+    def stylesheet(self) -> str:
+        return self._stylesheet
+
+    def changed_roles(self, old: str, new: str) -> set:
+        """Return the roles whose rules differ between themes `old` and `new`."""
+        return {role for role in self._gated if self._rules[role][old] != self._rules[role][new]}
+
+    def install(self, app=None):
+        """Install the combined stylesheet on `app` and make this manager active.
+
+        Widgets that already have a role are adopted, so this can be called
+        after the UI is built.
+        """
+        global _active_manager, _stylesheet_installed
+        app = app or QApplication.instance()
+        _active_manager = self
+        _stylesheet_installed = True
+        for widget in app.allWidgets():
+            role = widget.property(ROLE_PROPERTY)
+            if role:
+                self.register(widget, role)
+        rest = strip_stylesheet(app.styleSheet())
+        app.setStyleSheet(f"{rest}\n{self._stylesheet}" if rest else self._stylesheet)
+        _invalidate_caches()
+
+    def uninstall(self, app=None):
+        """Go back to the default single-theme stylesheet."""
+        global _active_manager
+        if _active_manager is not self:
+            return
+        _active_manager = None
+        self._widgets = {}
+        app = app or QApplication.instance()
+        rest = strip_stylesheet(app.styleSheet())
+        qss = compile_stylesheet()
+        app.setStyleSheet(f"{rest}\n{qss}" if rest else qss)
+        _invalidate_caches()
+
+    def register(self, widget, role: str):
+        """Tag `widget` with the current theme; called by `set_role`."""
+        widget.setProperty(THEME_PROPERTY, self._current)
+        if role in self._gated:
+            widgets = self._widgets.get(role)
+            if widgets is None:
+                widgets = self._widgets[role] = weakref.WeakSet()
+            widgets.add(widget)
+
+    def set_theme(self, name: str) -> int:
+        """Switch to theme `name`; returns the number of re-polished widgets."""
+        if name not in self._themes:
+            raise KeyError(f"unknown theme {name!r}")
+        if name == self._current:
+            return 0
+        changed = self.changed_roles(self._current, name)
+        self._current = name
+        count = 0
+        for role in changed:
+            widgets = self._widgets.get(role, ())
+            for widget in list(widgets):
+                try:
+                    widget.setProperty(THEME_PROPERTY, name)
+                    # QStyleSheetStyle.polish drops the widget's cached rules
+                    # itself; a full unpolish would cost as much again
+                    widget.style().polish(widget)
+                    widget.update()
+                except RuntimeError:
+                    # the C++ widget is gone but its wrapper was still alive
+                    widgets.discard(widget)
+                    continue
+                count += 1
+        _invalidate_caches()
+        return count
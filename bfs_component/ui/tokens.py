@@ -0,0 +1,43 @@
+"""Per-widget design tokens, free of Qt.
+
+``THEME["widgets"]`` in `design_instructions/theme.py` is the source of these
+tokens. `WIDGET_TOKENS` reads them from there and falls back to the copy
+below when that module is not importable (e.g. an installed package);
+tests/test_theme.py checks that the copy matches. Gradients are Qt
+``qlineargradient`` strings.
+"""
+
+_FALLBACK_WIDGET_TOKENS = {
+    "input_bg": "#0b1220",
+    "input_text": "#E6EEF8",
+    "input_border": "rgba(255,255,255,0.06)",
+    "input_focus_bg": "qlineargradient(x1:0 y1:0 x2:1 y2:0, stop:0 #08122a, stop:1 #0c1526)",
+    "input_selection": "#7C3AED",
+    "error": "#DC2626",
+    "card_bg": "#FFFFFF",
+    "label_text": "palette(window-text)",
+    "text": "#111827",
+    "muted": "#6b7280",
+    "on_accent": "white",
+    "header_logo": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #6EE7F2, stop:1 #7C3AED)",
+    "avatar": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #60A5FA, stop:1 #A78BFA)",
+    "company_logo": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #34D399, stop:1 #60A5FA)",
+    "tag_bg": "#F3F4F6",
+    "primary_button": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #60A5FA, stop:1 #EC4899)",
+    "window_bg": "qlineargradient(x1:0 y1:0, x2:1 y2:0, stop:0 #0f172a, stop:1 #111827)",
+    "titlebar_text": "white",
+    "search_bg": "rgba(59,130,246,0.12)",
+    "search_border": "rgba(59,130,246,0.18)",
+    "search_focus_border": "rgba(99,102,241,0.26)",
+    "titlebar_avatar": "white",
+    "content_bg": "#F8FAFC",
+    "status_text": "#374151",
+}
+
+
+try:
+    from design_instructions.theme import THEME as _THEME
+except ImportError:
+    WIDGET_TOKENS = dict(_FALLBACK_WIDGET_TOKENS)
+else:
+    WIDGET_TOKENS = dict(_THEME["widgets"])
@@ -1,10 +1,11 @@
-"""BFS Light Theme tokens for desktop UI and component library exports.
+"""BFS Light Theme tokens (plus a dark variant) for desktop UI and component library exports.
 
 This file exposes a compact set of design tokens intended to be portable
 into a component library. Tokens are intentionally primitive (colors,
 numbers, strings) so they can be mapped to platform-specific formats (CSS,
 Qt stylesheets, design-system JSON, etc.).
 """
+import copy
 
 THEME = {
     # Core colors
@@ -84,6 +85,35 @@ THEME = {
         },
     },
 
+    # Per-widget colors compiled into the application stylesheet by
+    # bfs_component.ui.theme (gradients as Qt qlineargradient strings)
+    "widgets": {
+        "input_bg": "#0b1220",
+        "input_text": "#E6EEF8",
+        "input_border": "rgba(255,255,255,0.06)",
+        "input_focus_bg": "qlineargradient(x1:0 y1:0 x2:1 y2:0, stop:0 #08122a, stop:1 #0c1526)",
+        "input_selection": "#7C3AED",
+        "error": "#DC2626",
+        "card_bg": "#FFFFFF",
+        "label_text": "palette(window-text)",
+        "text": "#111827",
+        "muted": "#6b7280",
+        "on_accent": "white",
+        "header_logo": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #6EE7F2, stop:1 #7C3AED)",
+        "avatar": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #60A5FA, stop:1 #A78BFA)",
+        "company_logo": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #34D399, stop:1 #60A5FA)",
+        "tag_bg": "#F3F4F6",
+        "primary_button": "qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #60A5FA, stop:1 #EC4899)",
+        "window_bg": "qlineargradient(x1:0 y1:0, x2:1 y2:0, stop:0 #0f172a, stop:1 #111827)",
+        "titlebar_text": "white",
+        "search_bg": "rgba(59,130,246,0.12)",
+        "search_border": "rgba(59,130,246,0.18)",
+        "search_focus_border": "rgba(99,102,241,0.26)",
+        "titlebar_avatar": "white",
+        "content_bg": "#F8FAFC",
+        "status_text": "#374151",
+    },
+
     # Small utilities
     "utils": {
         "focus_ring": "0 0 0 3px rgba(58,77,233,0.12)",
@@ -110,3 +140,34 @@ THEME.update({
     "text": THEME["colors"]["text"],
     "radius_default": THEME["radius"]["default"],
 })
+
+
+# Dark variant: same keys, only the colors that differ are overridden
+DARK_THEME = copy.deepcopy(THEME)
+DARK_THEME["colors"].update({
+    "bg": "#0B1220",
+    "surface": "#111827",
+    "border": "#1F2937",
+    "text": "#E5E7EB",
+    "muted": "#9CA3AF",
+})
+DARK_THEME["widgets"].update({
+    "card_bg": "#111827",
+    "label_text": "#E5E7EB",
+    "text": "#E5E7EB",
+    "muted": "#9CA3AF",
+    "tag_bg": "#1F2937",
+    "content_bg": "#0F172A",
+    "status_text": "#9CA3AF",
+})
+DARK_THEME.update({
+    "bg": DARK_THEME["colors"]["bg"],
+    "surface": DARK_THEME["colors"]["surface"],
+    "text": DARK_THEME["colors"]["text"],
+})
+
+# Token sets selectable at runtime (see bfs_component.ui.theme.ThemeManager)
+THEMES = {
+    "light": THEME,
+    "dark": DARK_THEME,
+}
@@ -1,12 +1,13 @@
 """Launcher for the BFS Component Library GUI using PySide6"""
 import sys
-
-from PySide6.QtWidgets import QApplication
-from bfs_component.ui.main_window import MainWindow
 from pathlib import Path
 
 
 def main(argv=None):
+    # imported on launch so importing this module does not load Qt
+    from PySide6.QtWidgets import QApplication
+    from bfs_component.ui.main_window import MainWindow
+
     argv = argv or sys.argv
     app = QApplication(argv)
     # try to inject a project logo from assets/logo.png if present
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bfs_component import bfs_iter
+from bfs_component.anf import approximate_neighborhood, register_bits_for
+from bfs_component.graph_io import CSRGraph
+
+
+def test_register_bits_follow_rsd():
+    assert register_bits_for(0.1) < register_bits_for(0.02)
+    with pytest.raises(ValueError):
+        register_bits_for(0)
+
+
+def test_estimates_close_to_exact_ball_sizes():
+    rng = random.Random(5)
+    n = 1500
+    csr = CSRGraph.from_edges([(rng.randrange(n), rng.randrange(n)) for _ in range(3000)], num_nodes=n)
+    est = approximate_neighborhood(csr, max_hops=3, rsd=0.05)
+    assert est.estimates.shape == (4, n)
+    errors = []
+    for v in range(0, n, 25):
+        dist = {node: d for node, d, _ in bfs_iter(csr, [v])}
+        true = sum(1 for d in dist.values() if d <= 3)
+        errors.append(abs(est.reach(v, 3) - true) / true)
+    assert np.mean(errors) < 3 * est.relative_error
+
+
+def test_dict_graph_and_convergence():
+    g = {"A": ["B"], "B": ["C"], "C": []}
+    est = approximate_neighborhood(g, max_hops=5, rsd=0.1)
+    assert round(est.reach("A", 0)) == 1
+    assert round(est.reach("A", 1)) == 2
+    assert round(est.reach("A")) == 3
+    assert round(est.reach("C")) == 1
+    nf = est.neighborhood_function()
+    assert nf[-1] == pytest.approx(nf[2])
+
+
+def test_chunked_merge_at_full_precision(monkeypatch):
+    from bfs_component import anf
+
+    rng = random.Random(9)
+    n = 120
+    csr = CSRGraph.from_edges([(rng.randrange(n), rng.randrange(n)) for _ in range(360)], num_nodes=n)
+    whole = approximate_neighborhood(csr, max_hops=3, rsd=0.004)
+    assert whole.register_bits == anf.MAX_REGISTER_BITS
+    # a few edges per chunk must give the same estimates
+    monkeypatch.setattr(anf, "_CHUNK_BYTES", 7 << anf.MAX_REGISTER_BITS)
+    chunked = approximate_neighborhood(csr, max_hops=3, rsd=0.004)
+    assert np.array_equal(chunked.estimates, whole.estimates)
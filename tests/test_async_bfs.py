@@ -0,0 +1,69 @@
+import asyncio
+
+from bfs_component import bfs_traverse
+from bfs_component.async_bfs import async_bfs_traverse
+
+
+class FakeStore:
+    """In-process neighbor store that simulates a fixed round-trip latency."""
+    def __init__(self, graph, latency=0.02):
+        self.graph = graph
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_many(self, nodes):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return {n: self.graph[n] for n in nodes if n in self.graph}
+        finally:
+            self.in_flight -= 1
+
+
+def _tree(depth=4, fanout=4):
+    g = {}
+    frontier = [0]
+    nxt_id = 1
+    for _ in range(depth):
+        nxt = []
+        for v in frontier:
+            g[v] = list(range(nxt_id, nxt_id + fanout))
+            nxt.extend(g[v])
+            nxt_id += fanout
+        frontier = nxt
+    return g
+
+
+def test_matches_bfs_traverse_order():
+    g = {"A": ["B", "C"], "B": ["D", "A"], "C": ["E"], "E": ["B"]}
+    store = FakeStore(g, latency=0)
+    assert asyncio.run(async_bfs_traverse(store, "A", batch_size=1)) == bfs_traverse(g, "A")
+
+
+def test_latency_is_overlapped():
+    g = _tree()
+    store = FakeStore(g, latency=0.02)
+    order = asyncio.run(async_bfs_traverse(store, 0, batch_size=8, max_concurrency=4))
+    assert order == bfs_traverse(g, 0)
+    # one call per batch of a level (levels of 1, 4, 16, 64, 256 nodes), not
+    # one per node, and the batches of a level overlap up to the limit
+    assert store.calls == 1 + 1 + 2 + 8 + 32
+    assert store.max_in_flight == 4
+
+
+def test_cache_is_reused():
+    g = _tree(depth=2)
+    store = FakeStore(g, latency=0)
+    cache = {}
+
+    async def fetch(nodes):
+        return await store.get_many(nodes)
+
+    asyncio.run(async_bfs_traverse(fetch, 0, cache=cache))
+    calls = store.calls
+    asyncio.run(async_bfs_traverse(fetch, 0, cache=cache))
+    assert store.calls == calls
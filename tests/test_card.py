@@ -1,5 +1,6 @@
 import sys
 import pytest
+from PySide6.QtCore import QEvent
 from PySide6.QtWidgets import QApplication, QLabel, QWidget
 
 
@@ -23,3 +24,106 @@ def test_card_slots(qapp):
     assert hasattr(card, "_header")
     assert hasattr(card, "_body")
     assert hasattr(card, "_footer")
+
+
+def test_contact_card_update_rebinds(qapp):
+    from bfs_component.ui.cards import ContactCard
+
+    card = ContactCard("JD", "Jane Doe", "Project Manager", "jane@acme.com")
+    email, phone = card._email_label, card._phone_label
+    assert not email.isHidden() and phone.isHidden()
+
+    card.update({"name": "Carol Remecom", "role": "Marketing Director", "phone": "+47 934 88 112"})
+    assert card._avatar.text() == "CR" and card._name_label.text() == "Carol Remecom"
+    assert email.isHidden() and not phone.isHidden()
+    # the same labels are reused
+    assert card._email_label is email and card._phone_label is phone
+    assert card.data()["phone"] == "+47 934 88 112"
+    # without data, update() still schedules a repaint
+    card.update()
+
+
+def test_card_and_company_card_update(qapp):
+    from bfs_component.ui.cards import Card, CompanyCard
+
+    card = Card()
+    card.update({"header": "Title", "footer": "Meta"})
+    header = card._header
+    card.update({"header": "Other"})
+    assert card._header is header and header.text() == "Other"
+
+    # a text body replaces a widget body instead of stacking on it
+    card.set_body(QWidget())
+    card.update({"body": "hello"})
+    assert card._main_layout.count() == 3
+    assert isinstance(card._body, QLabel) and card._body.text() == "hello"
+    card.set_body(QWidget())
+    assert card._main_layout.count() == 3
+
+    company = CompanyCard("Acme", tags=["Technology", "Active"])
+    tags = list(company._tag_labels)
+    company.update({"name": "Globex", "tags": ["Energy"]})
+    assert company._title.text() == "Globex" and company._logo.text() == "GL"
+    assert company._tag_labels == tags
+    assert [t.text() for t in tags if not t.isHidden()] == ["Energy"]
+    company.update("Initech")
+    assert company._tags_widget.isHidden() and company.data() == {"name": "Initech", "tags": []}
+
+
+def test_card_pool_reuses_bounded_cards(qapp):
+    from bfs_component.ui.cards import CardPool, ContactCard
+
+    pool = CardPool(ContactCard, max_size=3, prewarm=2)
+    assert pool.created == 2 and pool.idle_count == 2
+
+    page = QWidget()
+    first = [pool.acquire({"name": f"Person {i}"}, page) for i in range(4)]
+    assert pool.created == 4 and pool.reused == 2
+    assert first[0]._name_label.text() == "Person 0" and first[0].parentWidget() is page
+
+    pool.release_all(first)
+    # only max_size idle cards are kept; double releases are ignored
+    assert pool.idle_count == 3
+    pool.release(first[0])
+    assert pool.idle_count == 3
+
+    again = pool.acquire(("AB", "Alice Brown", "Engineer"), page)
+    assert again in first and again._name_label.text() == "Alice Brown"
+    assert not again.isHidden() and pool.created == 4
+
+    pool.clear()
+    assert pool.idle_count == 0
+    # run the deferred deletes so the cards don't outlive the test
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def test_main_frame_applies_keyed_diffs(qapp):
+    from bfs_component.ui.cards import MainFrame
+
+    frame = MainFrame()
+    assert [c["name"] for c in frame.contacts()][:2] == ["Jane Doe", "John Smith"]
+
+    contacts = [{"id": i, "name": f"Person {i}", "role": "Engineer"} for i in range(6)]
+    frame.set_data({"name": "Globex", "tags": ["Energy"]}, contacts)
+    assert frame.company()["name"] == "Globex"
+    cards = {c.data()["id"]: c for c in frame.contact_cards()}
+
+    # refreshing with identical data touches nothing
+    assert frame.set_contacts(contacts) == {"added": 0, "removed": 0, "updated": 0, "moved": 0}
+
+    changed = [dict(c) for c in contacts]
+    changed[4]["role"] = "Director"
+    del changed[1]
+    changed.append({"id": 9, "name": "Person 9", "role": "Intern"})
+    stats = frame.set_contacts(changed)
+    assert stats["added"] == 1 and stats["removed"] == 1 and stats["updated"] == 1
+
+    shown = frame.contact_cards()
+    # unchanged contacts keep their widgets; the removed card was recycled
+    assert shown[0] is cards[0] and shown[3] is cards[4]
+    assert shown[3]._role_label.text() == "Director"
+    assert shown[-1] is cards[1] and shown[-1].data()["name"] == "Person 9"
+    # first half in the left column, the rest on the right
+    left, right = frame._columns
+    assert [left.itemAt(i).widget() for i in range(left.count())] == shown[:3]
+    assert [right.itemAt(i).widget() for i in range(right.count())] == shown[3:]
@@ -0,0 +1,81 @@
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def _contacts(n):
+    return [
+        {"id": i, "name": f"Person {i:05d}", "role": "Engineer", "email": f"p{i}@acme.com",
+         "phone": "+47 934 88 112" if i % 2 else ""}
+        for i in range(n)
+    ]
+
+
+def test_normalize_contact():
+    from bfs_component.ui.cards import normalize_contact
+
+    assert normalize_contact(("JD", "Jane Doe", "Project Manager")) == {
+        "initials": "JD", "name": "Jane Doe", "role": "Project Manager", "email": "", "phone": "",
+    }
+    data = normalize_contact({"id": 7, "name": "carol remecom", "role": "Director", "phone": None})
+    assert data["initials"] == "CR" and data["phone"] == "" and data["id"] == 7
+
+
+def test_card_list_paints_only_visible_rows(qapp):
+    from bfs_component.ui.card_list import CardListView, ContactCardDelegate
+
+    class CountingDelegate(ContactCardDelegate):
+        def __init__(self, parent):
+            super().__init__(parent)
+            self.painted = set()
+
+        def paint(self, painter, option, index):
+            self.painted.add(index.row())
+            super().paint(painter, option, index)
+
+    view = CardListView(_contacts(10_000))
+    delegate = CountingDelegate(view)
+    view.setItemDelegate(delegate)
+    view.resize(320, 480)
+    image = view.grab().toImage()
+
+    # no widgets per contact: just the view's viewport and scroll bars
+    assert len(view.findChildren(QWidget)) < 10
+    assert delegate.painted and max(delegate.painted) < 10
+    # every card has the same size
+    first, second = view.visualRect(view.model().index(0)), view.visualRect(view.model().index(1))
+    assert first.size() == second.size() and first.width() > 250
+    # the avatar gradient is painted left of the text
+    avatar = image.pixelColor(first.left() + 20, first.center().y())
+    assert avatar.blue() > 200 and avatar.red() < 200
+
+
+def test_card_list_grid_and_activation(qapp):
+    from bfs_component.ui.card_list import CardListView
+
+    view = CardListView(_contacts(20), grid=True, card_width=200)
+    view.resize(640, 480)
+    view.show()
+    qapp.processEvents()
+    first, second = view.visualRect(view.model().index(0)), view.visualRect(view.model().index(1))
+    assert first.width() == 200 and second.top() == first.top() and second.left() > first.right()
+
+    view.set_grid(False)
+    qapp.processEvents()
+    second = view.visualRect(view.model().index(1))
+    assert second.top() > first.bottom() and second.width() > 600
+
+    activated = []
+    view.contact_activated.connect(activated.append)
+    view.activated.emit(view.model().index(3))
+    assert activated[0]["id"] == 3
+
+    view.set_contacts([("C", "Carol Remecom", "Marketing Director")])
+    assert view.model().rowCount() == 1 and view.contacts()[0]["name"] == "Carol Remecom"
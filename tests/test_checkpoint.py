@@ -0,0 +1,89 @@
+import pytest
+
+from bfs_component import bfs_traverse
+from bfs_component.checkpoint import ResumableBFS
+from bfs_component.graph_io import CSRGraph
+
+
+def _grid(w, h):
+    edges = []
+    for y in range(h):
+        for x in range(w):
+            v = y * w + x
+            if x + 1 < w:
+                edges.append((v, v + 1))
+            if y + 1 < h:
+                edges.append((v, v + w))
+    return CSRGraph.from_edges(edges, num_nodes=w * h, undirected=True)
+
+
+def test_resumable_matches_bfs_traverse():
+    g = _grid(6, 5)
+    assert ResumableBFS(g, [0]).run() == bfs_traverse(g, 0)
+
+
+def test_snapshot_and_resume(tmp_path):
+    g = _grid(8, 8)
+    path = tmp_path / "job.ckpt"
+    bfs = ResumableBFS(g, [0])
+    bfs.step(10)
+    bfs.save(path)
+    frontier = bfs.frontier
+
+    # simulate a killed worker: resume from the snapshot only
+    resumed = ResumableBFS.load(path, g)
+    assert resumed.nodes_expanded == 10
+    assert resumed.frontier == frontier
+    assert resumed.run(path, every_nodes=7) == bfs_traverse(g, 0)
+    assert ResumableBFS.load(path, g).done
+
+
+def test_frontier_only_snapshots(tmp_path):
+    g = _grid(5, 5)
+    path = tmp_path / "job.ckpt"
+    bfs = ResumableBFS(g, [0], keep_order=False)
+    bfs.step(12)
+    bfs.save(path)
+    resumed = ResumableBFS.load(path, g)
+    assert not resumed.keep_order
+    resumed.run()
+    assert resumed.nodes_expanded == 25
+    with pytest.raises(RuntimeError):
+        resumed.order
+
+
+def test_load_rejects_other_graph(tmp_path):
+    path = tmp_path / "job.ckpt"
+    ResumableBFS(_grid(3, 3), [0]).save(path)
+    with pytest.raises(ValueError):
+        ResumableBFS.load(path, _grid(4, 4))
+
+
+def test_load_rejects_inconsistent_snapshots(tmp_path):
+    from bfs_component.checkpoint import _HEADER
+
+    g = _grid(4, 4)
+    path = tmp_path / "job.ckpt"
+    bfs = ResumableBFS(g, [0])
+    bfs.step(5)
+    bfs.save(path)
+    data = path.read_bytes()
+    fields = list(_HEADER.unpack(data[:_HEADER.size]))
+    body = data[_HEADER.size:]
+
+    def corrupt(**changes):
+        names = ["magic", "version", "flags", "nodes", "edges", "head", "qlen", "expanded", "scanned"]
+        values = [changes.get(name, value) for name, value in zip(names, fields)]
+        path.write_bytes(_HEADER.pack(*values) + body)
+        with pytest.raises(ValueError):
+            ResumableBFS.load(path, g)
+
+    corrupt(head=fields[6] + 1)
+    # frontier-only snapshots are compacted, so head must be 0
+    corrupt(flags=0)
+    # queue shorter than the visited bitmap says
+    corrupt(qlen=fields[6] - 1)
+    # a stray node id in the queue
+    path.write_bytes(data[:-8] + (99).to_bytes(8, "little"))
+    with pytest.raises(ValueError):
+        ResumableBFS.load(path, g)
@@ -0,0 +1,60 @@
+from bfs_component import bfs_iter
+from bfs_component.cli import main
+from bfs_component.graph_io import CSRGraph, load_binary, save_binary
+
+
+def _write_edges(path):
+    path.write_text("# sample graph\nA B\nA,C\nB D\n\nC E\n", encoding="utf-8")
+
+
+def test_bfs_iter_distances_and_parents():
+    g = {"A": ["B", "C"], "B": ["D"], "C": ["E"]}
+    rows = list(bfs_iter(g, ["A"]))
+    assert rows == [("A", 0, None), ("B", 1, "A"), ("C", 1, "A"), ("D", 2, "B"), ("E", 2, "C")]
+    # multi-source: distance is measured from the nearest source
+    assert dict((n, d) for n, d, _ in bfs_iter(g, ["A", "C"]))["E"] == 1
+
+
+def test_cli_edge_list_to_file(tmp_path, capsys):
+    edges = tmp_path / "g.txt"
+    _write_edges(edges)
+    out = tmp_path / "out.csv"
+    assert main([str(edges), "-s", "A", "--parents", "-o", str(out)]) == 0
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "node,distance,parent"
+    assert lines[1:] == ["A,0,", "B,1,A", "C,1,A", "D,2,B", "E,2,C"]
+    assert "visited 5 nodes" in capsys.readouterr().err
+
+
+def test_cli_binary_graph_stdout(tmp_path, capsys):
+    g = CSRGraph.from_edges([(0, 1), (1, 2), (3, 2)], num_nodes=4)
+    path = tmp_path / "g.bfsg"
+    save_binary(g, path)
+    loaded = load_binary(path)
+    assert list(loaded.get(0)) == [1] and loaded.num_edges == 3
+    assert main([str(path), "-s", "0", "-s", "3", "--no-header"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ["0,0", "3,0", "1,1", "2,1"]
+
+
+def test_cli_reports_corrupt_binary_graphs(tmp_path, capsys):
+    g = CSRGraph.from_edges([(0, 1), (1, 2)], num_nodes=3)
+    path = tmp_path / "g.bfsg"
+    save_binary(g, path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-4])
+    assert main([str(path), "-s", "0"]) == 2
+    assert "truncated graph data" in capsys.readouterr().err
+
+    # byte 6 holds the target width
+    path.write_bytes(data[:6] + b"\x03" + data[7:])
+    assert main([str(path), "-s", "0"]) == 2
+    assert "unsupported target width 3" in capsys.readouterr().err
+
+
+def test_cli_unwritable_output(tmp_path, capsys):
+    edges = tmp_path / "g.txt"
+    _write_edges(edges)
+    assert main([str(edges), "-s", "A", "-o", str(tmp_path / "missing" / "out.csv")]) == 2
+    assert "bfs-traverse:" in capsys.readouterr().err
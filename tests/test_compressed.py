@@ -0,0 +1,43 @@
+import random
+
+from bfs_component import bfs_traverse
+from bfs_component.compressed import CompressedGraph
+from bfs_component.graph_io import CSRGraph
+
+
+def _random_graph(n=300, seed=7):
+    rng = random.Random(seed)
+    edges = []
+    for v in range(n):
+        for _ in range(rng.randrange(0, 6)):
+            edges.append((v, rng.randrange(n)))
+    return CSRGraph.from_edges(edges, num_nodes=n)
+
+
+def test_roundtrip_neighbors():
+    csr = _random_graph()
+    cg = CompressedGraph.from_adjacency(csr, block_size=8)
+    for v in range(csr.num_nodes):
+        expected = sorted(set(csr.get(v)))
+        assert list(cg.neighbors(v)) == expected
+        assert list(cg.get(v)) == expected
+        assert cg.degree(v) == len(expected)
+    assert [nbs for _, nbs in cg.iter_adjacency()] == [sorted(set(csr.get(v))) for v in range(csr.num_nodes)]
+    assert cg.get(csr.num_nodes) is None
+
+
+def test_bfs_runs_on_compressed_graph():
+    csr = _random_graph()
+    sorted_adj = {v: sorted(set(csr.get(v))) for v in range(csr.num_nodes)}
+    expected = bfs_traverse(sorted_adj, 0)
+    assert bfs_traverse(CompressedGraph.from_adjacency(csr), 0) == expected
+    assert bfs_traverse(CompressedGraph.from_adjacency(csr, cache_blocks=4), 0) == expected
+
+
+def test_compresses_local_graph():
+    n = 2000
+    edges = [(v, (v + d) % n) for v in range(n) for d in (1, 2, 3, 5, 8)]
+    cg = CompressedGraph.from_edges(edges, num_nodes=n)
+    assert cg.num_edges == len(edges)
+    # CSR would need 32 bits per edge for the targets alone
+    assert cg.bits_per_edge() < 16
@@ -0,0 +1,93 @@
+"""Import-time budget for the package entry points.
+
+Each check runs ``python -X importtime`` in a fresh interpreter and inspects
+which modules were loaded and their cumulative import time. The budgets are
+generous (a cold run on a slow machine should still pass); the module checks
+catch the real regressions, such as the CLI pulling in Qt.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# cumulative import time budgets, in microseconds
+PACKAGE_BUDGET_US = 50_000
+CLI_BUDGET_US = 150_000
+
+
+def _import(statement: str):
+    """Run `statement` in a fresh interpreter under ``-X importtime``.
+
+    Returns ``(modules, times)``: the names in ``sys.modules`` afterwards and
+    the cumulative import time (us) of each module imported by statement.
+    Modules loaded through `importlib.import_module` (the lazy exports) show
+    up in ``modules`` only, since importtime does not report them.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return set(proc.stdout.split()), times
+
+
+def _qt_modules(modules) -> list:
+    return [name for name in modules if name.startswith(("PySide6", "shiboken6"))]
+
+
+def test_package_import_is_cheap():
+    modules, times = _import("import bfs_component")
+    assert _qt_modules(modules) == []
+    # the BFS helpers are resolved on first access, not on import
+    assert "bfs_component.components" not in modules
+    assert times["bfs_component"] < PACKAGE_BUDGET_US
+
+
+def test_cli_import_skips_qt():
+    modules, times = _import("import bfs_component.cli")
+    assert _qt_modules(modules) == []
+    assert "bfs_component.ui" not in modules
+    assert times["bfs_component.cli"] < CLI_BUDGET_US
+
+
+def test_launcher_import_skips_qt():
+    modules, _ = _import("import run_app")
+    assert _qt_modules(modules) == []
+
+
+def test_ui_package_loads_widgets_on_demand():
+    modules, _ = _import("import bfs_component.ui")
+    assert _qt_modules(modules) == []
+
+    modules, _ = _import("from bfs_component.ui import TextInput")
+    assert "bfs_component.ui.inputs" in modules
+    for name in ("select", "cards", "card_list", "radio", "models", "filtering", "components", "main_window"):
+        assert f"bfs_component.ui.{name}" not in modules
+    # only async providers need an event loop
+    modules, _ = _import("from bfs_component.ui import SearchableSelect")
+    assert "bfs_component.ui.models" in modules
+    assert "asyncio" not in modules
+
+
+def test_lazy_exports_resolve():
+    import bfs_component
+    import bfs_component.ui as ui
+    from bfs_component.ui import components
+
+    assert bfs_component.bfs_traverse({"A": ["B"]}, "A") == ["A", "B"]
+    assert "bfs_iter" in dir(bfs_component)
+    assert ui.TextInput is components.TextInput
+    assert ui.StyledComboBox is components.StyledComboBox
+    assert set(ui.__all__) <= set(dir(ui))
+    with pytest.raises(AttributeError):
+        ui.NoSuchWidget
@@ -31,3 +31,91 @@ def test_set_title_and_status(qapp, capsys):
     win.set_status_message("Loading...", timeout=10)
     # status_message prints were removed; ensure no exception and status visible
     assert hasattr(win, "_status_bar")
+
+
+def test_pages_are_built_lazily_and_evicted_lru(qapp):
+    from bfs_component.ui.main_window import MainWindow
+
+    built = []
+
+    def factory(name):
+        def build():
+            built.append(name)
+            return QLabel(name)
+        return build
+
+    win = MainWindow(max_pages=2)
+    shown = []
+    win.page_changed.connect(shown.append)
+    for name in ("home", "contacts", "settings"):
+        win.register_page(name, factory(name))
+    assert built == []
+
+    home = win.show_page("home")
+    assert win.show_page("home") is home and built == ["home"]
+    contacts = win.show_page("contacts")
+    # hot pages are switched to, not rebuilt
+    assert win.show_page("home") is home and built == ["home", "contacts"]
+    assert win._page_stack.currentWidget() is home
+
+    # a third page evicts the least recently shown one ("contacts")
+    win.show_page("settings")
+    assert win.page("contacts") is None and win.page("home") is home
+    assert win.show_page("contacts") is not contacts
+    assert built == ["home", "contacts", "settings", "contacts"]
+    assert win.current_page() == "contacts"
+    assert shown == ["home", "contacts", "home", "settings", "contacts"]
+
+    win.set_max_pages(1)
+    assert list(win._pages) == ["contacts"]
+    with pytest.raises(KeyError):
+        win.show_page("missing")
+
+    # ad-hoc content replaces the page stack
+    win.set_content(QLabel("other"))
+    assert win.page("contacts") is None and win.current_page() is None
+
+
+def test_shadow_is_painted_from_cached_pixmap(qapp):
+    from bfs_component.ui import shadow
+    from bfs_component.ui.main_window import MainWindow
+
+    shadow.clear_shadow_cache()
+    win = MainWindow()
+    assert win._outer.graphicsEffect() is None
+    win.show()
+    qapp.processEvents()
+    image = win.grab().toImage()
+    frame = win._outer.geometry()
+    # the margin below the frame is shaded, the window corner far less so
+    below = image.pixelColor(frame.center().x(), frame.bottom() + 3).alpha()
+    assert below > 0
+    assert below > image.pixelColor(0, 0).alpha()
+
+    pixmap = shadow.shadow_pixmap(MainWindow.SHADOW_BLUR, MainWindow.FRAME_RADIUS, MainWindow.SHADOW_COLOR,
+                                  win.devicePixelRatioF())
+    win.repaint()
+    assert len(shadow._shadow_cache) == 1
+    assert shadow.shadow_pixmap(MainWindow.SHADOW_BLUR, MainWindow.FRAME_RADIUS, MainWindow.SHADOW_COLOR,
+                                win.devicePixelRatioF()) is pixmap
+    win.close()
+
+
+def test_resize_bursts_are_laid_out_once_settled(qapp):
+    from PySide6.QtTest import QTest
+
+    from bfs_component.ui.main_window import MainWindow
+
+    win = MainWindow()
+    win.show()
+    qapp.processEvents()
+    win.resize(900, 600)
+    first = win._outer.width()
+    win.resize(800, 500)
+    win.resize(700, 450)
+    # later events of the burst wait for the coalescing timer
+    assert win._outer.width() == first
+    QTest.qWait(MainWindow.RESIZE_COALESCE_MS * 3)
+    assert win._outer.width() == 700 - 20
+    assert win.layout().isEnabled()
+    win.close()
@@ -0,0 +1,98 @@
+from bfs_component.ui.filtering import OptionFilter
+
+
+def test_filter_matches_casefolded_substrings():
+    f = OptionFilter(["Norway", "Sweden", "Denmark", "STRASSE"])
+    assert f.filter("") is None
+    assert f.filter("  ") is None
+    assert f.filter("EN") == [1, 2]
+    assert f.filter("straße") == [3]
+
+
+def test_narrowing_rescans_previous_matches_only():
+    labels = [f"item {i}" for i in range(1000)]
+    f = OptionFilter(labels)
+    assert len(f.filter("item 1")) == 111
+    # break the full label list: a narrowed query must not rescan it
+    f._labels = _Tripwire(f._labels)
+    assert f.filter("item 12") == [12] + list(range(120, 130))
+    assert f.filter("item 1") is f.filter("item 1")
+
+
+def test_set_labels_drops_cache():
+    f = OptionFilter(["a", "b"])
+    assert f.filter("a") == [0]
+    f.set_labels(["b", "a"])
+    assert f.filter("a") == [1]
+
+
+class _Tripwire(list):
+    def __iter__(self):
+        raise AssertionError("full scan")
+
+
+def test_trigram_index_tolerates_typos_and_ranks():
+    from bfs_component.ui.filtering import TrigramIndex
+
+    labels = ["Jane Doe", "John Smith", "Carol Remecom", "Michael Brown", "John Smithson"]
+    index = TrigramIndex(labels)
+    # closest label first, the longer near-match second
+    assert index.search("Jon Smith") == [1, 4]
+    assert index.search("Jon Smith", limit=1) == [1]
+    assert index.search("carol remecon") == [2]
+    assert index.search("zzzz") == []
+
+
+def test_option_filter_fuzzy_mode():
+    f = OptionFilter(["Norway", "Sweden", "Denmark"], fuzzy=True, fuzzy_limit=1)
+    assert f.filter("Swedn") == [1]
+    f.set_fuzzy(False)
+    assert f.filter("Swedn") == []
+
+
+def test_option_filter_builds_trigram_index_on_first_fuzzy_query():
+    import threading
+
+    f = OptionFilter([f"Customer {i:05d}" for i in range(2000)], fuzzy=True)
+    # setting labels (the GUI thread's part) does not build the index
+    assert f._trigrams is None
+    results = []
+    worker = threading.Thread(target=lambda: results.append(f.filter("Custmer 01234")))
+    worker.start()
+    worker.join()
+    assert results[0][0] == 1234
+    index = f._trigrams
+    assert index is not None
+    f.filter("customer 00042")
+    assert f._trigrams is index
+    f.set_labels(["a"])
+    assert f._trigrams is None
+
+
+def test_overlapping_fuzzy_queries_build_the_index_once(monkeypatch):
+    import threading
+    import time
+
+    from bfs_component.ui import filtering
+
+    builds = []
+
+    class CountingIndex(filtering.TrigramIndex):
+        def __init__(self, labels, *args, **kwargs):
+            builds.append(labels)
+            time.sleep(0.2)
+            super().__init__(labels, *args, **kwargs)
+
+    monkeypatch.setattr(filtering, "TrigramIndex", CountingIndex)
+    f = OptionFilter([f"Customer {i:05d}" for i in range(2000)], fuzzy=True)
+    results = []
+    workers = [threading.Thread(target=lambda q=q: results.append(f.filter(q)))
+               for q in ("Custmer 01234", "Customer 0042", "Cstomer 01999")]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert len(builds) == 1
+    # built from the filter's casefolded labels, not a second copy
+    assert builds[0] is f._labels
+    assert all(results)
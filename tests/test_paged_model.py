@@ -0,0 +1,129 @@
+import asyncio
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+
+class _Table:
+    """Stand-in for a database table queried with LIKE / OFFSET / LIMIT."""
+    def __init__(self, size):
+        self.rows = [(i, f"Customer {i:05d}") for i in range(size)]
+        self.calls = []
+
+    def fetch(self, query, offset, limit):
+        self.calls.append((query, offset, limit))
+        q = query.casefold()
+        matches = [r for r in self.rows if q in r[1].casefold()]
+        return matches[offset:offset + limit]
+
+
+def _wait_until(app, predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_paged_model_fetches_pages_on_demand():
+    from bfs_component.ui.models import PagedOptionModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    table = _Table(250)
+    model = PagedOptionModel(table, page_size=100)
+    assert model.rowCount() == 0 and table.calls == []
+
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 100
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 250
+    assert not model.canFetchMore()  # the short last page ends paging
+    assert model.option(249) == (249, "Customer 00249")
+    assert table.calls == [("", 0, 100), ("", 100, 100), ("", 200, 100)]
+
+
+def test_paged_model_query_and_page_cache():
+    from bfs_component.ui.models import PagedOptionModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    table = _Table(1000)
+    model = PagedOptionModel(table.fetch, page_size=20)
+    model.set_query("customer 0001")
+    assert model.rowCount() == 10
+    model.set_query("")
+    model.set_query("customer 0001")
+    assert model.rowCount() == 10
+    # the repeated query was served from the page cache
+    assert table.calls.count(("customer 0001", 0, 20)) == 1
+
+    model.invalidate()
+    assert table.calls.count(("customer 0001", 0, 20)) == 2
+
+
+def test_paged_model_async_provider_drops_stale_pages():
+    from bfs_component.ui.models import PagedOptionModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    table = _Table(500)
+
+    async def fetch(query, offset, limit):
+        await asyncio.sleep(0.05 if query == "slow" else 0)
+        return table.fetch(query, offset, limit)
+
+    model = PagedOptionModel(fetch, page_size=50)
+    model.set_query("slow")
+    assert model.is_loading() and model.rowCount() == 0
+    model.set_query("customer 0004")
+    assert _wait_until(app, lambda: model.rowCount() == 10)
+    time.sleep(0.1)
+    app.processEvents()
+    # the late page for "slow" never replaced the current results
+    assert model.query() == "customer 0004"
+    assert model.rowCount() == 10
+
+
+def test_paged_model_reports_provider_errors():
+    from bfs_component.ui.models import PagedOptionModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    def fetch(query, offset, limit):
+        raise IOError("database is locked")
+
+    model = PagedOptionModel(fetch)
+    errors = []
+    model.fetch_failed.connect(errors.append)
+    model.fetchMore()
+    assert errors == ["database is locked"]
+    assert not model.canFetchMore()
+
+
+def test_paged_model_runs_async_pages_on_a_given_loop():
+    import threading
+
+    from bfs_component.ui.models import PagedOptionModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    table = _Table(500)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    loops = []
+
+    async def fetch(query, offset, limit):
+        # e.g. a client session bound to `loop`
+        loops.append(asyncio.get_running_loop())
+        return table.fetch(query, offset, limit)
+
+    try:
+        model = PagedOptionModel(fetch, page_size=50, loop=loop)
+        model.set_query("customer 0004")
+        assert _wait_until(app, lambda: model.rowCount() == 10)
+        assert loops == [loop]
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
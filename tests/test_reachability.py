@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from bfs_component import bfs_iter, bfs_traverse
+from bfs_component.graph_io import CSRGraph
+from bfs_component.reachability import ReachabilityIndex
+
+
+def _random_graph(n=120, m=220, seed=3):
+    rng = random.Random(seed)
+    g = {v: [] for v in range(n)}
+    for _ in range(m):
+        g[rng.randrange(n)].append(rng.randrange(n))
+    return g
+
+
+def test_reachability_matches_bfs():
+    g = _random_graph()
+    index = ReachabilityIndex(g)
+    for a in g:
+        reached = set(bfs_traverse(g, a))
+        for b in g:
+            assert index.reachable(a, b) == (b in reached)
+
+
+def test_distances_match_bfs():
+    g = _random_graph(seed=11)
+    index = ReachabilityIndex(g, with_distances=True)
+    for a in g:
+        dist = {n: d for n, d, _ in bfs_iter(g, [a])}
+        for b in g:
+            assert index.distance(a, b) == dist.get(b)
+            assert index.reachable(a, b) == (b in dist)
+
+
+def test_labels_and_rebuild():
+    g = {"A": ["B"], "B": ["C"], "C": ["A"], "D": ["A"]}
+    index = ReachabilityIndex(g)
+    assert index.reachable("D", "C")
+    assert not index.reachable("A", "D")
+    assert not index.reachable("A", "missing")
+    stats = index.stats()
+    assert stats["nodes"] == 4 and stats["components"] == 2
+    assert "SCCs" in index.report()
+    with pytest.raises(RuntimeError):
+        index.distance("A", "B")
+
+    g["C"].append("D")
+    index.rebuild()
+    assert index.reachable("A", "D")
+    assert index.stats()["components"] == 1
+
+
+def test_csr_graph_input():
+    csr = CSRGraph.from_edges([(0, 1), (1, 2), (3, 0)], num_nodes=5)
+    index = ReachabilityIndex(csr, with_distances=True)
+    assert index.distance(3, 2) == 3
+    assert index.distance(2, 3) is None
+    assert not index.reachable(4, 0)
@@ -23,3 +23,219 @@ def test_searchable_select_filters_and_selects():
 
     assert len(collected) == 1
     assert collected[0] == "Norway"
+
+
+def test_searchable_select_filters_model_rows():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    opts = [("no", "Norway"), ("se", "Sweden"), ("dk", "Denmark")]
+    s = SearchableSelect(opts)
+    model = s._popup.model()
+    assert model.rowCount() == 3
+
+    s._input.setText("EN")
+    assert model.rowCount() == 2
+    assert [model.option(r)[1] for r in range(model.rowCount())] == ["Sweden", "Denmark"]
+
+    collected = []
+    s.selection_changed.connect(collected.append)
+    s._on_index_clicked(model.index(1))
+    assert collected == ["dk"]
+    assert s.current_value() == "dk"
+    assert s._input.text() == "Denmark"
+
+    s._input.setText("")
+    assert model.rowCount() == 3
+    assert s.set_current_value("no") is True
+    assert s.get_current_value() == "no"
+    assert s.set_current_value("xx") is False
+
+
+def test_searchable_select_large_option_list():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    s = SearchableSelect([f"Customer {i:05d}" for i in range(20000)], background_threshold=50000)
+    s._input.setText("customer 1999")
+    assert s._popup.model().rowCount() == 10
+
+
+def test_searchable_select_set_options():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    s = SearchableSelect(["Norway", "Sweden"])
+    s._input.setText("de")
+    assert s._popup.model().rowCount() == 1
+    s.set_options([("dk", "Denmark"), ("de", "Germany")])
+    # the current query is re-applied to the new options
+    assert s._popup.model().rowCount() == 1
+    assert s._popup.model().option(0) == ("dk", "Denmark")
+
+
+def _wait_until(app, predicate, timeout=5.0):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_searchable_select_background_filter_drops_stale_results():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    s = SearchableSelect([f"Customer {i:05d}" for i in range(5000)], filter_delay_ms=5, background_threshold=0)
+    model = s._popup.model()
+    # type quickly; earlier queries are debounced or dropped as stale
+    for text in ("c", "cu", "customer 0", "customer 0123"):
+        s._input.setText(text)
+    assert model.rowCount() == 5000  # nothing applied synchronously
+    assert _wait_until(app, lambda: model.rowCount() == 10)
+    assert model.option(0)[1] == "Customer 01230"
+
+    # a result tagged with an older generation is ignored
+    s._on_filter_finished(s._filter_generation - 1, [0])
+    assert model.rowCount() == 10
+
+    # a scan still running over the old options must not reach the new ones
+    s._input.setText("customer 4")
+    generation = s._filter_generation
+    s.set_options(["a", "b"])
+    assert not s._filter_timer.isActive()
+    s._on_filter_finished(generation, list(range(1000)))
+    assert s._popup.model().rowCount() <= 2
+
+
+def test_searchable_select_fuzzy_mode():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    s = SearchableSelect(["Norway", "Sweden", "Denmark", "Finland"])
+    s._input.setText("Swedn")
+    assert s._popup.model().rowCount() == 0
+    s.set_fuzzy(True)
+    assert s._popup.model().option(0)[1] == "Sweden"
+
+
+def test_searchable_select_with_provider():
+    from bfs_component.ui.components import SearchableSelect
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    calls = []
+
+    def fetch(query, offset, limit):
+        calls.append((query, offset))
+        labels = [f"Customer {i:05d}" for i in range(1000) if query.casefold() in f"customer {i:05d}"]
+        return [(i, lbl) for i, lbl in enumerate(labels)][offset:offset + limit]
+
+    s = SearchableSelect(provider=fetch, page_size=50, filter_delay_ms=0)
+    assert calls == []  # nothing is loaded until the popup opens
+    s.toggle_popup()
+    model = s._popup.model()
+    assert model.rowCount() == 50
+    assert calls == [("", 0)]
+
+    s._input.setText("customer 0012")
+    assert model.rowCount() == 10
+    collected = []
+    s.selection_changed.connect(collected.append)
+    s._on_index_clicked(model.index(3))
+    assert collected == [3]
+    assert s.current_value() == 3
+    assert s._input.text() == "Customer 00123"
+
+
+def test_styled_combobox_with_provider():
+    from bfs_component.ui.components import StyledComboBox
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rows = [(f"id{i}", f"Item {i:04d}") for i in range(5000)]
+    calls = []
+
+    def fetch(query, offset, limit):
+        calls.append((query, offset))
+        matches = [r for r in rows if query.casefold() in r[1].casefold()]
+        return matches[offset:offset + limit]
+
+    c = StyledComboBox(provider=fetch, page_size=100)
+    # only the first page is loaded up front; the completer waits for a query
+    assert calls == [("", 0)]
+    assert c._combobox.count() == 100
+    assert c._completion_model.rowCount() == 0
+
+    calls.clear()
+    c._completion_model.set_query("item 4999")
+    assert calls == [("item 4999", 0)]
+    assert c._completion_model.option(0) == ("id4999", "Item 4999")
+
+    c.set_items(["a", "b"])
+    assert c._combobox.count() == 2
+    assert c.set_current_value("b") is True
+
+    # swapping providers reuses the one debounce timer
+    from PySide6.QtCore import QTimer, Qt
+
+    timer = c._query_timer
+    for _ in range(3):
+        c.set_provider(fetch)
+    assert c._query_timer is timer
+    assert len(c.findChildren(QTimer, options=Qt.FindDirectChildrenOnly)) == 1
+
+
+def test_styled_combobox_set_items_is_one_reset():
+    from bfs_component.ui.components import StyledComboBox
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    c = StyledComboBox(["x"])
+    model = c._combobox.model()
+    # the completer completes over the combobox's own model
+    assert c._completer.model() is model
+
+    events = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsInserted.connect(lambda *a: events.append("insert"))
+    c.set_items([(i, f"Item {i:05d}") for i in range(50000)])
+    assert events == ["reset"]
+    assert c._combobox.count() == 50000
+    assert c._combobox.itemData(123) == 123
+    assert c._combobox.currentText() == "Item 00000"
+
+
+def test_set_current_value_uses_value_index():
+    from bfs_component.ui.components import SearchableSelect, StyledComboBox
+    from bfs_component.ui.models import OptionListModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = OptionListModel([("a", "A"), ("b", "B"), ("a", "A again"), (["x"], "unhashable")])
+    assert model.row_for_value("a") == 0  # first match wins, like a scan
+    assert model.row_for_value(["x"]) == 3
+    assert model.row_for_value("zz") is None
+    model.set_options([("c", "C")])
+    assert model.row_for_value("c") == 0
+    assert model.row_for_value("a") is None
+
+    s = SearchableSelect([(i, f"Customer {i:05d}") for i in range(20000)], background_threshold=50000)
+    s._input.setText("customer 0001")
+    assert s._popup.model().rowCount() == 10
+    # values hidden by the current filter can still be selected
+    assert s.set_current_value(15000) is True
+    assert s.current_value() == 15000
+    assert s._input.text() == "Customer 15000"
+
+    # setting the label is not a query: no filter pass over the options runs
+    passes = []
+    original = s._filter.filter
+    s._filter.filter = lambda query: passes.append(query) or original(query)
+    assert s.set_current_value(123) is True
+    assert s._input.text() == "Customer 00123"
+    assert passes == []
+    assert not s._popup.isVisible()
+
+    c = StyledComboBox([(i, f"Item {i}") for i in range(1000)])
+    assert c.set_current_value(777) is True
+    assert c.current_value() == 777
+    assert c.set_current_value(5000) is False
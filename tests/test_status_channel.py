@@ -0,0 +1,86 @@
+import sys
+import threading
+
+import pytest
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QStatusBar
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def _channel(max_rate=10):
+    from bfs_component.ui.status import StatusChannel
+
+    bar = QStatusBar()
+    channel = StatusChannel(bar, max_rate=max_rate)
+    shown = []
+    channel.message_changed.connect(shown.append)
+    return bar, channel, shown
+
+
+def test_posts_are_coalesced_to_the_rate_limit(qapp):
+    bar, channel, shown = _channel(max_rate=10)
+    for i in range(50):
+        channel.post(f"step {i}")
+    # the first post is shown right away, the rest wait for the next slot
+    assert shown == ["step 0"]
+    QTest.qWait(150)
+    assert shown == ["step 0", "step 49"]
+    assert bar.currentMessage() == "step 49"
+
+
+def test_worker_threads_can_post(qapp):
+    bar, channel, shown = _channel(max_rate=20)
+
+    def work():
+        for i in range(2000):
+            channel.post(f"visited {i}")
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    QTest.qWait(120)
+    assert channel.current_message() == "visited 1999"
+    assert bar.currentMessage() == "visited 1999"
+    assert len(shown) <= 3
+
+
+def test_priority_and_sticky_messages(qapp):
+    bar, channel, shown = _channel(max_rate=1000)
+    channel.set_sticky("Ready")
+    assert channel.current_message() == "Ready"
+
+    channel.post("Export failed", timeout=60, priority=10)
+    QTest.qWait(5)
+    channel.post("progress 1")
+    QTest.qWait(5)
+    # lower priority messages wait until the important one expires
+    assert channel.current_message() == "Export failed"
+    QTest.qWait(120)
+    assert channel.current_message() == "progress 1"
+
+    channel.clear()
+    QTest.qWait(5)
+    assert bar.currentMessage() == "Ready"
+    channel.post("saved", timeout=20)
+    QTest.qWait(80)
+    assert channel.current_message() == "Ready"
+
+
+def test_mainwindow_status_uses_channel(qapp):
+    from bfs_component.ui.main_window import MainWindow
+
+    win = MainWindow()
+    win.set_status_message("Loading...")
+    assert win.status_channel().current_message() == "Loading..."
+    assert win._status_bar.currentMessage() == "Loading..."
+    win.set_status_message("Done", timeout=10)
+    win.status_channel().flush()
+    assert win._status_bar.currentMessage() == "Done"
+    QTest.qWait(60)
+    assert win._status_bar.currentMessage() == ""
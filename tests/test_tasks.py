@@ -0,0 +1,176 @@
+import sys
+import threading
+
+import pytest
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def _wait_for(predicate, timeout=5000):
+    for _ in range(timeout // 10):
+        if predicate():
+            return True
+        QTest.qWait(10)
+    return predicate()
+
+
+def _wait_done(handle, timeout=5000):
+    assert _wait_for(handle.is_done, timeout)
+
+
+def test_run_task_delivers_result_and_status(qapp):
+    from bfs_component.components import bfs_traverse
+    from bfs_component.ui.main_window import MainWindow
+
+    win = MainWindow()
+    results = []
+    handle = win.run_task(bfs_traverse, {"A": ["B", "C"], "B": ["D"]}, "A")
+    handle.finished.connect(results.append)
+    _wait_done(handle)
+    assert results == [["A", "B", "C", "D"]]
+    assert handle.state() == "finished"
+    win.status_channel().flush()
+    assert win._status_bar.currentMessage() == "bfs_traverse done"
+    win.close()
+
+
+def test_progress_and_cooperative_cancel(qapp):
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner()
+    reports = []
+    reported = threading.Event()
+
+    def count(task):
+        i = 0
+        while True:
+            task.check_cancelled()
+            task.progress(i, 0, "counting")
+            if i == 10:
+                reported.set()
+            i += 1
+
+    handle = runner.submit(count, name="Counting")
+    handle.progress.connect(lambda done, total, message: reports.append((done, message)))
+    assert reported.wait(5)
+    assert _wait_for(lambda: reports, 5000)
+    handle.cancel()
+    _wait_done(handle)
+    assert handle.state() == "cancelled"
+    assert reports[0] == (0, "counting")
+    # progress reports are throttled, not one signal per call
+    assert len(reports) < 20
+
+
+def test_errors_are_reported_on_the_gui_thread(qapp):
+    from bfs_component.ui.main_window import MainWindow
+
+    win = MainWindow()
+    errors = []
+
+    def broken():
+        raise ValueError("bad graph")
+
+    handle = win.run_task(broken, name="Export")
+    handle.failed.connect(errors.append)
+    _wait_done(handle)
+    assert isinstance(errors[0], ValueError)
+    assert handle.error() is errors[0]
+    win.status_channel().flush()
+    assert win._status_bar.currentMessage() == "Export failed: bad graph"
+    win.close()
+
+
+def test_concurrency_limit_and_queued_cancel(qapp):
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner(max_concurrent=1)
+    release = threading.Event()
+    first = runner.submit(release.wait, 5)
+    _wait_for(lambda: first.state() == "running", 2000)
+    second = runner.submit(lambda: "second")
+    assert second.state() == "pending"
+    # a queued task is taken back from the pool right away
+    second.cancel()
+    assert second.state() == "cancelled"
+    third = runner.submit(lambda: "third")
+    release.set()
+    _wait_done(third)
+    assert third.result() == "third"
+    assert first.result() is True
+    assert runner.active_tasks() == []
+
+
+def test_process_tasks(qapp):
+    from bfs_component.components import bfs_traverse
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner(max_processes=1)
+    handle = runner.submit(bfs_traverse, {0: [1], 1: [2]}, 0, process=True)
+    _wait_done(handle, 30000)
+    assert handle.result() == [0, 1, 2]
+    runner.shutdown()
+
+
+def test_finished_handles_are_freed(qapp):
+    import gc
+    import weakref
+
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner(max_concurrent=2)
+    handles = [runner.submit(lambda i=i: [i] * 1000) for i in range(4)]
+    for handle in handles:
+        _wait_done(handle)
+    assert runner.wait(2000)
+    refs = [weakref.ref(handle) for handle in handles]
+    del handle, handles
+    qapp.processEvents()
+    gc.collect()
+    assert [ref for ref in refs if ref() is not None] == []
+
+
+def test_progress_beyond_32_bits(qapp):
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner()
+    reports = []
+
+    def export(task):
+        task.progress(3 * 2**40, 4 * 2**40, "bytes")
+        task.progress(4 * 2**40, 4 * 2**40, "bytes")
+
+    handle = runner.submit(export)
+    handle.progress.connect(lambda done, total, message: reports.append((done, total)))
+    _wait_done(handle)
+    assert reports[-1] == (4 * 2**40, 4 * 2**40)
+
+
+def test_queued_process_tasks_cancel_right_away(qapp):
+    import time
+
+    from bfs_component.ui.tasks import TaskRunner
+
+    runner = TaskRunner(max_processes=1)
+    started = []
+    runner.task_started.connect(started.append)
+    first = runner.submit(time.sleep, 0.5, process=True)
+    second = runner.submit(time.sleep, 0.5, process=True)
+    assert first.state() == "running"
+    # only handed to the pool once a worker process is free
+    assert second.state() == "pending"
+    assert started == [first]
+    second.cancel()
+    assert second.state() == "cancelled"
+    _wait_done(first, 30000)
+    assert first.state() == "finished"
+    assert started == [first]
+    assert runner.active_tasks() == []
+    runner.shutdown()
@@ -28,3 +28,38 @@ def test_textinput_regex_validation():
     assert not t.is_valid()
     t.set_text("name@example.com")
     assert t.is_valid()
+
+
+def test_focus_ring_pixmap_is_cached():
+    from bfs_component.ui import inputs
+
+    inputs.clear_focus_ring_cache()
+    a = inputs.focus_ring_pixmap(200, 36, 1.0)
+    assert inputs.focus_ring_pixmap(200, 36, 1.0) is a
+    # device pixel ratio and size are part of the key
+    hi = inputs.focus_ring_pixmap(200, 36, 2.0)
+    assert hi is not a and hi.width() == 400
+    assert inputs.focus_ring_pixmap(240, 36, 1.0) is not a
+    # the gradient stroke runs along the inset top edge
+    assert a.toImage().pixelColor(100, 2).alpha() > 0
+
+    inputs.clear_focus_ring_cache()
+    assert inputs.focus_ring_pixmap(200, 36, 1.0) is not a
+
+
+def test_textinput_error_state_is_painted():
+    t = TextInput("Required")
+    t.set_required(True)
+    t.resize(240, 80)
+    line = t._input
+    assert not line.error_state()
+    assert not t.validate(show_error=True)
+    assert line.error_state()
+    # no stylesheet property is involved, so nothing needs re-polishing
+    assert line.property("error") is None
+    img = line.grab().toImage()
+    edge = img.pixelColor(line.width() // 2, 0)
+    assert edge.red() > edge.green() and edge.red() > 100
+
+    t.set_text("x")  # typing clears the error
+    assert not line.error_state()
@@ -0,0 +1,129 @@
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def test_compile_stylesheet_is_cached_and_uses_tokens():
+    from bfs_component.ui import theme
+
+    qss = theme.compile_stylesheet()
+    assert theme.compile_stylesheet() is qss
+    assert qss.startswith(theme.BEGIN_MARKER) and qss.endswith(theme.END_MARKER)
+    assert 'QFrame[bfsRole="card"]' in qss
+
+    custom = {"widgets": {"card_bg": "#123456"}}
+    custom_qss = theme.compile_stylesheet(custom)
+    assert custom_qss is not qss
+    assert "background: #123456; border-radius: 8px;" in custom_qss
+    # every role compiles without missing tokens
+    assert all(theme.compile_role(role, theme.widget_tokens()) for role in theme.ROLE_RULES)
+
+
+def test_widget_tokens_come_from_the_design_theme():
+    from design_instructions.theme import THEME
+    from bfs_component.ui import tokens
+
+    assert tokens.WIDGET_TOKENS == THEME["widgets"]
+    # the fallback used without design_instructions must not drift
+    assert tokens._FALLBACK_WIDGET_TOKENS == THEME["widgets"]
+
+
+def test_apply_stylesheet_keeps_other_rules(qapp):
+    from bfs_component.ui import theme
+
+    qapp.setStyleSheet("QToolTip { color: red; }")
+    assert theme.apply_stylesheet(qapp) is True
+    assert theme.apply_stylesheet(qapp) is False  # already installed: no repolish
+    assert theme.apply_stylesheet(qapp, {"widgets": {"card_bg": "#123456"}}) is True
+    sheet = qapp.styleSheet()
+    assert sheet.count(theme.BEGIN_MARKER) == 1
+    assert "QToolTip { color: red; }" in sheet
+    assert "#123456" in sheet
+    qapp.setStyleSheet(theme.compile_stylesheet())
+
+
+def test_components_use_roles_not_own_stylesheets(qapp):
+    from bfs_component.ui.components import CompanyCard, ContactCard, TextInput
+
+    card = ContactCard("JD", "Jane Doe", "Project Manager")
+    company = CompanyCard("Acme", tags=["Technology"])
+    field = TextInput("Name")
+    for w in (card, company, field, field._input):
+        assert w.styleSheet() == ""
+    assert card.property("bfsRole") == "card"
+    assert company.property("bfsRole") == "company-card"
+    assert field._input.property("bfsRole") == "input"
+    assert 'bfsRole="card"' in qapp.styleSheet()
+
+
+def test_set_role_does_not_reread_the_app_stylesheet(qapp, monkeypatch):
+    from PySide6.QtWidgets import QFrame
+
+    from bfs_component.ui import theme
+    from bfs_component.ui.components import ContactCard
+
+    theme.ensure_stylesheet()
+
+    class NoApp:
+        @staticmethod
+        def instance():
+            raise AssertionError("set_role read the application stylesheet")
+
+    monkeypatch.setattr(theme, "QApplication", NoApp)
+    ContactCard("JD", "Jane Doe", "Project Manager")
+    # a role set on an already styled widget takes effect right away
+    frame = QFrame()
+    frame.ensurePolished()
+    theme.set_role(frame, "card")
+    assert frame.palette().window().color().name() == theme.widget_tokens()["card_bg"].lower()
+
+
+def test_theme_manager_repolishes_only_changed_roles(qapp):
+    from bfs_component.ui import inputs, theme
+    from bfs_component.ui.components import ContactCard
+
+    themes = {
+        "light": {"widgets": {"card_bg": "#FFFFFF"}},
+        "dark": {"widgets": {"card_bg": "#111827"}, "colors": {"input_focus_stops": ["#111111", "#222222", "#333333"]}},
+    }
+    manager = theme.ThemeManager(themes)
+    assert manager.current == "light"
+    # roles that look the same in both themes are not gated
+    assert manager.changed_roles("light", "dark") == {"card", "company-card"}
+    assert 'QFrame[bfsRole="card"][bfsTheme="dark"]' in manager.stylesheet()
+    assert '[bfsTheme="dark"]' not in theme.compile_role("avatar", theme.widget_tokens())
+
+    invalidated = []
+
+    def invalidate():
+        invalidated.append(True)
+
+    theme.add_cache_invalidator(invalidate)
+    before = ContactCard("JD", "Jane Doe", "Project Manager")  # adopted on install
+    manager.install(qapp)
+    try:
+        after = ContactCard("CR", "Carol", "Marketing Director")
+        assert after.property("bfsTheme") == "light"
+        assert manager.set_theme("dark") == 2
+        assert manager.set_theme("dark") == 0
+        for card in (before, after):
+            assert card.property("bfsTheme") == "dark"
+            assert card.palette().window().color().name() == "#111827"
+        assert theme.current_theme() is themes["dark"]
+        assert inputs.focus_ring_pixmap(50, 20) is not None
+        assert inputs._focus_ring_tokens[0] == ("#111111", "#222222", "#333333")
+        assert invalidated
+        with pytest.raises(KeyError):
+            manager.set_theme("sepia")
+    finally:
+        manager.uninstall(qapp)
+        theme.remove_cache_invalidator(invalidate)
+    assert invalidate not in theme._cache_invalidators
+    assert theme.current_theme() is theme.default_theme()